@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Startup-time regression check for the common CLI entry paths.
+
+Each path runs victimator-x.py under `python -X importtime`; the summed import
+time (median of several runs) must stay within the budget in
+startup_budget.json, and modules listed as forbidden must not be imported. A
+path that exits with a status other than its "returncode" (default 0) fails.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ENTRY = ROOT / "victimator-x.py"
+DEFAULT_BUDGET = Path(__file__).resolve().parent / "startup_budget.json"
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    # Lines look like "import time:  self [us] | cumulative | module" with the
+    # module name indented by nesting depth.
+    modules: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|", 2)
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def measure(args: list[str], output_root: Path, expected_returncode: int = 0) -> dict[str, int]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", str(ENTRY), "--output-root", str(output_root), *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+    if completed.returncode != expected_returncode:
+        # A path that fails (often early, before its heavy imports) must not
+        # pass the budget with a misleadingly small import time.
+        errors = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+        detail = errors[-1] if errors else "no error output"
+        raise RuntimeError(f"exit status {completed.returncode}: {detail}")
+    return parse_importtime(completed.stderr)
+
+
+def run_budget(budget: dict, runs: int) -> bool:
+    ok = True
+    with tempfile.TemporaryDirectory(prefix="vx-startup-") as temp_dir:
+        for name, spec in budget["paths"].items():
+            try:
+                samples = [measure(spec["args"], Path(temp_dir), spec.get("returncode", 0)) for _ in range(runs)]
+            except RuntimeError as error:
+                ok = False
+                print(f"[FAIL] {name:<12} {error}")
+                continue
+            total_ms = statistics.median(sum(modules.values()) for modules in samples) / 1000
+            loaded = set().union(*samples)
+            leaked = sorted(module for module in spec.get("forbidden_modules", []) if module in loaded)
+            within = total_ms <= spec["max_import_ms"]
+            status = "OK" if within and not leaked else "FAIL"
+            ok = ok and status == "OK"
+            print(f"[{status}] {name:<12} imports {total_ms:7.1f} ms (budget {spec['max_import_ms']} ms)")
+            for module in leaked:
+                print(f"       unexpected import: {module}")
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check CLI startup import time against a budget.")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET, help="Budget JSON file.")
+    parser.add_argument("--runs", type=int, help="Runs per entry path (median is compared).")
+    args = parser.parse_args(argv)
+
+    budget = json.loads(args.budget.read_text(encoding="utf-8"))
+    runs = max(1, args.runs or budget.get("runs", 5))
+    return 0 if run_budget(budget, runs) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
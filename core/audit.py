@@ -1,15 +1,23 @@
 import secrets
+import time
 from dataclasses import asdict
+from typing import TYPE_CHECKING
 
+from .compiled_profile import EMPTY_PROFILE, CompiledProfile
 from .config import COMMON_WEAK_PASSWORDS, DEFAULT_POLICY_MIN_LENGTH
+from .engine.shared import shared_object
 from .models import PasswordAssessment
 from .policy import (
+    character_classes,
+    class_violations,
     estimate_entropy_bits,
     has_repeated_chars,
     has_sequence,
-    policy_violations,
 )
 
+if TYPE_CHECKING:
+    from .profiling import CheckTimings
+
 PASS_PHRASE_WORDS = [
     "anchor",
     "planet",
@@ -26,73 +34,104 @@ PASS_PHRASE_WORDS = [
 ]
 
 
-def normalize_subject_tokens(subject_tokens: tuple[str, ...] | set[str] | list[str]) -> tuple[str, ...]:
-    normalized = {token.strip().lower() for token in subject_tokens if token and len(token.strip()) >= 3}
-    return tuple(sorted(normalized))
+def classify_score(score: int, common: bool = False) -> str:
+    if score < 45 or common:
+        return "weak"
+    if score < 75:
+        return "medium"
+    return "strong"
 
 
-def evaluate_password(
-    password: str,
-    subject_tokens: tuple[str, ...] = (),
-    policy_min_length: int = DEFAULT_POLICY_MIN_LENGTH,
-) -> PasswordAssessment:
+def _password_checks(
+    password: str, profile: CompiledProfile, timings: "CheckTimings | None" = None
+) -> tuple[tuple[int, int, int, bool], list[str], float]:
+    # The policy-independent checks behind both evaluate_password and
+    # password_features, so the two cannot score differently. Returns the
+    # features, the reasons behind their penalties and the entropy estimate.
+    # timings (used by --profile-checks) records nanoseconds spent per check;
+    # the normal path only pays the `is not None` tests.
+    mark = time.perf_counter_ns() if timings is not None else 0
     lowered = password.lower()
     reasons: list[str] = []
-    suggestions: list[str] = []
     penalties = 0
 
-    if lowered in COMMON_WEAK_PASSWORDS:
+    common = lowered in COMMON_WEAK_PASSWORDS
+    if common:
         reasons.append("Found in common weak-password list")
         penalties += 35
+    if timings is not None:
+        mark = timings.lap("common_list", mark)
 
-    for token in subject_tokens:
-        if token in lowered:
-            reasons.append("Contains personal/profile information")
-            penalties += 25
-            break
+    if profile.matches(lowered):
+        reasons.append("Contains personal/profile information")
+        penalties += 25
+    if timings is not None:
+        mark = timings.lap("tokens", mark)
 
     if has_sequence(password):
         reasons.append("Contains predictable character sequence")
         penalties += 12
+    if timings is not None:
+        mark = timings.lap("sequence", mark)
     if has_repeated_chars(password):
         reasons.append("Contains repeated character runs")
         penalties += 10
+    if timings is not None:
+        mark = timings.lap("repeats", mark)
 
     entropy = estimate_entropy_bits(password)
-    unique_classes = sum(
-        [
-            any(ch.islower() for ch in password),
-            any(ch.isupper() for ch in password),
-            any(ch.isdigit() for ch in password),
-            any(not ch.isalnum() for ch in password),
-        ]
-    )
-
-    violations = policy_violations(password, policy_min_length)
-    penalties += len(violations) * 4
-
+    classes = character_classes(password)
     score = min(len(password) * 4, 40)
-    score += unique_classes * 8
+    score += classes.bit_count() * 8
     score += min(int(entropy // 4), 24)
-    score -= penalties
-    score = max(0, min(100, score))
+    if timings is not None:
+        timings.lap("entropy", mark)
+    return (len(password), classes, score - penalties, common), reasons, entropy
+
 
-    classification = "strong"
-    if score < 45 or any("common weak-password" in reason for reason in reasons):
-        classification = "weak"
-    elif score < 75:
-        classification = "medium"
+def password_features(password: str, profile: CompiledProfile = EMPTY_PROFILE) -> tuple[int, int, int, bool]:
+    # Everything evaluate_password scores except the policy checks, so policy
+    # variants can be scored without re-running the checks:
+    # (length, character-class bitmask, score before policy penalties, common).
+    return _password_checks(password, profile)[0]
 
+
+def policy_score(features: tuple[int, int, int, bool], violations: list[str]) -> tuple[int, str]:
+    # Applies the policy penalty to password_features output; returns the
+    # final score and its classification.
+    _, _, base_score, common = features
+    score = max(0, min(100, base_score - 4 * len(violations)))
+    return score, classify_score(score, common)
+
+
+def evaluate_password(
+    password: str,
+    profile: CompiledProfile = EMPTY_PROFILE,
+    policy_min_length: int = DEFAULT_POLICY_MIN_LENGTH,
+    timings: "CheckTimings | None" = None,
+) -> PasswordAssessment:
+    features, reasons, entropy = _password_checks(password, profile, timings)
+    mark = time.perf_counter_ns() if timings is not None else 0
+    length, classes, _, _ = features
+    violations = class_violations(length, classes, policy_min_length)
+    if timings is not None:
+        mark = timings.lap("policy", mark)
+
+    score, classification = policy_score(features, violations)
+    suggestions: list[str] = []
     if "missing-symbol" in violations:
         suggestions.append("Add symbols to increase complexity")
     if "missing-digit" in violations:
         suggestions.append("Include at least one number")
-    if len(password) < policy_min_length:
+    if length < policy_min_length:
         suggestions.append(f"Increase length to at least {policy_min_length} characters")
     if any("personal/profile" in reason for reason in reasons):
         suggestions.append("Avoid names, birthdays, and obvious personal words")
     if not suggestions and classification == "strong":
         suggestions.append("Looks strong; rotate it regularly and keep it unique")
+    if timings is not None:
+        timings.lap("scoring", mark)
+        timings.calls += 1
 
     return PasswordAssessment(
         password=password,
@@ -105,14 +144,20 @@ def evaluate_password(
     )
 
 
-def evaluate_password_worker(item: str, subject_tokens: tuple[str, ...], policy_min_length: int):
+def evaluate_password_worker(item: str, profile_key: str, policy_min_length: int):
+    # The compiled profile is installed in each worker once by the engine
+    # (EngineCoordinator(shared=...)); tasks only carry its fingerprint.
     return evaluate_password(
         password=item,
-        subject_tokens=subject_tokens,
+        profile=shared_object(profile_key),
         policy_min_length=policy_min_length,
     )
 
 
+def password_features_worker(item: str, profile_key: str) -> tuple[int, int, int, bool]:
+    return password_features(item, shared_object(profile_key))
+
+
 def generate_passphrase_suggestions(count: int = 5) -> list[str]:
     suggestions: list[str] = []
     symbols = ["-", "_", ".", "!", "@", "#"]
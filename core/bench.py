@@ -0,0 +1,270 @@
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .config import COMMON_WEAK_PASSWORDS, DEFAULT_MAX_LENGTH, DEFAULT_MIN_LENGTH, DEFAULT_POLICY_MIN_LENGTH
+from .models import SubjectProfile
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+BENCH_SEED = 1337
+BENCH_SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_BENCH_SIZES = ("1k", "100k")
+BENCH_ENGINES = ("async", "threading", "parallel", "hybrid")
+DEFAULT_TOLERANCES = {"default": 0.25, "peak_rss_mb": 0.5, "worker_peak_rss_mb": 0.5}
+LOWER_IS_BETTER = ("peak_rss_mb", "worker_peak_rss_mb")
+BENCH_REPEAT_ITEMS = 200_000
+SEED_WORDS = ("falcon", "harbor", "summer", "winter", "dragon", "monkey", "shadow", "sunset", "galaxy", "maple")
+
+
+def synthetic_profile(size: int, seed: int = BENCH_SEED) -> SubjectProfile:
+    # Keyword count scales with size so generation can actually reach the
+    # requested number of candidates.
+    rng = random.Random(seed)
+
+    def word() -> str:
+        return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+
+    return SubjectProfile(
+        name=f"{word().capitalize()} {word().capitalize()}",
+        aliases=[word() for _ in range(3)],
+        keywords=[word() for _ in range(max(5, size // 40))],
+        favorite_numbers=[str(rng.randint(1, 99)) for _ in range(3)],
+        birth_year=rng.randint(1960, 2005),
+        organization=word().capitalize(),
+    )
+
+
+def synthetic_corpus(size: int, tokens: tuple[str, ...], seed: int = BENCH_SEED) -> list[str]:
+    # A fixed mix of the shapes audits see: common and dictionary words with
+    # digits, subject tokens with years, keyboard sequences and random strings.
+    rng = random.Random(seed)
+    common = sorted(COMMON_WEAK_PASSWORDS)
+    words = list(tokens or SEED_WORDS) + list(SEED_WORDS)
+    alphabet = string.ascii_letters + string.digits + "!@#$%&*?-_"
+    corpus: list[str] = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < 0.15:
+            corpus.append(rng.choice(common))
+        elif roll < 0.45:
+            corpus.append(f"{rng.choice(words).capitalize()}{rng.randint(0, 9999)}{rng.choice('!@#')}")
+        elif roll < 0.6:
+            corpus.append(f"{rng.choice(words)}{rng.randint(1960, 2025)}")
+        elif roll < 0.7:
+            start = rng.randint(0, 20)
+            corpus.append(string.ascii_lowercase[start : start + 5] + "12345"[: rng.randint(2, 5)])
+        else:
+            corpus.append("".join(rng.choice(alphabet) for _ in range(rng.randint(8, 24))))
+    return corpus
+
+
+def _peak_rss_mb(children: bool = False) -> float | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss / scale, 1)
+
+
+def _timed(func: Callable, repeats: int = 1) -> tuple[float, object]:
+    # Best of several runs, so short cases are not dominated by one-off noise.
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _repeats(size: int) -> int:
+    return max(1, min(5, BENCH_REPEAT_ITEMS // size))
+
+
+def run_case(case: str, size: int, workers: int, seed: int = BENCH_SEED) -> dict:
+    # Runs inside a fresh interpreter (see _run_isolated), so peak memory and
+    # warm caches belong to this case alone.
+    from .audit import evaluate_password, evaluate_password_worker
+    from .compiled_profile import compile_profile
+    from .generator import generate_candidate_blocklist
+
+    profile = compile_profile(synthetic_profile(size, seed))
+    repeats = _repeats(size)
+    if case == "generation":
+        elapsed, candidates = _timed(
+            lambda: generate_candidate_blocklist(profile, DEFAULT_MIN_LENGTH, DEFAULT_MAX_LENGTH, size),
+            repeats,
+        )
+        return {
+            "candidates": len(candidates),
+            "candidates_per_second": round(len(candidates) / elapsed, 1),
+            "peak_rss_mb": _peak_rss_mb(),
+        }
+
+    corpus = synthetic_corpus(size, profile.tokens, seed)
+    if case == "scoring":
+        elapsed, _ = _timed(
+            lambda: [evaluate_password(item, profile, DEFAULT_POLICY_MIN_LENGTH) for item in corpus],
+            repeats,
+        )
+        return {"passwords_per_second": round(size / elapsed, 1), "peak_rss_mb": _peak_rss_mb()}
+
+    if case.startswith("engine:"):
+        from functools import partial
+
+        from .engine import EngineCoordinator
+
+        mode = case.split(":", 1)[1]
+        engine = EngineCoordinator(mode=mode, workers=workers, shared=(profile,))
+        worker = partial(
+            evaluate_password_worker, profile_key=profile.fingerprint, policy_min_length=DEFAULT_POLICY_MIN_LENGTH
+        )
+        try:
+            elapsed, completed = _timed(lambda: sum(1 for _ in engine.imap(worker, corpus)), repeats)
+        finally:
+            engine.close()
+        metrics = {"items_per_second": round(completed / elapsed, 1), "peak_rss_mb": _peak_rss_mb()}
+        if mode in ("parallel", "hybrid"):
+            metrics["worker_peak_rss_mb"] = _peak_rss_mb(children=True)
+        return metrics
+    raise ValueError(f"Unknown benchmark case: {case}")
+
+
+def _run_isolated(case: str, size: int, workers: int, seed: int) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "core.bench", case, str(size), str(workers), str(seed)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+    if completed.returncode != 0:
+        detail = completed.stderr.strip().splitlines()[-1:] or ["no output"]
+        raise RuntimeError(f"benchmark case {case} failed: {detail[0]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def environment() -> dict:
+    from .engine.runtime import FREE_THREADED
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(terse=True),
+        "cpu_count": os.cpu_count(),
+        "free_threaded": FREE_THREADED,
+    }
+
+
+def run_benchmarks(
+    sizes: tuple[str, ...] = DEFAULT_BENCH_SIZES,
+    engines: tuple[str, ...] = BENCH_ENGINES,
+    workers: int = 2,
+    seed: int = BENCH_SEED,
+    on_result: Callable[[str, dict], None] | None = None,
+) -> dict:
+    cases = ["generation", "scoring", *(f"engine:{mode}" for mode in engines)]
+    results: dict[str, dict] = {}
+    for label in sizes:
+        for case in cases:
+            key = f"{case}/{label}"
+            results[key] = _run_isolated(case, BENCH_SIZES[label], workers, seed)
+            if on_result:
+                on_result(key, results[key])
+    return {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "seed": seed,
+        "workers": workers,
+        "environment": environment(),
+        "results": results,
+    }
+
+
+@dataclass
+class Comparison:
+    key: str
+    metric: str
+    value: float
+    baseline: float | None
+    tolerance: float
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline:
+            return None
+        return (self.value - self.baseline) / self.baseline
+
+    @property
+    def regressed(self) -> bool:
+        change = self.change
+        if change is None:
+            return False
+        if self.metric in LOWER_IS_BETTER:
+            return change > self.tolerance
+        return change < -self.tolerance
+
+
+def tolerance_for(tolerances: dict, key: str, metric: str) -> float:
+    # Most specific wins: "engine:parallel/100k", then "engine:parallel",
+    # then the metric name, then "default".
+    case = key.split("/", 1)[0]
+    for name in (f"{key}/{metric}", key, case, metric):
+        if name in tolerances:
+            return tolerances[name]
+    return tolerances.get("default", DEFAULT_TOLERANCES["default"])
+
+
+def compare(run: dict, baseline: dict | None, default_tolerance: float | None = None) -> list[Comparison]:
+    tolerances = dict(DEFAULT_TOLERANCES)
+    tolerances.update((baseline or {}).get("tolerances", {}))
+    if default_tolerance is not None:
+        tolerances["default"] = default_tolerance
+    previous = (baseline or {}).get("results", {})
+    comparisons = []
+    for key, metrics in run["results"].items():
+        for metric, value in metrics.items():
+            if value is None or metric == "candidates":
+                continue
+            comparisons.append(
+                Comparison(
+                    key=key,
+                    metric=metric,
+                    value=value,
+                    baseline=previous.get(key, {}).get(metric),
+                    tolerance=tolerance_for(tolerances, key, metric),
+                )
+            )
+    return comparisons
+
+
+def load_baseline(path: Path) -> dict | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(path: Path, run: dict, previous: dict | None = None) -> Path:
+    # Results for sizes that were not re-run are kept, as are the tolerances.
+    payload = dict(run)
+    payload["tolerances"] = (previous or {}).get("tolerances", DEFAULT_TOLERANCES)
+    payload["results"] = {**(previous or {}).get("results", {}), **run["results"]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+if __name__ == "__main__":
+    case_name, case_size, case_workers, case_seed = sys.argv[1:5]
+    print(json.dumps(run_case(case_name, int(case_size), int(case_workers), int(case_seed))))
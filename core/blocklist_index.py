@@ -0,0 +1,199 @@
+import bisect
+import heapq
+import json
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import groupby
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: concurrent writers are not serialized.
+    fcntl = None
+
+BLOCKLIST_INDEX_DIR = "blocklist-index"
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = ".lock"
+SPARSE_INTERVAL = 64
+MERGE_FANOUT = 4
+
+
+def _parse_entry(line: bytes) -> tuple[str, list[int]]:
+    password, postings = line.rstrip(b"\n").split(b"\t", 1)
+    return password.decode("utf-8"), [int(value) for value in postings.split(b",")]
+
+
+class BlocklistIndex:
+    # Organization-wide blocklist kept as an LSM tree of immutable sorted
+    # segment files. Each line is "password<TAB>subject ids"; the manifest maps
+    # subject slugs to small integer ids. Adding a subject's run writes one new
+    # segment sorted in memory, so it costs time proportional to that run.
+    # Segments are merged in tiers of MERGE_FANOUT, which keeps the number of
+    # segments logarithmic in the index size.
+    #
+    # Re-running a subject does not rewrite old segments. Every segment carries
+    # the sequence number of the newest run it contains, and a posting is live
+    # only while its subject's latest run is not newer than the segment. Stale
+    # postings are skipped on lookup and dropped when segments are merged.
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.manifest_path = root / MANIFEST_NAME
+        self.manifest = self._read_manifest()
+        self._sparse: dict[str, tuple[list[str], list[int]]] = {}
+
+    def _read_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {"next_seq": 1, "subjects": {}, "segments": []}
+        return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def _write_manifest(self):
+        temp_path = self.manifest_path.with_name(f"{self.manifest_path.name}.tmp")
+        temp_path.write_text(json.dumps(self.manifest, indent=2), encoding="utf-8")
+        os.replace(temp_path, self.manifest_path)
+
+    @contextmanager
+    def _locked(self):
+        # Serializes writers (concurrent runs finishing at once); the manifest
+        # is re-read under the lock so no writer works from a stale copy.
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / LOCK_NAME, "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            self.manifest = self._read_manifest()
+            yield
+
+    @property
+    def subjects(self) -> dict[str, dict]:
+        return self.manifest["subjects"]
+
+    def _live_seqs(self) -> dict[int, int]:
+        return {subject["id"]: subject["seq"] for subject in self.subjects.values()}
+
+    def _write_segment(self, seq: int, level: int, entries: Iterable[tuple[str, list[int]]]) -> dict | None:
+        name = f"segment-{seq:08d}-{level}.tsv"
+        path = self.root / name
+        sparse: list[tuple[str, int]] = []
+        count = offset = 0
+        with path.open("wb") as handle:
+            for password, postings in entries:
+                if count % SPARSE_INTERVAL == 0:
+                    sparse.append((password, offset))
+                line = f"{password}\t{','.join(map(str, postings))}\n".encode("utf-8")
+                handle.write(line)
+                offset += len(line)
+                count += 1
+        if not count:
+            path.unlink()
+            return None
+        path.with_suffix(".idx").write_text(json.dumps(sparse), encoding="utf-8")
+        return {"file": name, "seq": seq, "level": level, "entries": count, "bytes": offset}
+
+    def add_subject(self, slug: str, passwords: Iterable[str]) -> int:
+        # Replaces the subject's entries with this run's (lowercased, as the
+        # daemon matches them case-insensitively). Returns the number added.
+        words = sorted({word for word in (value.strip().lower() for value in passwords) if word and "\t" not in word})
+        with self._locked():
+            subject = self.subjects.get(slug)
+            if subject:
+                subject_id = subject["id"]
+            else:
+                subject_id = 1 + max((item["id"] for item in self.subjects.values()), default=0)
+            seq = self.manifest["next_seq"]
+            segment = self._write_segment(seq, 0, ((word, [subject_id]) for word in words))
+            self.manifest["next_seq"] = seq + 1
+            self.subjects[slug] = {"id": subject_id, "seq": seq, "entries": len(words)}
+            if segment:
+                self.manifest["segments"].append(segment)
+            self._write_manifest()
+            self._compact()
+        return len(words)
+
+    def _iter_segment(self, segment: dict) -> Iterator[tuple[str, int, list[int]]]:
+        with (self.root / segment["file"]).open("rb") as handle:
+            for line in handle:
+                password, postings = _parse_entry(line)
+                yield password, segment["seq"], postings
+
+    def _merged(self, segments: list[dict]) -> Iterator[tuple[str, list[int]]]:
+        live = self._live_seqs()
+        streams = [self._iter_segment(segment) for segment in segments]
+        for password, group in groupby(heapq.merge(*streams), key=lambda item: item[0]):
+            postings = sorted(
+                {subject_id for _, seq, ids in group for subject_id in ids if live.get(subject_id, 0) <= seq}
+            )
+            if postings:
+                yield password, postings
+
+    def _compact(self):
+        while True:
+            levels: dict[int, list[dict]] = {}
+            for segment in self.manifest["segments"]:
+                levels.setdefault(segment["level"], []).append(segment)
+            full = next((level for level in sorted(levels) if len(levels[level]) >= MERGE_FANOUT), None)
+            if full is None:
+                return
+            inputs = levels[full]
+            merged = self._write_segment(max(item["seq"] for item in inputs), full + 1, self._merged(inputs))
+            self.manifest["segments"] = [item for item in self.manifest["segments"] if item not in inputs]
+            if merged:
+                self.manifest["segments"].append(merged)
+            self._write_manifest()
+            # Old segments go only after the manifest no longer lists them.
+            for item in inputs:
+                for path in (self.root / item["file"], (self.root / item["file"]).with_suffix(".idx")):
+                    path.unlink(missing_ok=True)
+            self._sparse.clear()
+
+    def _sparse_index(self, segment: dict) -> tuple[list[str], list[int]]:
+        index = self._sparse.get(segment["file"])
+        if index is None:
+            pairs = json.loads((self.root / segment["file"]).with_suffix(".idx").read_text(encoding="utf-8"))
+            index = self._sparse[segment["file"]] = ([key for key, _ in pairs], [offset for _, offset in pairs])
+        return index
+
+    def lookup(self, passwords: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+        # Yields each password with the slugs of the subjects whose blocklist
+        # contains it (empty when none). Each segment costs one binary search
+        # in its sparse index plus a read of at most SPARSE_INTERVAL lines.
+        live = self._live_seqs()
+        slugs = {subject["id"]: slug for slug, subject in self.subjects.items()}
+        segments = self.manifest["segments"]
+        handles = [(self.root / segment["file"]).open("rb") for segment in segments]
+        try:
+            for password in passwords:
+                key = password.strip().lower()
+                encoded = key.encode("utf-8")
+                found: set[int] = set()
+                for segment, handle in zip(segments, handles):
+                    keys, offsets = self._sparse_index(segment)
+                    position = bisect.bisect_right(keys, key) - 1
+                    if position < 0:
+                        continue
+                    # UTF-8 byte order matches str order, so lines are compared
+                    # as bytes and only the matching entry is decoded.
+                    stop = offsets[position + 1] if position + 1 < len(offsets) else segment["bytes"]
+                    handle.seek(offsets[position])
+                    for line in handle.read(stop - offsets[position]).split(b"\n"):
+                        entry = line.split(b"\t", 1)[0]
+                        if entry >= encoded:
+                            if entry == encoded:
+                                found.update(i for i in _parse_entry(line)[1] if live.get(i, 0) <= segment["seq"])
+                            break
+                yield password, sorted(slugs[subject_id] for subject_id in found)
+        finally:
+            for handle in handles:
+                handle.close()
+
+    def export(self, path: Path) -> int:
+        # The deduplicated org-wide list, in sorted order, one entry per line.
+        count = 0
+        temp_path = path.with_name(f"{path.name}.tmp")
+        with temp_path.open("w", encoding="utf-8", newline="\n") as handle:
+            for password, _ in self._merged(self.manifest["segments"]):
+                handle.write(password + "\n")
+                count += 1
+        os.replace(temp_path, path)
+        return count
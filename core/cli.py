@@ -1,47 +1,61 @@
 import argparse
+import os
 import signal
 import sys
+import time
+from datetime import datetime, timezone
+from collections.abc import Callable, Iterable, Iterator
 from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .audit import (
-    evaluate_password_worker,
-    generate_passphrase_suggestions,
-    normalize_subject_tokens,
-)
 from .config import (
+    AUDIT_FORMATS,
     DEFAULT_ENGINE,
     DEFAULT_MAX_CANDIDATES,
     DEFAULT_MAX_LENGTH,
     DEFAULT_MIN_LENGTH,
     DEFAULT_OUTPUT_ROOT,
     DEFAULT_POLICY_MIN_LENGTH,
+    DEFAULT_SAMPLE_CONFIDENCE,
+    DEFAULT_SAMPLE_PRECISION,
+    DEFAULT_WHAT_IF_POLICIES,
     DEFAULT_WORKERS,
+    ENGINE_MODES,
+    load_host_defaults,
 )
-from .engine import EngineCoordinator
-from .generator import generate_candidate_blocklist
-from .healthcheck import run_self_check
-from .logging_setup import setup_logger
-from .metadata import APP_NAME, ETHICAL_NOTICE, VERSION
-from .models import RunSummary, SubjectProfile
-from .nano_ai import answer_nano_ai_question, build_nano_ai_guidance
-from .reporting import (
-    output_paths,
-    write_password_audit,
-    write_quick_report,
-    write_run_summary,
-    write_wordlists,
+from .engine.defaults import (
+    AUTHKEY_ENV,
+    DEFAULT_CHECKPOINT_CHUNK,
+    DEFAULT_LISTEN_ADDRESS,
+    DEFAULT_THREADS_PER_WORKER,
 )
+from .metadata import APP_NAME, ETHICAL_NOTICE, VERSION
 from .ui import (
+    end_progress,
     print_error,
     print_info,
+    print_progress,
     print_success,
     print_warning,
     prompt_text,
     show_banner,
 )
-from .utils import load_passwords_from_file, parse_csv, parse_tristate, slugify
-from .validation import sanitize_profile, validate_profile
+from .utils import parse_csv, parse_tristate, slugify
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from .compiled_profile import CompiledProfile
+    from .engine import CancellationToken, ChunkCheckpoint, DistributedSettings, EngineCoordinator, ItemError
+    from .metrics import RunMetrics
+    from .models import SubjectProfile
+    from .profiling import RunProfiler
+    from .stats import AssessmentStats
+
+# Everything heavier (engines, reporting, generator, nano_ai, sqlite history) is
+# imported inside the code path that needs it, so --help, --ask-ai,
+# --self-check and --worker start without loading the full run pipeline.
 
 
 def handle_quit(signum=None, frame=None):
@@ -49,6 +63,23 @@ def handle_quit(signum=None, frame=None):
     raise SystemExit(1)
 
 
+def request_stop(token: "CancellationToken", signum=None, frame=None):
+    if token.cancelled:
+        handle_quit(signum, frame)
+    token.cancel("interrupted")
+    print_warning("Stopping: draining in-flight work and writing partial results. Press Ctrl-C again to abort.")
+
+
+def parse_time_bound(value: str) -> float:
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"expected an ISO date or datetime, got '{value}'") from error
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
@@ -104,9 +135,27 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Optional file with passwords to audit (one password per line).",
     )
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Pipeline mode: read passwords from stdin and write one NDJSON assessment per line to stdout.",
+    )
+    parser.add_argument(
+        "--watch",
+        nargs="+",
+        type=Path,
+        metavar="FILE",
+        help="Tail password files and audit only newly appended lines, resuming from saved offsets after a restart.",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for appended lines when inotify is unavailable (default 1).",
+    )
     parser.add_argument(
         "--engine",
-        choices=("auto", "async", "threading", "parallel"),
+        choices=ENGINE_MODES,
         default=DEFAULT_ENGINE,
         help="Execution engine mode for assessments.",
     )
@@ -116,6 +165,32 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_WORKERS,
         help="Worker count for async/threading/parallel engines.",
     )
+    parser.add_argument(
+        "--threads-per-worker",
+        type=int,
+        default=DEFAULT_THREADS_PER_WORKER,
+        help="Threads inside each worker process for --engine hybrid.",
+    )
+    parser.add_argument(
+        "--listen",
+        help="Distributed coordinator address (host:port or unix:/path). Defaults to an ephemeral localhost port.",
+    )
+    parser.add_argument(
+        "--local-workers",
+        type=int,
+        help="Worker processes to spawn on this host for --engine distributed (default: --workers when --listen is unset).",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Run as a distributed worker that pulls chunks from a coordinator (requires --connect).",
+    )
+    parser.add_argument("--connect", help="Coordinator address for --worker (host:port or unix:/path).")
+    parser.add_argument(
+        "--auth-key-file",
+        type=Path,
+        help=f"File holding the shared distributed auth key (or set {AUTHKEY_ENV}).",
+    )
     parser.add_argument(
         "--min-length",
         type=int,
@@ -140,18 +215,204 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_POLICY_MIN_LENGTH,
         help="Minimum required length for policy checks.",
     )
+    parser.add_argument(
+        "--what-if-policies",
+        nargs="?",
+        const=DEFAULT_WHAT_IF_POLICIES,
+        metavar="POLICIES",
+        help=(
+            "Compare failure rates and class shifts of candidate policies in one pass over --password-file. "
+            f"Comma-separated LENGTH[-CLASS...] variants, e.g. 12,14-symbol (default: {DEFAULT_WHAT_IF_POLICIES})."
+        ),
+    )
     parser.add_argument(
         "--output-root",
         type=Path,
         default=DEFAULT_OUTPUT_ROOT,
         help="Root output directory (logs, wordlists, reports).",
     )
+    parser.add_argument(
+        "--audit-format",
+        choices=AUDIT_FORMATS,
+        default="json",
+        help="Password audit report format: a JSON array or one JSON object per line (ndjson).",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write gzip-compressed wordlists and audit reports (.gz).",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Also export audited passwords in a columnar binary format (Arrow IPC when pyarrow is installed).",
+    )
+    parser.add_argument(
+        "--audit-stats-only",
+        action="store_true",
+        help="Aggregate the password audit into distribution stats on the workers without per-password records.",
+    )
+    parser.add_argument(
+        "--sample",
+        action="store_true",
+        help=(
+            "Estimate weak/medium/strong proportions of --password-file from a uniform random sample, "
+            "refined until the confidence intervals meet --sample-precision."
+        ),
+    )
+    parser.add_argument(
+        "--sample-precision",
+        type=float,
+        default=DEFAULT_SAMPLE_PRECISION,
+        help="Target confidence-interval half-width for --sample proportions (0.005 = +/-0.5%%).",
+    )
+    parser.add_argument(
+        "--sample-confidence",
+        type=float,
+        default=DEFAULT_SAMPLE_CONFIDENCE,
+        help="Confidence level of the --sample intervals.",
+    )
+    parser.add_argument("--sample-seed", type=int, help="Random seed for a reproducible --sample.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its last completed checkpoint chunk.",
+    )
+    parser.add_argument(
+        "--checkpoint-chunk",
+        type=int,
+        default=DEFAULT_CHECKPOINT_CHUNK,
+        help="Results persisted per checkpoint chunk.",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        help="Wall-clock seconds after which the run stops cleanly and writes partial results.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        metavar="PATH",
+        help="Periodically write run and engine metrics to PATH in OpenMetrics text format (e.g. for node_exporter).",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between --metrics-file updates (default 5).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall/CPU time and throughput per pipeline stage and engine in summary.json.",
+    )
+    parser.add_argument(
+        "--profile-checks",
+        action="store_true",
+        help="With --profile, also time each evaluate_password check on a sample of the inputs.",
+    )
+    parser.add_argument(
+        "--profile-dump",
+        type=Path,
+        metavar="PATH",
+        help="Write a cProfile/pstats dump of the run to PATH (open with python -m pstats).",
+    )
     parser.add_argument("--yes", action="store_true", help="Skip ethical confirmation prompt.")
     parser.add_argument("--no-banner", action="store_true", help="Do not print banner.")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging.")
     parser.add_argument("--self-check", action="store_true", help="Run engine/output connectivity checks and exit.")
+    parser.add_argument(
+        "--perf",
+        action="store_true",
+        help="With --self-check, time real password evaluation on every engine and recommend --engine/--workers.",
+    )
+    parser.add_argument(
+        "--save-host-defaults",
+        action="store_true",
+        help="With --perf, save the recommended engine settings as this host's defaults.",
+    )
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="Run the seeded benchmark suite and compare it with the stored baseline, then exit.",
+    )
+    parser.add_argument(
+        "--bench-sizes",
+        default="1k,100k",
+        help="Comma-separated corpus sizes for --bench: 1k, 100k, 1m (default 1k,100k).",
+    )
+    parser.add_argument(
+        "--bench-engines",
+        default="async,threading,parallel,hybrid",
+        help="Comma-separated engines measured by --bench.",
+    )
+    parser.add_argument(
+        "--bench-baseline",
+        type=Path,
+        help="Baseline JSON for --bench (default benchmarks/baseline.json).",
+    )
+    parser.add_argument("--bench-save", action="store_true", help="Store this --bench run as the new baseline.")
+    parser.add_argument(
+        "--bench-tolerance",
+        type=float,
+        help="Default allowed slowdown for --bench as a fraction (overrides the baseline's default, e.g. 0.25).",
+    )
+    parser.add_argument(
+        "--serve",
+        metavar="ADDRESS",
+        help="Run a password-check daemon on unix:/path or a loopback host:port (HTTP) using profiles under --output-root.",
+    )
+    parser.add_argument(
+        "--serve-reload-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between checks for changed subject profiles while serving (default 2).",
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Show recorded runs and daily weak-exposure trends from the run-history database, then exit.",
+    )
+    parser.add_argument("--history-subject", help="Filter --history by subject name or slug.")
+    parser.add_argument("--history-org", help="Filter --history by organization.")
+    parser.add_argument("--since", type=parse_time_bound, help="Filter --history from this ISO date/time (UTC).")
+    parser.add_argument("--until", type=parse_time_bound, help="Filter --history before this ISO date/time (UTC).")
+    parser.add_argument("--history-limit", type=int, default=20, help="Maximum runs listed by --history.")
+    parser.add_argument(
+        "--history-import",
+        action="store_true",
+        help="Backfill the run-history database from existing reports/*/summary.json files, then exit.",
+    )
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run in the run-history database.")
+    parser.add_argument(
+        "--no-blocklist-index",
+        action="store_true",
+        help="Do not add this run's candidates to the organization-wide blocklist index.",
+    )
+    parser.add_argument(
+        "--blocklist-import",
+        action="store_true",
+        help="Backfill the organization-wide blocklist index from existing wordlists/*/full lists, then exit.",
+    )
+    parser.add_argument(
+        "--blocklist-lookup",
+        metavar="FILE",
+        help="Print NDJSON naming the subjects whose blocklist has each password in FILE ('-' for stdin), then exit.",
+    )
+    parser.add_argument(
+        "--blocklist-export",
+        type=Path,
+        metavar="PATH",
+        help="Write the deduplicated organization-wide blocklist to PATH, then exit.",
+    )
+    parser.add_argument(
+        "--no-families",
+        action="store_true",
+        help="Skip grouping audited passwords into near-duplicate families (Summer2023!, summer2024, ...).",
+    )
     parser.add_argument("--ask-ai", help="Ask the nano-ai helper a short question.")
     parser.add_argument("--no-nano-ai", action="store_true", help="Disable nano-ai guidance in output.")
+    parser.add_argument("--no-progress", action="store_true", help="Disable the live engine throughput display.")
     return parser
 
 
@@ -170,15 +431,111 @@ def validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace):
         parser.error("--birth-year must be in a realistic range (1900-2100)")
     if args.last_rotation_days is not None and args.last_rotation_days < 0:
         parser.error("--last-rotation-days cannot be negative")
+    if args.stdin and (args.password_file or args.serve):
+        parser.error("--stdin cannot be combined with --password-file or --serve")
+    if args.watch and (args.password_file or args.stdin or args.serve):
+        parser.error("--watch cannot be combined with --password-file, --stdin or --serve")
+    if args.watch and not args.subject_name:
+        parser.error("--watch requires --subject-name")
+    for path in args.watch or ():
+        if not path.parent.is_dir():
+            parser.error(f"--watch directory does not exist: {path.parent}")
+    if args.watch_interval <= 0:
+        parser.error("--watch-interval must be greater than 0")
     if args.password_file and not args.password_file.exists():
         parser.error(f"--password-file does not exist: {args.password_file}")
+    if args.threads_per_worker < 1:
+        parser.error("--threads-per-worker must be at least 1")
+    if args.serve_reload_interval <= 0:
+        parser.error("--serve-reload-interval must be greater than 0")
+    if args.time_budget is not None and args.time_budget <= 0:
+        parser.error("--time-budget must be greater than 0")
+    if args.history_limit < 1:
+        parser.error("--history-limit must be at least 1")
+    if args.checkpoint_chunk < 1:
+        parser.error("--checkpoint-chunk must be at least 1")
+    if args.worker and not args.connect:
+        parser.error("--worker requires --connect")
+    if args.bench:
+        from .bench import BENCH_ENGINES, BENCH_SIZES
+
+        if not set(parse_csv(args.bench_sizes)) <= set(BENCH_SIZES):
+            parser.error(f"--bench-sizes accepts: {', '.join(BENCH_SIZES)}")
+        if not set(parse_csv(args.bench_engines)) <= set(BENCH_ENGINES):
+            parser.error(f"--bench-engines accepts: {', '.join(BENCH_ENGINES)}")
+        if args.bench_tolerance is not None and args.bench_tolerance < 0:
+            parser.error("--bench-tolerance cannot be negative")
+    if args.perf and not args.self_check:
+        parser.error("--perf requires --self-check")
+    if args.save_host_defaults and not args.perf:
+        parser.error("--save-host-defaults requires --perf")
+    if args.metrics_interval <= 0:
+        parser.error("--metrics-interval must be greater than 0")
+    if args.profile_checks and not args.profile:
+        parser.error("--profile-checks requires --profile")
+    if args.what_if_policies is not None:
+        from .policy_whatif import parse_policy_variants
+
+        if not args.password_file:
+            parser.error("--what-if-policies requires --password-file")
+        try:
+            args.what_if_policies = parse_policy_variants(args.what_if_policies)
+        except ValueError as exc:
+            parser.error(f"--what-if-policies: {exc}")
+    if args.sample:
+        from .sampling import MAX_SAMPLE_SIZE, required_sample_size, z_score
+
+        if not args.password_file:
+            parser.error("--sample requires --password-file")
+        if args.columnar:
+            parser.error("--sample cannot be combined with --columnar")
+        if not 0 < args.sample_precision < 0.5:
+            parser.error("--sample-precision must be between 0 and 0.5")
+        if not 0 < args.sample_confidence < 1:
+            parser.error("--sample-confidence must be between 0 and 1")
+        if required_sample_size(0.5, args.sample_precision, z_score(args.sample_confidence)) > MAX_SAMPLE_SIZE:
+            parser.error(f"--sample-precision needs more than {MAX_SAMPLE_SIZE} samples; audit the full file instead")
+    if args.audit_stats_only and args.columnar:
+        parser.error("--audit-stats-only cannot be combined with --columnar")
+    if args.local_workers is not None and args.local_workers < 0:
+        parser.error("--local-workers cannot be negative")
+    if args.auth_key_file and not args.auth_key_file.exists():
+        parser.error(f"--auth-key-file does not exist: {args.auth_key_file}")
+    if (args.worker or args.listen) and resolve_authkey(args) is None:
+        parser.error(f"remote distributed workers require {AUTHKEY_ENV} or --auth-key-file")
+
+
+def resolve_authkey(args: argparse.Namespace) -> bytes | None:
+    if args.auth_key_file:
+        key = args.auth_key_file.read_bytes().strip()
+        return key or None
+    value = os.environ.get(AUTHKEY_ENV, "").strip()
+    return value.encode("utf-8") if value else None
+
+
+def distributed_settings(args: argparse.Namespace) -> "DistributedSettings | None":
+    if args.engine != "distributed":
+        return None
+    from .engine import DistributedSettings
+
+    local_workers = args.local_workers
+    if local_workers is None:
+        local_workers = 0 if args.listen else args.workers
+    return DistributedSettings(
+        listen=args.listen or DEFAULT_LISTEN_ADDRESS,
+        authkey=resolve_authkey(args),
+        local_workers=local_workers,
+    )
 
 
 def collect_profile(
     args: argparse.Namespace,
     parser: argparse.ArgumentParser,
     wizard_mode: bool,
-) -> SubjectProfile:
+) -> "SubjectProfile":
+    from .models import SubjectProfile
+    from .validation import sanitize_profile
+
     interactive = sys.stdin.isatty()
 
     if not args.subject_name:
@@ -260,42 +617,904 @@ def confirm_ethical_use(args: argparse.Namespace) -> bool:
     return True
 
 
-def build_categorized_wordlists(passwords: list[str], assessments: list) -> dict[str, set[str]]:
-    categorized = {
-        "weak": set(),
-        "medium": set(),
-        "strong": set(),
-        "full": set(passwords),
+def progress_display(args: argparse.Namespace, label: str):
+    if args.no_progress or not sys.stderr.isatty():
+        return None
+
+    def render(progress):
+        print_progress(f"{label} [{progress.mode}]", progress.completed, progress.rate)
+
+    return render
+
+
+def build_checkpoint(
+    args: argparse.Namespace,
+    paths: dict[str, Path],
+    label: str,
+    *fingerprint_parts,
+) -> "ChunkCheckpoint":
+    import hashlib
+    import json
+
+    from .engine import ChunkCheckpoint
+
+    digest = hashlib.sha256()
+    for part in (label, args.policy_min_length, *fingerprint_parts):
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\0")
+    return ChunkCheckpoint(
+        paths["reports_dir"] / "checkpoints" / f"{label}.ckpt",
+        fingerprint=digest.hexdigest(),
+        chunk_size=args.checkpoint_chunk,
+    )
+
+
+def show_nano_ai_guidance(tips: list[str], limit: int = 3):
+    if tips:
+        print_info("Nano AI top guidance:")
+        for tip in tips[:limit]:
+            print_info(f"- {tip}")
+
+
+def drop_item_errors(results: Iterable, errors: "list[ItemError]") -> Iterator:
+    from .engine import ItemError
+
+    for result in results:
+        if isinstance(result, ItemError):
+            errors.append(result)
+            continue
+        yield result
+
+
+def run_stdin_pipeline(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    import io
+    from contextlib import redirect_stdout
+
+    from .audit import evaluate_password_worker
+    from .compiled_profile import EMPTY_PROFILE, compile_profile
+    from .engine import CancellationToken, EngineCoordinator, ItemError
+    from .logging_setup import setup_logger
+    from .reporting import assessment_record, item_error_record
+    from .stats import AssessmentStats
+    from .utils import iter_password_batches_from_stream
+
+    # stdout carries only NDJSON; notices, warnings and the summary go to stderr.
+    output = sys.stdout
+    with redirect_stdout(sys.stderr):
+        if not confirm_ethical_use(args):
+            return 1
+        compiled = EMPTY_PROFILE
+        profile = None
+        if args.subject_name:
+            from .validation import validate_profile
+
+            profile = collect_profile(args, parser, wizard_mode=False)
+            compiled = compile_profile(profile)
+            errors, _ = validate_profile(profile, compiled)
+            if errors:
+                for issue in errors:
+                    print_error(f"Profile validation: {issue}")
+                return 1
+
+        logger = setup_logger(args.output_root / "logs" / "victimator-x.log", verbose=args.verbose)
+        cancellation = CancellationToken(time_budget=args.time_budget)
+        # The stream length is unknown, so auto mode does not probe it; a warm
+        # process pool serves the batches instead, as it would a large input.
+        mode = "parallel" if args.engine == "auto" else args.engine
+        engine = EngineCoordinator(
+            mode=mode,
+            workers=args.workers,
+            logger=logger,
+            cancellation=cancellation,
+            threads_per_worker=args.threads_per_worker,
+            keep_warm=True,
+            shared=(compiled,),
+        )
+        worker = partial(
+            evaluate_password_worker, profile_key=compiled.fingerprint, policy_min_length=args.policy_min_length
+        )
+        # Read through a duplicate descriptor: forked pool workers close
+        # sys.stdin on start-up, which would deadlock on the reader thread's
+        # lock if both shared one file object.
+        source = io.open(os.dup(sys.stdin.fileno()), "r", encoding="utf-8", errors="ignore")
+        written = failed = offset = 0
+        stats = None if args.no_nano_ai else AssessmentStats()
+        signal.signal(signal.SIGINT, partial(request_stop, cancellation))
+        try:
+            # Each batch is the input buffered so far, so the engine never waits
+            # on a slow pipe while finished results are held back; output is
+            # flushed after every batch.
+            for batch in iter_password_batches_from_stream(source):
+                if cancellation.cancelled:
+                    break
+                for result in engine.imap(worker, batch):
+                    if isinstance(result, ItemError):
+                        output.write(item_error_record(result, offset + result.index) + "\n")
+                        failed += 1
+                        continue
+                    output.write(assessment_record(result) + "\n")
+                    written += 1
+                    if stats is not None:
+                        stats.add(result)
+                offset += len(batch)
+                output.flush()
+        except BrokenPipeError:
+            # The reader went away (e.g. `| head`); stop quietly like other filters.
+            cancellation.cancel("output closed")
+            os.dup2(os.open(os.devnull, os.O_WRONLY), output.fileno())
+        finally:
+            engine.close()
+
+        logger.info("Pipeline evaluated %d password(s) with %s engine (%d failed)", written, engine.last_mode, failed)
+        if failed:
+            print_warning(f"Items that failed evaluation: {failed} (error records written to stdout)")
+        if stats is not None:
+            from .nano_ai import build_nano_ai_guidance
+
+            show_nano_ai_guidance(build_nano_ai_guidance(profile, None, stats))
+        if cancellation.reason == "interrupted":
+            return 130
+    return 0
+
+
+def run_watch(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from .audit import evaluate_password_worker
+    from .compiled_profile import compile_profile
+    from .engine import CancellationToken, EngineCoordinator, ItemError
+    from .logging_setup import setup_logger
+    from .reporting import AuditStreamWriter, audit_report_path, output_paths
+    from .stats import AssessmentStats
+    from .validation import validate_profile
+    from .watch import (
+        TailedFile,
+        create_watcher,
+        file_key,
+        load_audit_stats,
+        load_watch_state,
+        save_watch_state,
+        update_watch_summary,
+    )
+
+    profile = collect_profile(args, parser, wizard_mode=False)
+    compiled = compile_profile(profile)
+    errors, _ = validate_profile(profile, compiled)
+    if errors:
+        for issue in errors:
+            print_error(f"Profile validation: {issue}")
+        return 1
+    subject_slug = slugify(profile.name)
+    paths = output_paths(args.output_root, subject_slug)
+    reports_dir = paths["reports_dir"]
+    logger = setup_logger(paths["logs_dir"] / "victimator-x.log", verbose=args.verbose)
+
+    # Watch mode always appends ndjson records so earlier output is never rewritten.
+    report_path = audit_report_path(reports_dir, "ndjson", args.compress)
+    state = load_watch_state(reports_dir)
+    if state is not None:
+        stats = AssessmentStats.from_state(state["stats"])
+        offsets = state.get("files", {})
+    else:
+        # Seed from the last normal run's report, in whichever format it used.
+        seed_path = report_path
+        if not seed_path.exists():
+            seed_path = audit_report_path(reports_dir, "json", args.compress)
+        stats = load_audit_stats(seed_path, args.compress)
+        offsets = {}
+    files = [
+        TailedFile(path, **offsets.get(file_key(path), {}))
+        for path in dict.fromkeys(path.resolve() for path in args.watch)
+    ]
+
+    worker = partial(
+        evaluate_password_worker, profile_key=compiled.fingerprint, policy_min_length=args.policy_min_length
+    )
+    cancellation = CancellationToken(time_budget=args.time_budget)
+    engine = EngineCoordinator(
+        mode=args.engine,
+        workers=args.workers,
+        logger=logger,
+        cancellation=cancellation,
+        threads_per_worker=args.threads_per_worker,
+        keep_warm=True,
+        shared=(compiled,),
+    )
+    watcher = create_watcher([tailed.path for tailed in files], args.watch_interval)
+    print_info(f"Watching {len(files)} file(s) via {watcher.kind}; appending to {report_path}")
+    print_info("Press Ctrl-C to stop.")
+    logger.info("Watching %s via %s for subject=%s", ", ".join(map(str, args.watch)), watcher.kind, profile.name)
+    signal.signal(signal.SIGINT, partial(request_stop, cancellation))
+
+    try:
+        with AuditStreamWriter(reports_dir, fmt="ndjson", compress=args.compress, append=True) as audit_writer:
+            while not cancellation.cancelled:
+                lines = [line for tailed in files for line in tailed.read_lines()]
+                if not any(tailed.pending for tailed in files):
+                    watcher.wait(args.watch_interval)
+                    continue
+                results = list(engine.imap(worker, lines))
+                if len(results) < len(lines):
+                    # Stopped mid-batch: nothing is written, so these lines
+                    # are picked up again on the next start.
+                    break
+                for result in results:
+                    if isinstance(result, ItemError):
+                        stats.failed += 1
+                        continue
+                    audit_writer.write(result)
+                    stats.add(result)
+                audit_writer.sync()
+                for tailed in files:
+                    tailed.commit()
+                save_watch_state(reports_dir, files, stats)
+                update_watch_summary(
+                    reports_dir,
+                    profile.name,
+                    subject_slug,
+                    stats,
+                    engine.last_mode,
+                    args.workers,
+                    args.policy_min_length,
+                )
+                print_info(
+                    f"Audited {len(lines)} new password(s) with {engine.last_mode}: "
+                    f"total {stats.count}, weak {stats.classifications['weak']}"
+                )
+                logger.info("Watch batch: %d new, %d total audited", len(lines), stats.count)
+    finally:
+        watcher.close()
+        engine.close()
+
+    print_success(f"Watch stopped ({cancellation.reason}). Audited {stats.count} password(s) in total.")
+    if not args.no_nano_ai:
+        from .nano_ai import build_nano_ai_guidance
+
+        show_nano_ai_guidance(build_nano_ai_guidance(profile, None, stats))
+    return 130 if cancellation.reason == "interrupted" else 0
+
+
+def serve(args: argparse.Namespace) -> int:
+    from .logging_setup import setup_logger
+    from .server import run_server
+
+    logger = setup_logger(args.output_root / "logs" / "victimator-x.log", verbose=args.verbose)
+
+    def announce(address: str, subjects: int):
+        print_success(f"Serving password checks on {address} ({subjects} subject profile(s) loaded)")
+        print_info("Press Ctrl-C to stop.")
+
+    try:
+        return run_server(
+            args.serve,
+            args.output_root,
+            policy_min_length=args.policy_min_length,
+            reload_interval=args.serve_reload_interval,
+            logger=logger,
+            on_ready=announce,
+        )
+    except (OSError, ValueError) as error:
+        print_error(f"Cannot serve on {args.serve}: {error}")
+        return 1
+
+
+def run_bench(args: argparse.Namespace) -> int:
+    from .bench import DEFAULT_BASELINE, compare, load_baseline, run_benchmarks, save_baseline
+
+    baseline_path = args.bench_baseline or DEFAULT_BASELINE
+    baseline = load_baseline(baseline_path)
+    sizes = tuple(parse_csv(args.bench_sizes))
+    engines = tuple(parse_csv(args.bench_engines))
+    print_info(f"Benchmarking sizes {', '.join(sizes)} with {args.workers} worker(s), one fresh process per case.")
+
+    def report(key: str, metrics: dict):
+        print_info(f"{key}: " + ", ".join(f"{name}={value}" for name, value in metrics.items()))
+
+    regressions = 0
+    try:
+        run = run_benchmarks(sizes=sizes, engines=engines, workers=args.workers, on_result=report)
+    except RuntimeError as error:
+        print_error(str(error))
+        return 1
+
+    if baseline is None:
+        print_warning(f"No baseline at {baseline_path}; nothing to compare against.")
+    else:
+        if baseline.get("environment") != run["environment"] or baseline.get("workers") != run["workers"]:
+            print_warning("Baseline was recorded on a different environment or worker count; compare with care.")
+        for item in compare(run, baseline, args.bench_tolerance):
+            if item.change is None:
+                continue
+            line = (
+                f"{item.key} {item.metric}: {item.value} vs {item.baseline} "
+                f"({item.change:+.1%}, tolerance {item.tolerance:.0%})"
+            )
+            if item.regressed:
+                regressions += 1
+                print_error(f"REGRESSION {line}")
+            else:
+                print_success(line)
+        if regressions:
+            print_error(f"{regressions} metric(s) regressed beyond tolerance.")
+    if args.bench_save:
+        print_success(f"Baseline saved: {save_baseline(baseline_path, run, baseline)}")
+        return 0
+    return 1 if regressions else 0
+
+
+def run_blocklist_index(args: argparse.Namespace) -> int:
+    from .blocklist_index import BLOCKLIST_INDEX_DIR, BlocklistIndex
+
+    index = BlocklistIndex(args.output_root / BLOCKLIST_INDEX_DIR)
+    if args.blocklist_import:
+        from .reporting import iter_wordlist
+
+        wordlists_root = args.output_root / "wordlists"
+        imported = 0
+        for wordlists_dir in sorted(wordlists_root.iterdir()) if wordlists_root.is_dir() else ():
+            if not wordlists_dir.is_dir() or (wordlists_dir / "INCOMPLETE").exists():
+                continue
+            index.add_subject(wordlists_dir.name, iter_wordlist(wordlists_dir, "full"))
+            imported += 1
+        print_success(f"Imported {imported} subject blocklist(s); the index covers {len(index.subjects)} subject(s)")
+    if args.blocklist_export:
+        count = index.export(args.blocklist_export)
+        print_success(f"Exported {count} unique blocklist entries from {len(index.subjects)} subject(s)")
+        print_success(f"Org-wide blocklist saved: {args.blocklist_export}")
+    return 0
+
+
+def run_blocklist_lookup(args: argparse.Namespace) -> int:
+    import io
+    import json
+    from contextlib import redirect_stdout
+
+    from .blocklist_index import BLOCKLIST_INDEX_DIR, BlocklistIndex
+    from .utils import iter_passwords_from_file, iter_passwords_from_stream
+
+    # stdout carries only NDJSON, as with --stdin.
+    if args.blocklist_lookup == "-":
+        source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="ignore")
+        passwords = iter_passwords_from_stream(source, on_idle=sys.stdout.flush)
+    else:
+        path = Path(args.blocklist_lookup)
+        if not path.exists():
+            print_error(f"--blocklist-lookup file does not exist: {path}")
+            return 1
+        passwords = iter_passwords_from_file(path)
+    index = BlocklistIndex(args.output_root / BLOCKLIST_INDEX_DIR)
+    checked = matched = 0
+    for password, subjects in index.lookup(passwords):
+        sys.stdout.write(json.dumps({"password": password, "blocklisted": bool(subjects), "subjects": subjects}) + "\n")
+        checked += 1
+        matched += bool(subjects)
+    sys.stdout.flush()
+    with redirect_stdout(sys.stderr):
+        print_info(f"{matched} of {checked} password(s) are on the blocklist of at least one subject")
+    return 0
+
+
+def show_history(args: argparse.Namespace) -> int:
+    from .history import HISTORY_DB_NAME, RunHistoryStore
+
+    store = RunHistoryStore(args.output_root / HISTORY_DB_NAME)
+    try:
+        if args.history_import:
+            imported = store.import_summaries(args.output_root)
+            print_success(f"Imported {imported} run summary file(s) into {store.path}")
+            return 0
+
+        subject = slugify(args.history_subject) if args.history_subject else None
+        filters = {
+            "subject": subject,
+            "organization": args.history_org,
+            "since": args.since,
+            "until": args.until,
+        }
+        runs = store.query(limit=args.history_limit, **filters)
+        trend = store.trend(**filters)
+    finally:
+        store.close()
+
+    if not runs:
+        print_warning("No recorded runs match the given filters.")
+        return 0
+
+    print_info(f"Recent runs ({len(runs)} shown):")
+    for run in runs:
+        when = datetime.fromtimestamp(run["recorded_at"], tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+        weak_ratio = run["weak_ratio"] or 0.0
+        status = "" if run["completed"] else f" [incomplete: {run['stop_reason']}]"
+        print_info(
+            f"{when} | {run['subject_slug']} | org={run['organization'] or '-'} | "
+            f"weak {run['weak_count']}/{run['generated_candidates']} ({weak_ratio:.1%}) | "
+            f"audited weak {run['audited_weak_count']}/{run['audited_password_count']}{status}"
+        )
+    print_info("Daily trend:")
+    for day in trend:
+        print_info(
+            f"{day['day']} | runs={day['runs']} subjects={day['subjects']} | "
+            f"avg weak ratio {(day['avg_weak_ratio'] or 0.0):.1%} | "
+            f"audited weak {day['audited_weak'] or 0}/{day['audited'] or 0}"
+        )
+    return 0
+
+
+def audit_password_sample(
+    args: argparse.Namespace,
+    engine: "EngineCoordinator",
+    worker: Callable,
+    audit_stats: "AssessmentStats",
+    item_errors: "list[ItemError]",
+    cancellation: "CancellationToken",
+    progress: Callable | None,
+) -> tuple[list[str], dict]:
+    import random
+
+    from .engine.streaming import iter_chunks
+    from .sampling import (
+        FIRST_ROUND_SIZE,
+        next_sample_size,
+        proportion_estimates,
+        required_sample_size,
+        sample_password_file,
+        z_score,
+    )
+    from .stats import AGGREGATE_CHUNK_SIZE, aggregate_chunk
+
+    z = z_score(args.sample_confidence)
+    seed = args.sample_seed if args.sample_seed is not None else random.SystemRandom().randrange(2**32)
+    # One pass keeps a reservoir big enough for the worst case (p = 0.5);
+    # rounds then evaluate growing prefixes of it and stop as soon as every
+    # class interval is narrow enough, which is often much earlier.
+    capacity = required_sample_size(0.5, args.sample_precision, z)
+    passwords, lines = sample_password_file(args.password_file, capacity, random.Random(seed))
+    census = lines <= capacity
+    evaluated = 0
+    target = len(passwords) if census else min(len(passwords), FIRST_ROUND_SIZE)
+    rounds: list[dict] = []
+    while True:
+        for partial_stats in drop_item_errors(
+            engine.imap(
+                partial(aggregate_chunk, worker),
+                iter_chunks(passwords[evaluated:target], AGGREGATE_CHUNK_SIZE),
+                ordered=False,
+                progress=progress,
+                batch_size=AGGREGATE_CHUNK_SIZE,
+            ),
+            item_errors,
+        ):
+            audit_stats.merge(partial_stats)
+        evaluated = target
+        estimates = proportion_estimates(audit_stats.classifications, audit_stats.count, z, exact=census)
+        widest = max(estimate["half_width"] for estimate in estimates.values())
+        rounds.append({"sample_size": audit_stats.count, "half_width": widest})
+        if widest <= args.sample_precision or evaluated >= len(passwords) or cancellation.cancelled:
+            break
+        target = min(len(passwords), next_sample_size(estimates, audit_stats.count, args.sample_precision, z))
+    return passwords[:evaluated], {
+        "population_lines": lines,
+        "sample_size": audit_stats.count,
+        "census": census,
+        "confidence": args.sample_confidence,
+        "target_precision": args.sample_precision,
+        "precision_met": widest <= args.sample_precision,
+        "seed": seed,
+        "rounds": rounds,
+        "proportions": estimates,
     }
-    for assessment in assessments:
-        categorized[assessment.classification].add(assessment.password)
-    return categorized
+
+
+def run_assessments(
+    args: argparse.Namespace,
+    profile: "SubjectProfile",
+    compiled: "CompiledProfile",
+    subject_slug: str,
+    paths: dict[str, Path],
+    logger: "Logger",
+    candidates: list[str],
+    engine: "EngineCoordinator",
+    cancellation: "CancellationToken",
+    profiler: "RunProfiler",
+    metrics: "RunMetrics | None" = None,
+) -> int:
+    from .audit import evaluate_password_worker, generate_passphrase_suggestions
+    from .columnar import ColumnarAssessmentWriter
+    from .engine import ItemError
+    from .engine.streaming import iter_chunks
+    from .history import HISTORY_DB_NAME, HistoryRecord, RunHistoryStore
+    from .models import RunSummary
+    from .nano_ai import build_nano_ai_guidance
+    from .profiling import profile_checks
+    from .reporting import (
+        AuditStreamWriter,
+        CategorizedWordlistWriter,
+        policy_what_if_lines,
+        sample_estimate_lines,
+        write_completion_marker,
+        write_quick_report,
+        write_profile_snapshot,
+        write_run_summary,
+    )
+    from .stats import AGGREGATE_CHUNK_SIZE, AssessmentStats, aggregate_chunk
+    from .utils import iter_passwords_from_file
+
+    worker = partial(
+        evaluate_password_worker,
+        profile_key=compiled.fingerprint,
+        policy_min_length=args.policy_min_length,
+    )
+    item_errors: list[ItemError] = []
+    candidate_progress = progress_display(args, "Classifying candidates")
+    if metrics:
+        candidate_progress = metrics.observe("classify_candidates", candidate_progress)
+    candidate_checkpoint = build_checkpoint(args, paths, "candidates", compiled.fingerprint, candidates)
+    # Candidates arrive in the generator's sorted order, so the wordlists are
+    # partitioned and written in one pass without re-sorting.
+    with profiler.stage("classify_candidates") as timing:
+        with CategorizedWordlistWriter(paths["wordlists_dir"], presorted=True, compress=args.compress) as wordlists:
+            if metrics:
+                metrics.writers["wordlists"] = wordlists
+                metrics.classified["candidates"] = wordlists.counts
+            for result in engine.imap(
+                worker,
+                candidates,
+                progress=candidate_progress,
+                checkpoint=candidate_checkpoint,
+                resume=args.resume,
+            ):
+                if isinstance(result, ItemError):
+                    item_errors.append(result)
+                    wordlists.add(result.item, None)
+                else:
+                    wordlists.add(result.password, result.classification)
+        timing.items, timing.engine = len(candidates), engine.last_mode
+    if candidate_progress:
+        end_progress()
+    counts = wordlists.counts
+
+    audited_count = 0
+    audit_stats = AssessmentStats()
+    sample: list[str] | None = None
+    sample_estimate: dict = {}
+    if args.password_file and cancellation.cancelled:
+        logger.warning("Skipping password audit: run stopped (%s)", cancellation.reason)
+    elif args.password_file:
+        with profiler.stage("audit_passwords") as timing:
+            logger.info("Auditing explicit passwords from %s", args.password_file)
+            if args.sample:
+                label = "Sampling passwords"
+            else:
+                label = "Aggregating password chunks" if args.audit_stats_only else "Auditing passwords"
+            audit_progress = progress_display(args, label)
+            if metrics:
+                audit_progress = metrics.observe("audit_passwords", audit_progress)
+                metrics.classified["audit"] = audit_stats.classifications
+            stat = args.password_file.stat()
+            audit_checkpoint = build_checkpoint(
+                args,
+                paths,
+                "password-audit-stats" if args.audit_stats_only else "password-audit",
+                compiled.fingerprint,
+                str(args.password_file.resolve()),
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+            passwords = iter_passwords_from_file(args.password_file)
+            if args.sample:
+                # Only a uniform sample is evaluated, in rounds that grow until the
+                # class proportions reach the requested precision.
+                sample, sample_estimate = audit_password_sample(
+                    args, engine, worker, audit_stats, item_errors, cancellation, audit_progress
+                )
+                audited_count = audit_stats.count
+                if audit_progress:
+                    end_progress()
+                logger.info(
+                    "Sampled %d of %d lines (widest interval half-width %.4f)",
+                    audited_count,
+                    sample_estimate["population_lines"],
+                    max(estimate["half_width"] for estimate in sample_estimate["proportions"].values()),
+                )
+            elif args.audit_stats_only:
+                # Each worker folds a whole chunk into a partial aggregate, so only
+                # small stats objects cross process boundaries to be merged here.
+                for partial_stats in drop_item_errors(
+                    engine.imap(
+                        partial(aggregate_chunk, worker),
+                        iter_chunks(passwords, AGGREGATE_CHUNK_SIZE),
+                        ordered=False,
+                        progress=audit_progress,
+                        checkpoint=audit_checkpoint,
+                        resume=args.resume,
+                        batch_size=AGGREGATE_CHUNK_SIZE,
+                    ),
+                    item_errors,
+                ):
+                    audit_stats.merge(partial_stats)
+                audited_count = audit_stats.count
+                if audit_progress:
+                    end_progress()
+                logger.info("Aggregated %d explicit passwords into distribution stats", audited_count)
+            else:
+                # Assessments are streamed straight to the report writer and folded
+                # into audit_stats, which is all the guidance needs.
+                columnar_writer = ColumnarAssessmentWriter(paths["reports_dir"]) if args.columnar else None
+                audit_writer = AuditStreamWriter(paths["reports_dir"], fmt=args.audit_format, compress=args.compress)
+                if metrics:
+                    metrics.writers["audit"] = audit_writer
+                with audit_writer:
+                    for assessment in drop_item_errors(
+                        engine.imap(
+                            worker,
+                            passwords,
+                            progress=audit_progress,
+                            checkpoint=audit_checkpoint,
+                            resume=args.resume,
+                        ),
+                        item_errors,
+                    ):
+                        audit_writer.write(assessment)
+                        if columnar_writer:
+                            columnar_writer.write(assessment)
+                        audit_stats.add(assessment)
+                audited_count = audit_writer.count
+                if columnar_writer:
+                    logger.info("Columnar audit export saved to %s", columnar_writer.close())
+                if audit_progress:
+                    end_progress()
+                logger.info("Audited %d explicit passwords into %s", audited_count, audit_writer.path)
+            timing.items, timing.engine = audited_count, engine.last_mode
+
+    password_families: dict = {}
+    if args.password_file and not args.no_families and not cancellation.cancelled:
+        from .families import FamilyIndex
+
+        with profiler.stage("password_families") as timing:
+            families = FamilyIndex()
+            families.update(
+                sample if sample is not None else iter_passwords_from_file(args.password_file), cancellation
+            )
+            password_families = families.to_dict()
+            timing.items = families.count
+        logger.info(
+            "Grouped %d passwords into %d families",
+            password_families["passwords_in_families"],
+            password_families["families"],
+        )
+
+    policy_what_if: dict = {}
+    if args.what_if_policies and not cancellation.cancelled:
+        from .audit import password_features_worker
+        from .policy_whatif import PolicyVariant, PolicyWhatIf, what_if_chunk
+
+        # Features are extracted once per password and every variant is scored
+        # from them on the worker, so N policies cost about one audit pass.
+        with profiler.stage("policy_what_if") as timing:
+            baseline = PolicyVariant(args.policy_min_length)
+            matrix = PolicyWhatIf(baseline, args.what_if_policies)
+            chunk_worker = partial(
+                what_if_chunk,
+                partial(password_features_worker, profile_key=compiled.fingerprint),
+                baseline,
+                args.what_if_policies,
+            )
+            for partial_matrix in drop_item_errors(
+                engine.imap(
+                    chunk_worker,
+                    iter_chunks(
+                        sample if sample is not None else iter_passwords_from_file(args.password_file),
+                        AGGREGATE_CHUNK_SIZE,
+                    ),
+                    ordered=False,
+                    batch_size=AGGREGATE_CHUNK_SIZE,
+                ),
+                item_errors,
+            ):
+                matrix.merge(partial_matrix)
+            policy_what_if = matrix.to_dict()
+            timing.items, timing.engine = matrix.count, engine.last_mode
+        logger.info(
+            "Compared %d policy variant(s) over %d passwords", len(args.what_if_policies), matrix.count
+        )
+
+    weak_examples = wordlists.weak_examples
+    suggestions = generate_passphrase_suggestions(count=5)
+    stop_reason = cancellation.reason if cancellation.cancelled else None
+    failed_count = len(item_errors) + audit_stats.failed
+
+    summary = RunSummary(
+        subject_name=profile.name,
+        subject_slug=subject_slug,
+        generated_candidates=len(candidates),
+        weak_count=counts["weak"],
+        medium_count=counts["medium"],
+        strong_count=counts["strong"],
+        engine_mode=engine.last_mode,
+        workers=args.workers,
+        policy_min_length=args.policy_min_length,
+        audited_password_count=audited_count,
+        audited_weak_count=audit_stats.classifications["weak"],
+        failed_item_count=failed_count,
+        completed=stop_reason is None,
+        stop_reason=stop_reason,
+        audit_distribution=audit_stats.to_dict() if audit_stats.count else {},
+        password_families=password_families,
+        policy_what_if=policy_what_if,
+        sample_estimate=sample_estimate,
+    )
+    nano_ai_tips: list[str] = []
+    if not args.no_nano_ai:
+        with profiler.stage("nano_ai"):
+            nano_ai_tips = build_nano_ai_guidance(profile=profile, summary=summary, stats=audit_stats)
+
+    with profiler.stage("write_reports"):
+        write_completion_marker(paths["wordlists_dir"], stop_reason)
+        write_completion_marker(paths["reports_dir"], stop_reason)
+        report_path = write_quick_report(
+            paths["reports_dir"],
+            summary,
+            suggestions,
+            weak_examples,
+            nano_ai_tips,
+            audit_stats=audit_stats,
+        )
+    if not args.no_blocklist_index and stop_reason is None:
+        from .blocklist_index import BLOCKLIST_INDEX_DIR, BlocklistIndex
+
+        # Replaces this subject's entries in the org-wide index; the cost is
+        # proportional to this run's candidates, not to the index.
+        with profiler.stage("blocklist_index") as timing:
+            index = BlocklistIndex(args.output_root / BLOCKLIST_INDEX_DIR)
+            timing.items = index.add_subject(subject_slug, candidates)
+        logger.info(
+            "Blocklist index: %d entries for %s (%d subject(s) indexed)", timing.items, subject_slug, len(index.subjects)
+        )
+    summary.recorded_at = time.time()
+    if not args.no_history:
+        with profiler.stage("record_history"):
+            store = RunHistoryStore(args.output_root / HISTORY_DB_NAME)
+            try:
+                store.record_run(HistoryRecord(summary=summary, organization=profile.organization, stats=audit_stats))
+            finally:
+                store.close()
+    if args.profile_checks:
+        with profiler.stage("profile_checks") as timing:
+            sample = iter_passwords_from_file(args.password_file) if args.password_file else candidates
+            profiler.checks = profile_checks(sample, compiled, args.policy_min_length)
+            timing.items = profiler.checks.calls
+    if metrics:
+        metrics.completed = stop_reason is None
+    # The summary is written after every timed stage so its profile is complete.
+    if args.profile:
+        summary.profile = profiler.to_dict()
+    summary_path = write_run_summary(paths["reports_dir"], summary)
+    write_profile_snapshot(paths["reports_dir"], profile, args.policy_min_length)
+
+    print_success(f"App: {APP_NAME} v{VERSION}")
+    print_success(f"Subject: {profile.name} ({subject_slug})")
+    print_success(f"Generated candidates: {len(candidates)}")
+    print_success(
+        f"Classified => weak:{counts['weak']} "
+        f"medium:{counts['medium']} strong:{counts['strong']}"
+    )
+    print_success(f"Engine used: {engine.last_mode} with {args.workers} worker(s)")
+    if engine.mode_reason:
+        print_info(f"Engine selection: {engine.mode_reason}")
+    if stop_reason:
+        print_warning(f"Run stopped early ({stop_reason}); wordlists and reports are marked incomplete.")
+    if failed_count:
+        print_warning(f"Items that failed evaluation: {failed_count} (see log for details)")
+    print_success(f"Wordlists saved at: {paths['wordlists_dir']}")
+    print_success(f"Summary saved: {summary_path}")
+    print_success(f"Report saved: {report_path}")
+    if sample_estimate:
+        for line in sample_estimate_lines(sample_estimate):
+            print_info(line)
+    if policy_what_if:
+        for line in policy_what_if_lines(policy_what_if):
+            print_info(line)
+    show_nano_ai_guidance(nano_ai_tips)
+    if summary.profile:
+        print_info(f"Stage profile ({summary.profile['total_wall_seconds']:.2f}s total):")
+        for timing in summary.profile["stages"]:
+            rate = f", {timing['items_per_second']:,.0f} items/s" if timing.get("items_per_second") else ""
+            print_info(
+                f"- {timing['name']}: {timing['wall_seconds']:.3f}s wall, "
+                f"{timing['cpu_seconds'] + timing['child_cpu_seconds']:.3f}s CPU{rate}"
+            )
+
+    if stop_reason:
+        logger.warning(
+            "Run stopped (%s). Partial results: weak=%d medium=%d strong=%d",
+            stop_reason,
+            summary.weak_count,
+            summary.medium_count,
+            summary.strong_count,
+        )
+        return 130 if stop_reason == "interrupted" else 0
+    logger.info("Engine mode %s selected (%s)", engine.last_mode, engine.mode_reason)
+    logger.info("Run completed. weak=%d medium=%d strong=%d", summary.weak_count, summary.medium_count, summary.strong_count)
+    return 0
 
 
 def main(argv: list[str] | None = None) -> int:
     signal.signal(signal.SIGINT, handle_quit)
     parser = build_parser()
+    # Saved host defaults replace the built-in engine defaults; explicit flags still win.
+    parser.set_defaults(**load_host_defaults())
     args = parser.parse_args(argv)
     validate_args(parser, args)
 
+    if args.worker:
+        from .engine import run_worker
+
+        processed = run_worker(args.connect, resolve_authkey(args))
+        print_info(f"Worker finished after {processed} chunk(s).")
+        return 0
+
+    if args.stdin:
+        return run_stdin_pipeline(args, parser)
+
+    if args.blocklist_lookup:
+        return run_blocklist_lookup(args)
+
     if not args.no_banner:
         show_banner()
 
     if args.ask_ai:
+        from .nano_ai import answer_nano_ai_question
+
         print_info(f"Nano AI: {answer_nano_ai_question(args.ask_ai)}")
 
     if args.self_check:
+        from .healthcheck import run_self_check
+
         ok, messages = run_self_check(args.output_root, args.workers)
+        recommendation: dict = {}
+        if args.perf:
+            from .healthcheck import run_perf_check
+
+            perf_ok, perf_messages, recommendation = run_perf_check(args.threads_per_worker)
+            messages.extend(perf_messages)
+            ok = ok and perf_ok
         for message in messages:
             if "FAIL" in message:
                 print_error(message)
             else:
                 print_success(message)
+        if args.save_host_defaults and recommendation:
+            from .config import save_host_defaults
+
+            print_success(f"Host defaults saved: {save_host_defaults(recommendation)}")
+        elif args.save_host_defaults:
+            print_info("Host defaults not saved: no engine setting beat serial evaluation.")
         return 0 if ok else 1
 
+    if args.bench:
+        return run_bench(args)
+
+    if args.history or args.history_import:
+        return show_history(args)
+
+    if args.blocklist_import or args.blocklist_export:
+        return run_blocklist_index(args)
+
     if not confirm_ethical_use(args):
         return 1
 
+    if args.serve:
+        return serve(args)
+
+    if args.watch:
+        return run_watch(args, parser)
+
+    from .engine import CancellationToken, EngineCoordinator
+    from .compiled_profile import compile_profile
+    from .generator import generate_candidate_blocklist
+    from .logging_setup import setup_logger
+    from .profiling import RunProfiler
+    from .reporting import output_paths
+    from .validation import validate_profile
+
     wizard_mode = not any(
         [
             args.subject_name,
@@ -312,7 +1531,8 @@ def main(argv: list[str] | None = None) -> int:
         ]
     )
     profile = collect_profile(args, parser, wizard_mode=wizard_mode)
-    errors, warnings = validate_profile(profile)
+    compiled = compile_profile(profile)
+    errors, warnings = validate_profile(profile, compiled)
     if errors:
         for issue in errors:
             print_error(f"Profile validation: {issue}")
@@ -326,81 +1546,53 @@ def main(argv: list[str] | None = None) -> int:
     logger = setup_logger(paths["logs_dir"] / "victimator-x.log", verbose=args.verbose)
     logger.info("Starting run for subject=%s engine=%s", profile.name, args.engine)
 
-    candidates = generate_candidate_blocklist(
-        profile=profile,
-        min_length=args.min_length,
-        max_length=args.max_length,
-        max_candidates=args.max_candidates,
-    )
-    logger.info("Generated %d candidate patterns", len(candidates))
-
-    engine = EngineCoordinator(mode=args.engine, workers=args.workers, logger=logger)
-    normalized_tokens = normalize_subject_tokens(tuple(profile.all_tokens()))
-    worker = partial(
-        evaluate_password_worker,
-        subject_tokens=normalized_tokens,
-        policy_min_length=args.policy_min_length,
-    )
-    candidate_assessments = engine.map(worker, candidates)
-
-    categorized = build_categorized_wordlists(candidates, candidate_assessments)
-    wordlist_paths = write_wordlists(paths["wordlists_dir"], categorized)
+    dump = None
+    if args.profile_dump:
+        import cProfile
 
-    audited_assessments = []
-    if args.password_file:
-        passwords_from_file = load_passwords_from_file(args.password_file)
-        logger.info("Auditing %d explicit passwords from %s", len(passwords_from_file), args.password_file)
-        audited_assessments = engine.map(worker, passwords_from_file)
-        write_password_audit(paths["reports_dir"], audited_assessments)
-
-    weak_examples = [item for item in sorted(categorized["weak"])[:10]]
-    suggestions = generate_passphrase_suggestions(count=5)
-
-    summary = RunSummary(
-        subject_name=profile.name,
-        subject_slug=subject_slug,
-        generated_candidates=len(candidates),
-        weak_count=len(categorized["weak"]),
-        medium_count=len(categorized["medium"]),
-        strong_count=len(categorized["strong"]),
-        engine_mode=engine.last_mode,
-        workers=args.workers,
-        policy_min_length=args.policy_min_length,
-        audited_password_count=len(audited_assessments),
-        audited_weak_count=len([item for item in audited_assessments if item.classification == "weak"]),
-    )
-    nano_ai_tips: list[str] = []
-    if not args.no_nano_ai:
-        nano_ai_tips = build_nano_ai_guidance(
-            profile=profile,
-            summary=summary,
-            audited_assessments=audited_assessments,
+        dump = cProfile.Profile()
+        dump.enable()
+    profiler = RunProfiler()
+    # The time budget starts with candidate generation, so time spent in the
+    # wizard prompts does not count against it.
+    cancellation = CancellationToken(time_budget=args.time_budget)
+    with profiler.stage("generate_candidates") as timing:
+        candidates = generate_candidate_blocklist(
+            profile=compiled,
+            min_length=args.min_length,
+            max_length=args.max_length,
+            max_candidates=args.max_candidates,
         )
+        timing.items = len(candidates)
+    logger.info("Generated %d candidate patterns", len(candidates))
 
-    summary_path = write_run_summary(paths["reports_dir"], summary)
-    report_path = write_quick_report(
-        paths["reports_dir"],
-        summary,
-        suggestions,
-        weak_examples,
-        nano_ai_tips,
+    engine = EngineCoordinator(
+        mode=args.engine,
+        workers=args.workers,
+        logger=logger,
+        distributed=distributed_settings(args),
+        cancellation=cancellation,
+        threads_per_worker=args.threads_per_worker,
+        shared=(compiled,),
     )
+    metrics = emitter = None
+    if args.metrics_file:
+        from .metrics import MetricsEmitter, RunMetrics
 
-    print_success(f"App: {APP_NAME} v{VERSION}")
-    print_success(f"Subject: {profile.name} ({subject_slug})")
-    print_success(f"Generated candidates: {len(candidates)}")
-    print_success(
-        f"Classified => weak:{len(categorized['weak'])} "
-        f"medium:{len(categorized['medium'])} strong:{len(categorized['strong'])}"
-    )
-    print_success(f"Engine used: {engine.last_mode} with {args.workers} worker(s)")
-    print_success(f"Wordlists saved at: {wordlist_paths['full'].parent}")
-    print_success(f"Summary saved: {summary_path}")
-    print_success(f"Report saved: {report_path}")
-    if nano_ai_tips:
-        print_info("Nano AI top guidance:")
-        for tip in nano_ai_tips[:3]:
-            print_info(f"- {tip}")
+        metrics = RunMetrics(subject_slug, engine, profiler)
+        emitter = MetricsEmitter(args.metrics_file, metrics.families, args.metrics_interval, logger).start()
+    # From here on Ctrl-C drains the engines and keeps partial results.
+    signal.signal(signal.SIGINT, partial(request_stop, cancellation))
+    try:
+        return run_assessments(
+            args, profile, compiled, subject_slug, paths, logger, candidates, engine, cancellation, profiler, metrics
+        )
+    finally:
+        engine.close()
+        if emitter is not None:
+            emitter.close()
+        if dump is not None:
+            dump.disable()
+            dump.dump_stats(args.profile_dump)
+            print_info(f"cProfile dump saved: {args.profile_dump} (main process only)")
 
-    logger.info("Run completed. weak=%d medium=%d strong=%d", summary.weak_count, summary.medium_count, summary.strong_count)
-    return 0
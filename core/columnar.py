@@ -0,0 +1,259 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from .models import PasswordAssessment
+
+COLUMNAR_MAGIC = b"VXCOL\x00\x01\x00"
+COLUMNAR_SUFFIX = ".vxcol"
+ARROW_SUFFIX = ".arrow"
+ARROW_BATCH_ROWS = 65536
+LIST_COLUMNS = ("reasons", "policy_violations", "suggestions")
+
+
+def _load_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+
+class _Dictionary:
+    def __init__(self):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class ColumnarAssessmentWriter:
+    # Rows are appended into typed arrays, so memory stays close to the final
+    # file size: numbers are fixed width and repeated strings become small
+    # dictionary codes. The file itself is written once, in close().
+
+    def __init__(self, reports_dir: Path, stem: str = "password-audit", prefer_arrow: bool = True):
+        self.reports_dir = reports_dir
+        self.stem = stem
+        self.prefer_arrow = prefer_arrow
+        self.rows = 0
+        self.score = array("B")
+        self.entropy_bits = array("f")
+        self.password_offsets = array("q", [0])
+        self.password_data = bytearray()
+        self.classification = array("B")
+        self.classification_dictionary = _Dictionary()
+        self.list_offsets = {name: array("i", [0]) for name in LIST_COLUMNS}
+        self.list_codes = {name: array("H") for name in LIST_COLUMNS}
+        self.list_dictionaries = {name: _Dictionary() for name in LIST_COLUMNS}
+
+    def write(self, assessment: PasswordAssessment):
+        self.score.append(assessment.score)
+        self.entropy_bits.append(assessment.entropy_bits)
+        self.password_data += assessment.password.encode("utf-8")
+        self.password_offsets.append(len(self.password_data))
+        self.classification.append(self.classification_dictionary.code(assessment.classification))
+        for name in LIST_COLUMNS:
+            codes = self.list_codes[name]
+            dictionary = self.list_dictionaries[name]
+            for value in getattr(assessment, name):
+                codes.append(dictionary.code(value))
+            self.list_offsets[name].append(len(codes))
+        self.rows += 1
+
+    def close(self) -> Path:
+        pyarrow = _load_pyarrow() if self.prefer_arrow else None
+        if pyarrow is not None:
+            return self._write_arrow(pyarrow)
+        return self._write_packed()
+
+    def _write_arrow(self, pa) -> Path:
+        path = self.reports_dir / f"{self.stem}{ARROW_SUFFIX}"
+
+        def dictionary_array(codes: array, index_type, dictionary: _Dictionary, length: int):
+            indices = pa.Array.from_buffers(index_type, length, [None, pa.py_buffer(codes)])
+            return pa.DictionaryArray.from_arrays(indices, pa.array(dictionary.values, type=pa.string()))
+
+        columns = {
+            "password": pa.Array.from_buffers(
+                pa.large_string(),
+                self.rows,
+                [None, pa.py_buffer(self.password_offsets), pa.py_buffer(bytes(self.password_data))],
+            ),
+            "score": pa.Array.from_buffers(pa.uint8(), self.rows, [None, pa.py_buffer(self.score)]),
+            "entropy_bits": pa.Array.from_buffers(pa.float32(), self.rows, [None, pa.py_buffer(self.entropy_bits)]),
+            "classification": dictionary_array(
+                self.classification, pa.uint8(), self.classification_dictionary, self.rows
+            ),
+        }
+        for name in LIST_COLUMNS:
+            codes = self.list_codes[name]
+            values = dictionary_array(codes, pa.uint16(), self.list_dictionaries[name], len(codes))
+            offsets = pa.Array.from_buffers(pa.int32(), self.rows + 1, [None, pa.py_buffer(self.list_offsets[name])])
+            columns[name] = pa.ListArray.from_arrays(offsets, values)
+
+        table = pa.table(columns)
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=ARROW_BATCH_ROWS)
+        return path
+
+    def _write_packed(self) -> Path:
+        path = self.reports_dir / f"{self.stem}{COLUMNAR_SUFFIX}"
+        buffers: list[bytes] = []
+        offset = 0
+
+        def add_buffer(data) -> dict:
+            nonlocal offset
+            raw = bytes(data)
+            entry = {
+                "format": data.typecode if isinstance(data, array) else "B",
+                "offset": offset,
+                "length": len(raw),
+            }
+            padding = -len(raw) % 8
+            buffers.append(raw + b"\0" * padding)
+            offset += len(raw) + padding
+            return entry
+
+        columns = {
+            "password": {
+                "kind": "string",
+                "offsets": add_buffer(self.password_offsets),
+                "data": add_buffer(self.password_data),
+            },
+            "score": {"kind": "numeric", "values": add_buffer(self.score)},
+            "entropy_bits": {"kind": "numeric", "values": add_buffer(self.entropy_bits)},
+            "classification": {
+                "kind": "dictionary",
+                "codes": add_buffer(self.classification),
+                "dictionary": self.classification_dictionary.values,
+            },
+        }
+        for name in LIST_COLUMNS:
+            columns[name] = {
+                "kind": "list_dictionary",
+                "offsets": add_buffer(self.list_offsets[name]),
+                "codes": add_buffer(self.list_codes[name]),
+                "dictionary": self.list_dictionaries[name].values,
+            }
+
+        header = json.dumps(
+            {"rows": self.rows, "byteorder": sys.byteorder, "columns": columns},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        header += b" " * (-(len(COLUMNAR_MAGIC) + 8 + len(header)) % 8)
+        with path.open("wb") as handle:
+            handle.write(COLUMNAR_MAGIC)
+            handle.write(struct.pack("<Q", len(header)))
+            handle.write(header)
+            for buffer in buffers:
+                handle.write(buffer)
+        return path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+
+
+class ColumnarTable:
+    # Zero-copy view over a packed file: every column is a memoryview into a
+    # shared read-only mmap (numpy.frombuffer can wrap these without copying).
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = view = memoryview(self._mmap)
+        if bytes(view[: len(COLUMNAR_MAGIC)]) != COLUMNAR_MAGIC:
+            raise ValueError(f"Not a columnar assessment file: {path}")
+        (header_length,) = struct.unpack_from("<Q", view, len(COLUMNAR_MAGIC))
+        data_start = len(COLUMNAR_MAGIC) + 8
+        header = json.loads(bytes(view[data_start : data_start + header_length]))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"Columnar file was written on a {header['byteorder']}-endian host")
+        self.rows: int = header["rows"]
+        self.columns: dict = header["columns"]
+        self._body = view[data_start + header_length :]
+        # Every view handed out, keyed by offset, so each buffer is sliced once
+        # and close() can release them all.
+        self._views: dict[int, memoryview] = {}
+
+    def _buffer(self, entry: dict) -> memoryview:
+        view = self._views.get(entry["offset"])
+        if view is None:
+            raw = self._body[entry["offset"] : entry["offset"] + entry["length"]]
+            if entry["format"] == "B":
+                view = raw
+            else:
+                view = raw.cast(entry["format"])
+                raw.release()
+            self._views[entry["offset"]] = view
+        return view
+
+    def numeric(self, name: str) -> memoryview:
+        return self._buffer(self.columns[name]["values"])
+
+    def categorical(self, name: str) -> tuple[memoryview, list[str]]:
+        column = self.columns[name]
+        return self._buffer(column["codes"]), column["dictionary"]
+
+    def list_categorical(self, name: str) -> tuple[memoryview, memoryview, list[str]]:
+        column = self.columns[name]
+        return self._buffer(column["offsets"]), self._buffer(column["codes"]), column["dictionary"]
+
+    def password(self, row: int) -> str:
+        column = self.columns["password"]
+        offsets = self._buffer(column["offsets"])
+        data = self._buffer(column["data"])
+        return bytes(data[offsets[row] : offsets[row + 1]]).decode("utf-8")
+
+    def row(self, row: int) -> PasswordAssessment:
+        codes, dictionary = self.categorical("classification")
+        lists = {}
+        for name in LIST_COLUMNS:
+            offsets, list_codes, list_dictionary = self.list_categorical(name)
+            lists[name] = [list_dictionary[code] for code in list_codes[offsets[row] : offsets[row + 1]]]
+        return PasswordAssessment(
+            password=self.password(row),
+            score=self.numeric("score")[row],
+            entropy_bits=round(self.numeric("entropy_bits")[row], 2),
+            classification=dictionary[codes[row]],
+            **lists,
+        )
+
+    def close(self):
+        # Views from numeric()/categorical()/list_categorical() are released
+        # too, so using one after close raises ValueError. A view that is still
+        # exported elsewhere (numpy.frombuffer) cannot be released; it keeps
+        # the mapping alive until it is garbage collected.
+        for view in (*self._views.values(), self._body, self._view):
+            try:
+                view.release()
+            except BufferError:
+                pass
+        self._views.clear()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+
+def load_columnar(path: Path):
+    if path.suffix == ARROW_SUFFIX:
+        pyarrow = _load_pyarrow()
+        if pyarrow is None:
+            raise RuntimeError("pyarrow is required to read Arrow IPC files")
+        return pyarrow.ipc.open_file(pyarrow.memory_map(str(path), "r")).read_all()
+    return ColumnarTable(path)
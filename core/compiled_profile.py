@@ -0,0 +1,86 @@
+import hashlib
+import re
+from dataclasses import dataclass
+
+from .config import LEET_MAP
+from .models import SubjectProfile
+
+MIN_MATCH_TOKEN_LENGTH = 3
+LEET_REVERSE = str.maketrans(
+    {replacement: source for source, replacements in LEET_MAP.items() for replacement in replacements}
+)
+
+
+def normalize_subject_tokens(subject_tokens: tuple[str, ...] | set[str] | list[str]) -> tuple[str, ...]:
+    normalized = {
+        token.strip().lower()
+        for token in subject_tokens
+        if token and len(token.strip()) >= MIN_MATCH_TOKEN_LENGTH
+    }
+    return tuple(sorted(normalized))
+
+
+def _matcher(tokens: tuple[str, ...]) -> re.Pattern | None:
+    # One alternation instead of a Python loop of substring tests per password.
+    if not tokens:
+        return None
+    return re.compile("|".join(re.escape(token) for token in sorted(tokens, key=len, reverse=True)))
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    # Everything the generator, validator and evaluator derive from a
+    # SubjectProfile, computed once. Immutable and picklable, so engines can
+    # install it in each worker once (see core.engine.shared) and per-item
+    # tasks only carry its fingerprint.
+    raw_tokens: tuple[str, ...]
+    tokens: tuple[str, ...]
+    leet_tokens: tuple[str, ...]
+    birth_year: int | None
+    fingerprint: str
+    token_matcher: re.Pattern | None
+    leet_matcher: re.Pattern | None
+
+    def matches(self, lowered: str) -> bool:
+        # lowered must already be lowercase. Leet spellings ("4l1c3") are
+        # matched against the tokens after mapping both back to letters.
+        if self.token_matcher is None:
+            return False
+        if self.token_matcher.search(lowered):
+            return True
+        if self.leet_matcher is None:
+            return False
+        return self.leet_matcher.search(lowered.translate(LEET_REVERSE)) is not None
+
+
+def compile_tokens(
+    raw_tokens: tuple[str, ...] | set[str] | list[str], birth_year: int | None = None
+) -> CompiledProfile:
+    raw = tuple(sorted({token.strip() for token in raw_tokens if token and token.strip()}))
+    tokens = normalize_subject_tokens(raw)
+    # Digit-only tokens (years, phone suffixes) are left out of the leet
+    # matcher, where they would turn into letters and match unrelated words.
+    leet_tokens = tuple(
+        sorted({token.translate(LEET_REVERSE) for token in tokens if any(ch.isalpha() for ch in token)})
+    )
+    digest = hashlib.blake2b(digest_size=12)
+    for token in raw:
+        digest.update(token.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(str(birth_year or "").encode("ascii"))
+    return CompiledProfile(
+        raw_tokens=raw,
+        tokens=tokens,
+        leet_tokens=leet_tokens,
+        birth_year=birth_year,
+        fingerprint=digest.hexdigest(),
+        token_matcher=_matcher(tokens),
+        leet_matcher=_matcher(leet_tokens),
+    )
+
+
+def compile_profile(profile: SubjectProfile) -> CompiledProfile:
+    return compile_tokens(profile.all_tokens(), profile.birth_year)
+
+
+EMPTY_PROFILE = compile_tokens(())
@@ -1,13 +1,32 @@
 import os
 from pathlib import Path
 
+from .engine.runtime import effective_cpu_count
+
 DEFAULT_MIN_LENGTH = 4
 DEFAULT_MAX_LENGTH = 20
 DEFAULT_POLICY_MIN_LENGTH = 12
+DEFAULT_SAMPLE_PRECISION = 0.005
+DEFAULT_SAMPLE_CONFIDENCE = 0.95
+DEFAULT_WHAT_IF_POLICIES = "10,12,14,10-symbol,12-symbol,14-symbol"
 DEFAULT_MAX_CANDIDATES = 50000
 DEFAULT_ENGINE = "auto"
-DEFAULT_WORKERS = max(2, os.cpu_count() or 2)
+ENGINE_MODES = ("auto", "async", "threading", "parallel", "hybrid", "distributed")
+# Sized by the CPUs this process may actually use (affinity and cgroup
+# quota), not the host total a container would otherwise see.
+DEFAULT_WORKERS = max(2, effective_cpu_count()[0])
 DEFAULT_OUTPUT_ROOT = Path("output")
+AUDIT_FORMATS = ("json", "ndjson")
+HOST_DEFAULTS_ENV = "VICTIMATOR_X_HOST_DEFAULTS"
+
+LEET_MAP = {
+    "a": ["4", "@"],
+    "e": ["3"],
+    "i": ["1", "!"],
+    "o": ["0"],
+    "s": ["5", "$"],
+    "t": ["7"],
+}
 
 COMMON_WEAK_PASSWORDS = {
     "123456",
@@ -41,3 +60,40 @@ COMMON_WEAK_PASSWORDS = {
     "superman",
     "hello123",
 }
+
+
+def host_defaults_path() -> Path:
+    override = os.environ.get(HOST_DEFAULTS_ENV)
+    if override:
+        return Path(override)
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config_home) / "victimator-x" / "host-defaults.json"
+
+
+def load_host_defaults() -> dict:
+    # Engine settings saved by `--self-check --perf --save-host-defaults`.
+    # Anything missing or malformed is ignored so a bad file never blocks a run.
+    import json
+
+    try:
+        data = json.loads(host_defaults_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    defaults = {}
+    if data.get("engine") in ENGINE_MODES:
+        defaults["engine"] = data["engine"]
+    for key in ("workers", "threads_per_worker"):
+        if isinstance(data.get(key), int) and data[key] >= 1:
+            defaults[key] = data[key]
+    return defaults
+
+
+def save_host_defaults(values: dict) -> Path:
+    import json
+
+    path = host_defaults_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(values, indent=2) + "\n", encoding="utf-8")
+    return path
@@ -1,3 +1,36 @@
-from .coordinator import EngineCoordinator
+from importlib import import_module
 
-__all__ = ["EngineCoordinator"]
+# Engines pull in asyncio, concurrent.futures and multiprocessing, so exports
+# resolve on first attribute access instead of at package import.
+_EXPORTS = {
+    "CancellationToken": ".cancellation",
+    "ChunkCheckpoint": ".checkpoint",
+    "DistributedSettings": ".distributed_engine",
+    "EngineCoordinator": ".coordinator",
+    "EngineProgress": ".streaming",
+    "ItemError": ".streaming",
+    "run_worker": ".distributed_engine",
+}
+
+__all__ = [
+    "CancellationToken",
+    "ChunkCheckpoint",
+    "DistributedSettings",
+    "EngineCoordinator",
+    "EngineProgress",
+    "ItemError",
+    "run_worker",
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
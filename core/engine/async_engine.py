@@ -1,31 +1,91 @@
 import asyncio
-from collections.abc import Callable, Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from .cancellation import CancellationToken, is_cancelled
+from .defaults import WORKER_THREAD_PREFIX
 
 
 class AsyncEngine:
     def __init__(self, workers: int):
         self.workers = max(1, workers)
 
-    async def _map_async(self, func: Callable, values: list):
-        semaphore = asyncio.Semaphore(self.workers)
+    def _drain(self, loop: asyncio.AbstractEventLoop, futures: list, ordered: bool, timeout: float):
+        if not futures:
+            return
+        loop.run_until_complete(asyncio.wait(futures, timeout=timeout))
+        for future in futures:
+            if future.done():
+                yield future.result()
+            elif ordered:
+                break
+        for future in futures:
+            future.cancel()
 
-        async def wrapped(item):
-            async with semaphore:
-                return await asyncio.to_thread(func, item)
+    def _drive(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        func: Callable,
+        items: Iterable,
+        ordered: bool,
+        cancel: CancellationToken | None,
+    ):
+        # The window of in-flight tasks plays the role of the former semaphore.
+        iterator = iter(items)
 
-        tasks = [wrapped(item) for item in values]
-        return await asyncio.gather(*tasks)
+        def submit(item):
+            return loop.run_in_executor(None, func, item)
 
-    def map(self, func: Callable, items: Iterable):
-        values = list(items)
-        if not values:
-            return []
+        def take(count: int) -> list:
+            if is_cancelled(cancel):
+                return []
+            return list(islice(iterator, count))
+
+        if ordered:
+            queue = deque(submit(item) for item in take(self.workers))
+            while queue:
+                if is_cancelled(cancel):
+                    yield from self._drain(loop, list(queue), True, cancel.drain_timeout)
+                    return
+                result = loop.run_until_complete(queue.popleft())
+                for item in take(1):
+                    queue.append(submit(item))
+                yield result
+            return
+
+        pending = {submit(item) for item in take(self.workers)}
+        while pending:
+            if is_cancelled(cancel):
+                yield from self._drain(loop, list(pending), False, cancel.drain_timeout)
+                return
+            done, pending = loop.run_until_complete(
+                asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            )
+            for item in take(len(done)):
+                pending.add(submit(item))
+            for future in done:
+                yield future.result()
+
+    def imap(
+        self,
+        func: Callable,
+        items: Iterable,
+        ordered: bool = True,
+        cancel: CancellationToken | None = None,
+    ) -> Iterator:
+        loop = asyncio.new_event_loop()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=WORKER_THREAD_PREFIX)
+        loop.set_default_executor(executor)
         try:
-            return asyncio.run(self._map_async(func, values))
-        except RuntimeError:
-            # Fallback for environments where an event loop is already running.
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(self._map_async(func, values))
-            finally:
-                loop.close()
+            yield from self._drive(loop, func, items, ordered, cancel)
+        finally:
+            executor.shutdown(wait=True)
+            loop.close()
+
+    def imap_unordered(self, func: Callable, items: Iterable) -> Iterator:
+        return self.imap(func, items, ordered=False)
+
+    def map(self, func: Callable, items: Iterable):
+        return list(self.imap(func, items))
@@ -0,0 +1,40 @@
+import signal
+import threading
+import time
+
+DEFAULT_DRAIN_TIMEOUT = 5.0
+
+
+class CancellationToken:
+    def __init__(self, time_budget: float | None = None, drain_timeout: float = DEFAULT_DRAIN_TIMEOUT):
+        self._event = threading.Event()
+        self.reason: str | None = None
+        self.drain_timeout = max(0.0, drain_timeout)
+        self.deadline = time.monotonic() + time_budget if time_budget else None
+
+    def cancel(self, reason: str = "cancelled"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel("time-budget")
+            return True
+        return False
+
+    def drain_deadline(self) -> float:
+        return time.monotonic() + self.drain_timeout
+
+
+def is_cancelled(token: CancellationToken | None) -> bool:
+    return token is not None and token.cancelled
+
+
+def ignore_interrupts():
+    # Worker processes share the terminal's process group, so Ctrl-C would
+    # otherwise kill them mid-chunk before the parent can drain cleanly.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
@@ -0,0 +1,78 @@
+import os
+import pickle
+from pathlib import Path
+
+from .defaults import DEFAULT_CHECKPOINT_CHUNK
+
+CHECKPOINT_VERSION = 1
+
+
+class ChunkCheckpoint:
+    # Append-only file of pickled frames: a header followed by one
+    # (chunk_index, results) frame per completed chunk. A torn final frame from
+    # a crash is discarded on load, so resume restarts at that chunk.
+
+    def __init__(self, path: Path, fingerprint: str, chunk_size: int = DEFAULT_CHECKPOINT_CHUNK):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.chunk_size = max(1, chunk_size)
+        self._handle = None
+        self._valid_offset = 0
+
+    def _header(self) -> dict:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "fingerprint": self.fingerprint,
+            "chunk_size": self.chunk_size,
+        }
+
+    def load(self) -> list[list]:
+        if not self.path.exists():
+            return []
+        chunks: list[list] = []
+        valid_offset = 0
+        with self.path.open("rb") as handle:
+            try:
+                header = pickle.load(handle)
+            except Exception:
+                return []
+            if header != self._header():
+                return []
+            valid_offset = handle.tell()
+            while True:
+                try:
+                    index, results = pickle.load(handle)
+                except Exception:
+                    break
+                if index != len(chunks):
+                    break
+                chunks.append(results)
+                valid_offset = handle.tell()
+        self._valid_offset = valid_offset
+        return chunks
+
+    def open(self, resume: bool):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self._valid_offset:
+            self._handle = self.path.open("r+b")
+            self._handle.truncate(self._valid_offset)
+            self._handle.seek(self._valid_offset)
+            return
+        self._handle = self.path.open("wb")
+        pickle.dump(self._header(), self._handle, protocol=pickle.HIGHEST_PROTOCOL)
+        self._sync()
+
+    def append(self, index: int, results: list):
+        pickle.dump((index, results), self._handle, protocol=pickle.HIGHEST_PROTOCOL)
+        self._sync()
+
+    def _sync(self):
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def close(self, completed: bool = False):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if completed:
+            self.path.unlink(missing_ok=True)
@@ -1,54 +1,271 @@
-from collections.abc import Callable, Iterable
-from logging import Logger
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from itertools import chain, islice
+from typing import TYPE_CHECKING
 
-from .async_engine import AsyncEngine
-from .parallel_engine import ParallelEngine
+from .cancellation import CancellationToken, is_cancelled
+from .checkpoint import ChunkCheckpoint
+from .defaults import DEFAULT_THREADS_PER_WORKER
+from .runtime import FREE_THREADED, FREE_THREADING_REASON
+from .shared import install_shared
+from .streaming import ItemError, ProgressCallback, ProgressTracker, guarded_call
 from .threading_engine import ThreadingEngine
 
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from .distributed_engine import DistributedEngine, DistributedSettings
+
+PARALLEL_THRESHOLD = 15000
+THREADING_THRESHOLD = 2000
+MAX_LOGGED_ITEM_ERRORS = 5
+PROCESS_MODES = ("parallel", "hybrid")
+WARM_MODES = ("threading", "parallel", "hybrid")
+
 
 class EngineCoordinator:
-    def __init__(self, mode: str, workers: int, logger: Logger | None = None):
+    def __init__(
+        self,
+        mode: str,
+        workers: int,
+        logger: "Logger | None" = None,
+        progress_interval: float = 0.5,
+        distributed: "DistributedSettings | None" = None,
+        cancellation: CancellationToken | None = None,
+        threads_per_worker: int = DEFAULT_THREADS_PER_WORKER,
+        keep_warm: bool = False,
+        shared: tuple = (),
+    ):
+        # shared: read-only objects (see engine.shared) installed once in this
+        # process and in every worker this coordinator starts.
         self.requested_mode = mode
         self.workers = max(1, workers)
         self.logger = logger
         self.last_mode = mode
+        self.progress_interval = progress_interval
+        self.distributed = distributed
+        self.cancellation = cancellation
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.mode_reason = ""
+        self.keep_warm = keep_warm
+        self.shared = tuple(shared)
+        install_shared(self.shared)
+        self._cluster: "DistributedEngine | None" = None
+        self._warm: dict = {}
+        self._pending: dict[int, object] = {}
+        self.failed_items = 0
+        self.resumed_items = 0
 
-    def _resolve_mode(self, item_count: int) -> str:
+    def describe_mode(self, item_count: int) -> tuple[str, str]:
         if self.requested_mode != "auto":
-            return self.requested_mode
-        if item_count > 15000:
-            return "parallel"
-        if item_count > 2000:
-            return "threading"
-        return "async"
+            mode, reason = self.requested_mode, "requested explicitly"
+        elif item_count > PARALLEL_THRESHOLD:
+            mode, reason = "parallel", f"auto: more than {PARALLEL_THRESHOLD} items"
+        elif item_count > THREADING_THRESHOLD:
+            mode, reason = "threading", f"auto: more than {THREADING_THRESHOLD} items"
+        else:
+            mode, reason = "async", f"auto: {THREADING_THRESHOLD} items or fewer"
+
+        if mode in PROCESS_MODES and FREE_THREADED:
+            # Threads already run Python code in parallel here, so skip the
+            # process pool and its pickling overhead entirely.
+            return "threading", f"{reason}; {mode} replaced by threads on a {FREE_THREADING_REASON}"
+        return mode, reason
+
+    def _resolve_mode(self, item_count: int) -> str:
+        mode, self.mode_reason = self.describe_mode(item_count)
+        return mode
 
     def _engine_for_mode(self, mode: str):
+        # With keep_warm, pool-backed engines are started once and reused by
+        # every later imap, so long-lived callers such as --watch do not pay
+        # pool startup per batch.
+        if self.keep_warm and mode in WARM_MODES:
+            if mode not in self._warm:
+                self._warm[mode] = self._new_engine(mode).start()
+            return self._warm[mode]
+        return self._new_engine(mode)
+
+    def _new_engine(self, mode: str):
+        # Engines other than threading (also the fallback) are imported on
+        # first use, so runs that never select them skip asyncio and
+        # multiprocessing entirely.
         if mode == "threading":
             return ThreadingEngine(self.workers)
         if mode == "async":
+            from .async_engine import AsyncEngine
+
             return AsyncEngine(self.workers)
         if mode == "parallel":
-            return ParallelEngine(self.workers)
+            from .parallel_engine import ParallelEngine
+
+            return ParallelEngine(self.workers, shared=self.shared)
+        if mode == "hybrid":
+            from .hybrid_engine import HybridEngine
+
+            return HybridEngine(self.workers, self.threads_per_worker, shared=self.shared)
+        if mode == "distributed":
+            from .distributed_engine import DistributedEngine, DistributedSettings
+
+            # The cluster outlives a single map so remote workers stay connected
+            # across the candidate and audit passes of one run.
+            if self._cluster is None:
+                self._cluster = DistributedEngine(self.distributed or DistributedSettings(), shared=self.shared)
+                self._cluster.start()
+                if self.logger:
+                    self.logger.info("Distributed coordinator listening on %s", self._cluster.address)
+            return self._cluster
         raise ValueError(f"Unknown engine mode: {mode}")
 
-    def map(self, func: Callable, items: Iterable):
-        values = list(items)
-        if not values:
-            self.last_mode = "none"
-            return []
+    @property
+    def in_flight(self) -> int:
+        # Items handed to the engine whose results have not come back yet.
+        return len(self._pending)
+
+    def _probe(self, items: Iterable, batch_size: int = 1) -> tuple[int, Iterator]:
+        # Auto mode only needs to know whether the input crosses the parallel
+        # threshold, so at most PARALLEL_THRESHOLD + 1 inputs are buffered.
+        iterator = iter(items)
+        limit = PARALLEL_THRESHOLD // batch_size + 1 if self.requested_mode == "auto" else 1
+        head = list(islice(iterator, limit))
+        return len(head), chain(head, iterator)
+
+    def _record_error(self, error: ItemError):
+        self.failed_items += 1
+        if self.logger and self.failed_items <= MAX_LOGGED_ITEM_ERRORS:
+            self.logger.warning(
+                "Item %d failed with %s: %s", error.index, error.error_type, error.message
+            )
+        elif self.logger:
+            self.logger.debug("Item %d failed with %s: %s", error.index, error.error_type, error.message)
+
+    def _isolated(self, func: Callable, values: Iterable, mode: str, ordered: bool, start: int) -> Iterator:
+        # Items are tagged with their input index and tracked until their result
+        # comes back. If the engine itself breaks, only the items still in flight
+        # plus the untouched remainder are rerun on the threading engine.
+        call = partial(guarded_call, func)
+        pending: dict[int, object] = {}
+        self._pending = pending
+        source = enumerate(values, start)
+
+        def feed(indexed: Iterable) -> Iterator:
+            for index, item in indexed:
+                pending[index] = item
+                yield index, item
 
-        mode = self._resolve_mode(len(values))
-        self.last_mode = mode
-        engine = self._engine_for_mode(mode)
         try:
-            return engine.map(func, values)
+            engine = self._engine_for_mode(mode)
+            for index, result in engine.imap(call, feed(source), ordered=ordered, cancel=self.cancellation):
+                pending.pop(index, None)
+                yield result
+            return
         except Exception as error:
+            if is_cancelled(self.cancellation):
+                raise
+            broken = self._warm.pop(mode, None)
+            if broken is not None:
+                broken.close()
             if self.logger:
                 self.logger.warning(
-                    "Engine '%s' failed (%s). Falling back to threading.",
+                    "Engine '%s' failed (%s). Falling back to threading for %d unfinished item(s) and the rest of the input.",
                     mode,
                     error,
+                    len(pending),
                 )
-            self.last_mode = "threading-fallback"
-            fallback = ThreadingEngine(self.workers)
-            return fallback.map(func, values)
+
+        self.last_mode = "threading-fallback"
+        self.mode_reason = f"{mode} engine failed mid-run"
+        remaining = sorted(pending.items())
+        pending.clear()
+        fallback = ThreadingEngine(self.workers)
+        for index, result in fallback.imap(
+            call,
+            feed(chain(remaining, source)),
+            ordered=ordered,
+            cancel=self.cancellation,
+        ):
+            pending.pop(index, None)
+            yield result
+
+    def imap(
+        self,
+        func: Callable,
+        items: Iterable,
+        ordered: bool = True,
+        progress: ProgressCallback | None = None,
+        checkpoint: ChunkCheckpoint | None = None,
+        resume: bool = False,
+        batch_size: int = 1,
+    ) -> Iterator:
+        # batch_size tells auto mode how many inputs each item stands for when
+        # func consumes pre-chunked batches.
+        self.failed_items = 0
+        self.resumed_items = 0
+        batch_size = max(1, batch_size)
+        count, values = self._probe(items, batch_size)
+        if count == 0:
+            self.last_mode = "none"
+            return
+
+        mode = self._resolve_mode(count * batch_size)
+        self.last_mode = mode
+        tracker = ProgressTracker(progress, mode=mode, interval=self.progress_interval)
+
+        start = 0
+        if checkpoint is not None:
+            # Checkpoints record a contiguous prefix, which needs ordered output.
+            ordered = True
+            restored = checkpoint.load() if resume else []
+            checkpoint.open(resume=bool(restored))
+            for chunk in restored:
+                for result in chunk:
+                    if isinstance(result, ItemError):
+                        self.failed_items += 1
+                    tracker.advance()
+                    yield result
+            start = len(restored) * checkpoint.chunk_size
+            self.resumed_items = start
+            values = islice(values, start, None)
+            if self.logger and restored:
+                self.logger.info("Resumed %d completed item(s) from %s", start, checkpoint.path)
+
+        completed = False
+        chunk: list = []
+        chunk_index = start // checkpoint.chunk_size if checkpoint else 0
+        try:
+            for result in self._isolated(func, values, mode, ordered, start):
+                if isinstance(result, ItemError):
+                    self._record_error(result)
+                if checkpoint is not None:
+                    chunk.append(result)
+                    if len(chunk) >= checkpoint.chunk_size:
+                        checkpoint.append(chunk_index, chunk)
+                        chunk_index += 1
+                        chunk = []
+                tracker.advance()
+                yield result
+            # A cancelled pass keeps its checkpoint so --resume can pick it up.
+            completed = not is_cancelled(self.cancellation)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close(completed=completed)
+        tracker.finish()
+
+    def imap_unordered(
+        self,
+        func: Callable,
+        items: Iterable,
+        progress: ProgressCallback | None = None,
+    ) -> Iterator:
+        return self.imap(func, items, ordered=False, progress=progress)
+
+    def map(self, func: Callable, items: Iterable, progress: ProgressCallback | None = None):
+        return list(self.imap(func, items, progress=progress))
+
+    def close(self):
+        for engine in self._warm.values():
+            engine.close()
+        self._warm.clear()
+        if self._cluster is not None:
+            self._cluster.close()
+            self._cluster = None
@@ -0,0 +1,7 @@
+# Kept free of heavy imports so the CLI can build its parser without loading
+# any engine.
+DEFAULT_THREADS_PER_WORKER = 4
+DEFAULT_CHECKPOINT_CHUNK = 2000
+DEFAULT_LISTEN_ADDRESS = "127.0.0.1:0"
+AUTHKEY_ENV = "VICTIMATOR_X_AUTHKEY"
+WORKER_THREAD_PREFIX = "vx-worker"
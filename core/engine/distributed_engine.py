@@ -0,0 +1,378 @@
+import multiprocessing
+import os
+import pickle
+import queue
+import socket
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+from multiprocessing.connection import Client, Connection, Listener
+
+from .cancellation import CancellationToken, ignore_interrupts, is_cancelled
+from .defaults import DEFAULT_LISTEN_ADDRESS
+from .shared import install_shared
+from .streaming import iter_chunks
+
+DEFAULT_DISTRIBUTED_CHUNK_SIZE = 256
+
+# Wire protocol (pickled tuples over an HMAC-authenticated connection):
+#   worker -> coordinator: ("hello", host, pid) | ("heartbeat",)
+#                          ("result", chunk_id, blob) | ("error", chunk_id, message)
+#   coordinator -> worker: ("job", job_id, blob) | ("chunk", job_id, chunk_id, blob)
+#                          ("shutdown",)
+# Blobs are zlib-compressed pickles so chunks and results stay compact on the wire.
+# A job blob is (shared objects, func); workers install the shared objects once.
+
+
+@dataclass
+class DistributedSettings:
+    listen: str = DEFAULT_LISTEN_ADDRESS
+    authkey: bytes | None = None
+    local_workers: int = 0
+    chunk_size: int = DEFAULT_DISTRIBUTED_CHUNK_SIZE
+    heartbeat_interval: float = 2.0
+    heartbeat_timeout: float = 15.0
+    worker_wait_timeout: float = 30.0
+
+
+def parse_address(value: str) -> tuple[str | tuple[str, int], str]:
+    text = value.strip()
+    if text.startswith("unix:"):
+        return text[len("unix:") :], "AF_UNIX"
+    host, separator, port = text.rpartition(":")
+    if not separator or not port.isdigit():
+        raise ValueError(f"Invalid address '{value}'. Use host:port or unix:/path/to/socket")
+    return (host or "127.0.0.1", int(port)), "AF_INET"
+
+
+def format_address(address) -> str:
+    if isinstance(address, tuple):
+        return f"{address[0]}:{address[1]}"
+    return f"unix:{address}"
+
+
+def _pack(value) -> bytes:
+    return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def _unpack(blob: bytes):
+    return pickle.loads(zlib.decompress(blob))
+
+
+def run_worker(
+    address: str,
+    authkey: bytes,
+    heartbeat_interval: float = 2.0,
+    connect_timeout: float = 30.0,
+) -> int:
+    target, family = parse_address(address)
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            conn = Client(target, family=family, authkey=authkey)
+            break
+        except (ConnectionRefusedError, FileNotFoundError):
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+
+    send_lock = threading.Lock()
+
+    def send(message):
+        with send_lock:
+            conn.send(message)
+
+    def heartbeat(stop: threading.Event):
+        while not stop.wait(heartbeat_interval):
+            try:
+                send(("heartbeat",))
+            except OSError:
+                return
+
+    processed = 0
+    jobs: dict[int, Callable] = {}
+    try:
+        send(("hello", socket.gethostname(), os.getpid()))
+        while True:
+            message = conn.recv()
+            kind = message[0]
+            if kind == "shutdown":
+                break
+            if kind == "job":
+                shared, func = _unpack(message[2])
+                install_shared(shared)
+                jobs = {message[1]: func}
+                continue
+            if kind != "chunk":
+                continue
+
+            _, job_id, chunk_id, blob = message
+            func = jobs[job_id]
+            stop = threading.Event()
+            beat = threading.Thread(target=heartbeat, args=(stop,), daemon=True)
+            beat.start()
+            try:
+                results = [func(item) for item in _unpack(blob)]
+                reply = ("result", chunk_id, _pack(results))
+            except Exception as error:
+                reply = ("error", chunk_id, f"{type(error).__name__}: {error}")
+            finally:
+                stop.set()
+                beat.join()
+            send(reply)
+            processed += 1
+    except (EOFError, ConnectionResetError, BrokenPipeError):
+        pass
+    finally:
+        conn.close()
+    return processed
+
+
+def _run_local_worker(address: str, authkey: bytes, heartbeat_interval: float):
+    ignore_interrupts()
+    run_worker(address, authkey, heartbeat_interval)
+
+
+@dataclass
+class _Task:
+    job_id: int
+    chunk_id: int
+    blob: bytes
+
+
+class DistributedEngine:
+    def __init__(self, settings: DistributedSettings, shared: tuple = ()):
+        self.settings = settings
+        self.shared = shared
+        self.authkey = settings.authkey or os.urandom(32)
+        self._listener: Listener | None = None
+        self._closed = threading.Event()
+        self._lock = threading.Lock()
+        self._tasks: deque[_Task] = deque()
+        self._task_ready = threading.Condition(self._lock)
+        self._results: queue.Queue = queue.Queue()
+        self._job_id = 0
+        self._job_blob = b""
+        self._connections: set[Connection] = set()
+        self._local_processes: list = []
+        self.workers_seen = 0
+        self.reassigned_chunks = 0
+
+    @property
+    def address(self) -> str:
+        if self._listener is None:
+            return self.settings.listen
+        return format_address(self._listener.address)
+
+    @property
+    def connected_workers(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+    def start(self):
+        if self._listener is not None:
+            return
+        target, family = parse_address(self.settings.listen)
+        self._listener = Listener(target, family=family, authkey=self.authkey)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        self._spawn_local_workers(self.settings.local_workers)
+
+    def _spawn_local_workers(self, count: int):
+        context = multiprocessing.get_context("spawn")
+        for _ in range(count):
+            process = context.Process(
+                target=_run_local_worker,
+                args=(self.address, self.authkey, self.settings.heartbeat_interval),
+                daemon=True,
+            )
+            process.start()
+            self._local_processes.append(process)
+
+    def _accept_loop(self):
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError):
+                if self._closed.is_set():
+                    return
+                continue
+            except Exception:
+                # Failed authentication or a malformed handshake; drop the peer.
+                continue
+            threading.Thread(target=self._serve_worker, args=(conn,), daemon=True).start()
+
+    def _take_task(self) -> _Task | None:
+        with self._task_ready:
+            while not self._tasks:
+                if self._closed.is_set():
+                    return None
+                self._task_ready.wait(0.5)
+            return self._tasks.popleft()
+
+    def _requeue(self, task: _Task):
+        with self._task_ready:
+            self._tasks.appendleft(task)
+            self.reassigned_chunks += 1
+            self._task_ready.notify()
+
+    def _serve_worker(self, conn: Connection):
+        timeout = self.settings.heartbeat_timeout
+        try:
+            if not conn.poll(timeout) or conn.recv()[0] != "hello":
+                conn.close()
+                return
+        except (EOFError, OSError):
+            conn.close()
+            return
+
+        with self._lock:
+            self._connections.add(conn)
+            self.workers_seen += 1
+
+        sent_job = 0
+        task = None
+        try:
+            while True:
+                task = self._take_task()
+                if task is None:
+                    conn.send(("shutdown",))
+                    return
+                if task.job_id != sent_job:
+                    with self._lock:
+                        job_id, job_blob = self._job_id, self._job_blob
+                    if task.job_id != job_id:
+                        task = None
+                        continue
+                    conn.send(("job", job_id, job_blob))
+                    sent_job = job_id
+                conn.send(("chunk", task.job_id, task.chunk_id, task.blob))
+
+                while True:
+                    if not conn.poll(timeout):
+                        raise TimeoutError("worker heartbeat timed out")
+                    message = conn.recv()
+                    if message[0] == "heartbeat":
+                        continue
+                    self._results.put((task.job_id, *message))
+                    task = None
+                    break
+        except (EOFError, OSError, TimeoutError):
+            if task is not None:
+                self._requeue(task)
+        finally:
+            with self._lock:
+                self._connections.discard(conn)
+            conn.close()
+
+    def _await_result(self, job_id: int, deadline: float | None = None):
+        waited = 0.0
+        while True:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            try:
+                item = self._results.get(timeout=0.5)
+            except queue.Empty:
+                if self.connected_workers:
+                    waited = 0.0
+                    continue
+                waited += 0.5
+                if waited >= self.settings.worker_wait_timeout:
+                    raise RuntimeError(f"No distributed workers connected to {self.address}")
+                continue
+            if item[0] == job_id:
+                return item[1:]
+
+    def _withdraw_queued(self, job_id: int) -> set[int]:
+        with self._lock:
+            withdrawn = {task.chunk_id for task in self._tasks if task.job_id == job_id}
+            self._tasks = deque(task for task in self._tasks if task.job_id != job_id)
+        return withdrawn
+
+    def imap(
+        self,
+        func: Callable,
+        items: Iterable,
+        ordered: bool = True,
+        cancel: CancellationToken | None = None,
+    ) -> Iterator:
+        self.start()
+        with self._lock:
+            self._job_id += 1
+            job_id = self._job_id
+            # Shared objects ride along once per job, ahead of every chunk.
+            self._job_blob = _pack((self.shared, func))
+
+        chunks = enumerate(iter_chunks(items, self.settings.chunk_size))
+        window = max(4, (self.connected_workers or self.settings.local_workers or 1) * 2)
+        outstanding: set[int] = set()
+        buffered: dict[int, list] = {}
+        next_chunk = 0
+        drain_deadline: float | None = None
+
+        def submit(count: int):
+            if drain_deadline is not None:
+                return
+            for chunk_id, chunk in islice(chunks, count):
+                with self._task_ready:
+                    self._tasks.append(_Task(job_id, chunk_id, _pack(chunk)))
+                    self._task_ready.notify()
+                outstanding.add(chunk_id)
+
+        try:
+            submit(window)
+            while outstanding:
+                if drain_deadline is None and is_cancelled(cancel):
+                    # Stop handing out work; chunks already on a worker may still finish.
+                    drain_deadline = cancel.drain_deadline()
+                    outstanding -= self._withdraw_queued(job_id)
+                    if not outstanding:
+                        break
+                received = self._await_result(job_id, drain_deadline)
+                if received is None:
+                    break
+                kind, chunk_id, payload = received
+                if chunk_id not in outstanding:
+                    # A reassigned chunk finished twice; keep the first answer.
+                    continue
+                if kind == "error":
+                    raise RuntimeError(f"Distributed worker failed on chunk {chunk_id}: {payload}")
+                outstanding.discard(chunk_id)
+                submit(1)
+                results = _unpack(payload)
+                if not ordered:
+                    yield from results
+                    continue
+                buffered[chunk_id] = results
+                while next_chunk in buffered:
+                    yield from buffered.pop(next_chunk)
+                    next_chunk += 1
+        finally:
+            self._withdraw_queued(job_id)
+
+    def imap_unordered(self, func: Callable, items: Iterable) -> Iterator:
+        return self.imap(func, items, ordered=False)
+
+    def map(self, func: Callable, items: Iterable):
+        return list(self.imap(func, items))
+
+    def close(self, timeout: float = 5.0):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        with self._task_ready:
+            self._task_ready.notify_all()
+        if self._listener is not None:
+            self._listener.close()
+        # Give connected workers a moment to receive their shutdown message.
+        deadline = time.monotonic() + timeout
+        while self.connected_workers and time.monotonic() < deadline:
+            time.sleep(0.05)
+        for process in self._local_processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._local_processes.clear()
@@ -0,0 +1,83 @@
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+
+from ..logging_setup import init_worker_logging, worker_logging_initargs
+from .cancellation import CancellationToken, ignore_interrupts
+from .defaults import DEFAULT_THREADS_PER_WORKER, WORKER_THREAD_PREFIX
+from .shared import install_shared
+from .streaming import DEFAULT_CHUNK_SIZE, executor_imap, iter_chunks
+
+_worker_threads: ThreadPoolExecutor | None = None
+
+
+def _init_hybrid_worker(threads: int, shared: tuple, log_queue, log_level: int):
+    global _worker_threads
+    ignore_interrupts()
+    install_shared(shared)
+    init_worker_logging(log_queue, log_level)
+    _worker_threads = ThreadPoolExecutor(max_workers=threads, thread_name_prefix=WORKER_THREAD_PREFIX)
+
+
+def run_chunk_threaded(func: Callable, chunk: list) -> list:
+    # Each process fans its chunk out over a small local thread pool so any
+    # I/O inside `func` overlaps while CPU work is spread across processes.
+    return list(_worker_threads.map(func, chunk))
+
+
+class HybridEngine:
+    def __init__(
+        self,
+        workers: int,
+        threads_per_worker: int = DEFAULT_THREADS_PER_WORKER,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        shared: tuple = (),
+    ):
+        self.workers = max(1, workers)
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.chunk_size = max(1, chunk_size) * self.threads_per_worker
+        self.shared = shared
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_hybrid_worker,
+            initargs=(self.threads_per_worker, self.shared, *worker_logging_initargs()),
+        )
+
+    def start(self) -> "HybridEngine":
+        if self._executor is None:
+            self._executor = self._new_executor()
+        return self
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def imap(
+        self,
+        func: Callable,
+        items: Iterable,
+        ordered: bool = True,
+        cancel: CancellationToken | None = None,
+    ) -> Iterator:
+        scope = nullcontext(self._executor) if self._executor else self._new_executor()
+        with scope as executor:
+            for results in executor_imap(
+                executor,
+                partial(run_chunk_threaded, func),
+                iter_chunks(items, self.chunk_size),
+                window=self.workers * 2,
+                ordered=ordered,
+                cancel=cancel,
+            ):
+                yield from results
+
+    def imap_unordered(self, func: Callable, items: Iterable) -> Iterator:
+        return self.imap(func, items, ordered=False)
+
+    def map(self, func: Callable, items: Iterable):
+        return list(self.imap(func, items))
@@ -1,14 +1,67 @@
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+
+from ..logging_setup import init_worker_logging, worker_logging_initargs
+from .cancellation import CancellationToken, ignore_interrupts
+from .shared import install_shared
+from .streaming import DEFAULT_CHUNK_SIZE, executor_imap, iter_chunks, run_chunk
+
+
+def _init_parallel_worker(shared: tuple, log_queue, log_level: int):
+    ignore_interrupts()
+    install_shared(shared)
+    init_worker_logging(log_queue, log_level)
 
 
 class ParallelEngine:
-    def __init__(self, workers: int):
+    def __init__(self, workers: int, chunk_size: int = DEFAULT_CHUNK_SIZE, shared: tuple = ()):
         self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.shared = shared
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_parallel_worker,
+            initargs=(self.shared, *worker_logging_initargs()),
+        )
+
+    def start(self) -> "ParallelEngine":
+        # A started engine keeps its worker processes between imap calls.
+        if self._executor is None:
+            self._executor = self._new_executor()
+        return self
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def imap(
+        self,
+        func: Callable,
+        items: Iterable,
+        ordered: bool = True,
+        cancel: CancellationToken | None = None,
+    ) -> Iterator:
+        # Items travel to worker processes in chunks to amortize pickling and IPC.
+        scope = nullcontext(self._executor) if self._executor else self._new_executor()
+        with scope as executor:
+            for results in executor_imap(
+                executor,
+                partial(run_chunk, func),
+                iter_chunks(items, self.chunk_size),
+                window=self.workers * 2,
+                ordered=ordered,
+                cancel=cancel,
+            ):
+                yield from results
+
+    def imap_unordered(self, func: Callable, items: Iterable) -> Iterator:
+        return self.imap(func, items, ordered=False)
 
     def map(self, func: Callable, items: Iterable):
-        values = list(items)
-        if not values:
-            return []
-        with ProcessPoolExecutor(max_workers=self.workers) as executor:
-            return list(executor.map(func, values))
+        return list(self.imap(func, items))
@@ -0,0 +1,88 @@
+import math
+import os
+import sys
+import sysconfig
+from pathlib import Path
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def free_threading_status() -> tuple[bool, str]:
+    build_flag = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if build_flag and gil_enabled is not None and not gil_enabled():
+        return True, "free-threaded CPython build with the GIL disabled"
+    if build_flag:
+        return False, "free-threaded CPython build, but the GIL was re-enabled at runtime"
+    return False, "standard CPython build with the GIL"
+
+
+FREE_THREADED, FREE_THREADING_REASON = free_threading_status()
+
+
+def _cgroup_paths() -> dict[str, str]:
+    # Maps "v2" or a v1 controller name to this process's cgroup path.
+    paths: dict[str, str] = {}
+    try:
+        lines = Path("/proc/self/cgroup").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return paths
+    for line in lines:
+        hierarchy, controllers, path = line.split(":", 2)
+        if hierarchy == "0" and not controllers:
+            paths["v2"] = path
+        for controller in controllers.split(","):
+            paths[controller] = path
+    return paths
+
+
+def _ancestors(mount: Path, path: str) -> list[Path]:
+    # A limit set on any parent cgroup also applies, so every level is read.
+    current = mount / path.lstrip("/")
+    levels = [current]
+    while current != mount and mount in current.parents:
+        current = current.parent
+        levels.append(current)
+    return levels
+
+
+def _read_quota(directory: Path) -> float | None:
+    try:
+        quota, period = (directory / "cpu.max").read_text(encoding="utf-8").split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota = int((directory / "cpu.cfs_quota_us").read_text(encoding="utf-8"))
+        period = int((directory / "cpu.cfs_period_us").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return quota / period if quota > 0 and period > 0 else None
+
+
+def cgroup_cpu_limit() -> float | None:
+    paths = _cgroup_paths()
+    candidates: list[Path] = []
+    if "v2" in paths:
+        for mount in (CGROUP_ROOT, CGROUP_ROOT / "unified"):
+            candidates.extend(_ancestors(mount, paths["v2"]))
+    if "cpu" in paths:
+        for mount in (CGROUP_ROOT / "cpu", CGROUP_ROOT / "cpu,cpuacct"):
+            candidates.extend(_ancestors(mount, paths["cpu"]))
+    limits = [quota for quota in map(_read_quota, candidates) if quota is not None]
+    return min(limits) if limits else None
+
+
+def effective_cpu_count() -> tuple[int, str]:
+    # os.cpu_count() reports the host; affinity masks and cgroup CPU quotas
+    # (containers, systemd slices) decide how much of it this process can use.
+    host = os.cpu_count() or 1
+    count = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else host
+    details = [f"{host} host CPU(s)"]
+    if count < host:
+        details.append(f"affinity allows {count}")
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        details.append(f"cgroup quota {limit:g} CPU(s)")
+        count = min(count, max(1, math.ceil(limit)))
+    return count, ", ".join(details)
@@ -0,0 +1,16 @@
+from collections.abc import Iterable
+
+# Read-only objects every worker needs, such as a compiled subject profile,
+# keyed by their `fingerprint`. Engines install them once per worker process
+# (pool initializer, or once per distributed job), so per-item callables can
+# refer to them by key instead of re-pickling them with every chunk.
+_installed: dict[str, object] = {}
+
+
+def install_shared(objects: Iterable):
+    for item in objects:
+        _installed[item.fingerprint] = item
+
+
+def shared_object(key: str):
+    return _installed[key]
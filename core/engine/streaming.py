@@ -0,0 +1,161 @@
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+from dataclasses import dataclass
+from itertools import islice
+
+from ..logging_setup import LOGGER_NAME
+from .cancellation import CancellationToken, is_cancelled
+
+DEFAULT_CHUNK_SIZE = 64
+DEFAULT_WINDOW_FACTOR = 4
+
+logger = logging.getLogger(f"{LOGGER_NAME}.engine")
+
+
+@dataclass
+class EngineProgress:
+    completed: int
+    elapsed_seconds: float
+    mode: str = ""
+
+    @property
+    def rate(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.completed / self.elapsed_seconds
+
+
+ProgressCallback = Callable[[EngineProgress], None]
+
+
+@dataclass
+class ItemError:
+    index: int
+    item: object
+    error_type: str
+    message: str
+
+
+def guarded_call(func: Callable, indexed_item: tuple[int, object]) -> tuple[int, object]:
+    # Runs on the worker side so one bad item becomes a record instead of
+    # tearing down the whole map.
+    index, item = indexed_item
+    try:
+        return index, func(item)
+    except Exception as error:
+        # Rate-limited by the logging setup, so a run where every item fails
+        # still logs only a sample of tracebacks.
+        logger.debug("Item %d raised %s", index, type(error).__name__, exc_info=True)
+        return index, ItemError(index=index, item=item, error_type=type(error).__name__, message=str(error))
+
+
+class ProgressTracker:
+    def __init__(self, callback: ProgressCallback | None, mode: str = "", interval: float = 0.5):
+        self.callback = callback
+        self.mode = mode
+        self.interval = interval
+        self.completed = 0
+        self.started = time.perf_counter()
+        self._last_emit = self.started
+
+    def snapshot(self) -> EngineProgress:
+        return EngineProgress(
+            completed=self.completed,
+            elapsed_seconds=time.perf_counter() - self.started,
+            mode=self.mode,
+        )
+
+    def advance(self, count: int = 1):
+        self.completed += count
+        if self.callback is None:
+            return
+        now = time.perf_counter()
+        if now - self._last_emit >= self.interval:
+            self._last_emit = now
+            self.callback(self.snapshot())
+
+    def finish(self):
+        if self.callback is not None:
+            self.callback(self.snapshot())
+
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    size = max(1, size)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_chunk(func: Callable, chunk: list) -> list:
+    return [func(item) for item in chunk]
+
+
+def _drain_ordered(queue: deque[Future], deadline: float) -> Iterator:
+    while queue:
+        try:
+            result = queue[0].result(timeout=max(0.0, deadline - time.monotonic()))
+        except FuturesTimeout:
+            break
+        queue.popleft()
+        yield result
+    for future in queue:
+        future.cancel()
+
+
+def _drain_unordered(pending: set[Future], deadline: float) -> Iterator:
+    done, not_done = wait(pending, timeout=max(0.0, deadline - time.monotonic()))
+    for future in not_done:
+        future.cancel()
+    for future in done:
+        yield future.result()
+
+
+def executor_imap(
+    executor: Executor,
+    func: Callable,
+    items: Iterable,
+    window: int,
+    ordered: bool = True,
+    cancel: CancellationToken | None = None,
+) -> Iterator:
+    # Keeps at most `window` submissions in flight so lazy inputs are never
+    # fully materialized; the pipeline is refilled before each result is handed
+    # back so workers stay busy while the caller consumes. Once `cancel` fires,
+    # nothing new is submitted and in-flight work gets until the drain deadline.
+    iterator = iter(items)
+    window = max(1, window)
+
+    def take(count: int) -> list:
+        if is_cancelled(cancel):
+            return []
+        return list(islice(iterator, count))
+
+    if ordered:
+        queue: deque[Future] = deque(executor.submit(func, item) for item in take(window))
+        while queue:
+            if is_cancelled(cancel):
+                yield from _drain_ordered(queue, cancel.drain_deadline())
+                return
+            result = queue.popleft().result()
+            for item in take(1):
+                queue.append(executor.submit(func, item))
+            yield result
+        return
+
+    pending: set[Future] = {executor.submit(func, item) for item in take(window)}
+    while pending:
+        if is_cancelled(cancel):
+            yield from _drain_unordered(pending, cancel.drain_deadline())
+            return
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for item in take(len(done)):
+            pending.add(executor.submit(func, item))
+        for future in done:
+            yield future.result()
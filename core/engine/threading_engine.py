@@ -1,14 +1,51 @@
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from .cancellation import CancellationToken
+from .defaults import WORKER_THREAD_PREFIX
+from .streaming import DEFAULT_WINDOW_FACTOR, executor_imap
 
 
 class ThreadingEngine:
     def __init__(self, workers: int):
         self.workers = max(1, workers)
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=WORKER_THREAD_PREFIX)
+
+    def start(self) -> "ThreadingEngine":
+        # A started engine keeps its pool between imap calls (warm mode).
+        if self._executor is None:
+            self._executor = self._new_executor()
+        return self
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def imap(
+        self,
+        func: Callable,
+        items: Iterable,
+        ordered: bool = True,
+        cancel: CancellationToken | None = None,
+    ) -> Iterator:
+        scope = nullcontext(self._executor) if self._executor else self._new_executor()
+        with scope as executor:
+            yield from executor_imap(
+                executor,
+                func,
+                items,
+                window=self.workers * DEFAULT_WINDOW_FACTOR,
+                ordered=ordered,
+                cancel=cancel,
+            )
+
+    def imap_unordered(self, func: Callable, items: Iterable) -> Iterator:
+        return self.imap(func, items, ordered=False)
 
     def map(self, func: Callable, items: Iterable):
-        values = list(items)
-        if not values:
-            return []
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            return list(executor.map(func, values))
+        return list(self.imap(func, items))
@@ -0,0 +1,151 @@
+import random
+import re
+import zlib
+from collections.abc import Iterable
+from functools import lru_cache
+
+from .compiled_profile import LEET_REVERSE
+from .engine.cancellation import CancellationToken, is_cancelled
+
+MIN_BASE_LENGTH = 3
+FAMILY_EXAMPLES = 3
+TOP_FAMILIES = 20
+MINHASH_PERMUTATIONS = 18
+LSH_BANDS = 6
+# Bigram Jaccard needed to merge two base words: "sumer"/"summer" (0.86)
+# merge, "winter"/"winner" (0.56) do not. Merged words must also share their
+# first FUZZY_PREFIX letters, as typos rarely hit the start of a word.
+FUZZY_THRESHOLD = 0.7
+FUZZY_PREFIX = 2
+CANCEL_CHECK_INTERVAL = 4096
+MINHASH_SEED = 7
+_PRIME = (1 << 61) - 1
+_AFFIXES = re.compile(r"^[\W\d_]+|[\W\d_]+$")
+_rng = random.Random(MINHASH_SEED)
+_PERMUTATIONS = tuple((_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(MINHASH_PERMUTATIONS))
+
+
+def base_word(password: str) -> str | None:
+    # "Summer2024!", "summer2025" and "Summ3r#1" all reduce to "summer":
+    # casefold, strip leading/trailing digits and symbols, then undo leet.
+    # Anything that is not a plain word afterwards (random strings) has no
+    # family.
+    core = _AFFIXES.sub("", password.casefold()).translate(LEET_REVERSE)
+    if len(core) < MIN_BASE_LENGTH or not core.isalpha():
+        return None
+    return core
+
+
+def _shingles(word: str) -> set[str]:
+    padded = f"^{word}$"
+    return {padded[index : index + 2] for index in range(len(padded) - 1)}
+
+
+def _jaccard(left: set[str], right: set[str]) -> float:
+    return len(left & right) / len(left | right)
+
+
+@lru_cache(maxsize=65536)
+def _permuted(shingle: str) -> tuple[int, ...]:
+    # Bigrams repeat across words, so their permuted hashes are computed once.
+    value = zlib.crc32(shingle.encode("utf-8"))
+    return tuple((a * value + b) % _PRIME for a, b in _PERMUTATIONS)
+
+
+def _minhash(shingles: set[str]) -> list[int]:
+    return [min(column) for column in zip(*map(_permuted, shingles))]
+
+
+class FamilyIndex:
+    # Groups passwords by base word in one pass (memory grows with distinct
+    # base words, not passwords), then merges near-identical base words
+    # ("summer"/"sumer") with MinHash LSH so the fuzzy step stays near-linear.
+
+    def __init__(self, threshold: float = FUZZY_THRESHOLD):
+        self.threshold = threshold
+        self.count = 0
+        self._bases: dict[str, list] = {}
+
+    def add(self, password: str):
+        self.count += 1
+        base = base_word(password)
+        if base is None:
+            return
+        entry = self._bases.get(base)
+        if entry is None:
+            self._bases[base] = [1, [password]]
+            return
+        entry[0] += 1
+        if len(entry[1]) < FAMILY_EXAMPLES and password not in entry[1]:
+            entry[1].append(password)
+
+    def update(self, passwords: Iterable[str], cancellation: CancellationToken | None = None):
+        # Stops early once the run is cancelled (time budget, Ctrl-C); the
+        # families then cover the passwords read so far.
+        for password in passwords:
+            if self.count % CANCEL_CHECK_INTERVAL == 0 and is_cancelled(cancellation):
+                return
+            self.add(password)
+
+    def _clusters(self) -> dict[int, list[str]]:
+        bases = list(self._bases)
+        parent = list(range(len(bases)))
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        # Each base joins the first base seen in every LSH bucket it lands in
+        # once their exact bigram Jaccard passes the threshold; comparing with
+        # one anchor per bucket instead of all pairs keeps this linear.
+        rows = MINHASH_PERMUTATIONS // LSH_BANDS
+        anchors: dict[tuple, int] = {}
+        for index, base in enumerate(bases):
+            if len(base) < MIN_BASE_LENGTH + 1:
+                continue
+            shingles = _shingles(base)
+            signature = _minhash(shingles)
+            for band in range(LSH_BANDS):
+                key = (band, *signature[band * rows : (band + 1) * rows])
+                anchor = anchors.setdefault(key, index)
+                if anchor == index:
+                    continue
+                left, right = find(anchor), find(index)
+                if (
+                    left != right
+                    and bases[anchor][:FUZZY_PREFIX] == base[:FUZZY_PREFIX]
+                    and _jaccard(_shingles(bases[anchor]), shingles) >= self.threshold
+                ):
+                    parent[right] = left
+
+        clusters: dict[int, list[str]] = {}
+        for index, base in enumerate(bases):
+            clusters.setdefault(find(index), []).append(base)
+        return clusters
+
+    def families(self, min_size: int = 2) -> list[dict]:
+        families = []
+        for members in self._clusters().values():
+            size = sum(self._bases[base][0] for base in members)
+            if size < min_size:
+                continue
+            members.sort(key=lambda base: (-self._bases[base][0], base))
+            examples: list[str] = []
+            for base in members:
+                examples.extend(self._bases[base][1][: FAMILY_EXAMPLES - len(examples)])
+                if len(examples) >= FAMILY_EXAMPLES:
+                    break
+            families.append({"base": members[0], "size": size, "base_words": members[:5], "examples": examples})
+        families.sort(key=lambda family: (-family["size"], family["base"]))
+        return families
+
+    def to_dict(self, top: int = TOP_FAMILIES) -> dict:
+        families = self.families()
+        return {
+            "passwords": self.count,
+            "families": len(families),
+            "passwords_in_families": sum(family["size"] for family in families),
+            "largest": families[:top],
+        }
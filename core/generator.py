@@ -1,15 +1,9 @@
 from datetime import datetime
 
-from .models import SubjectProfile
+from .compiled_profile import CompiledProfile
+from .config import LEET_MAP
+from .utils import password_sort_key
 
-LEET_MAP = {
-    "a": ["4", "@"],
-    "e": ["3"],
-    "i": ["1", "!"],
-    "o": ["0"],
-    "s": ["5", "$"],
-    "t": ["7"],
-}
 SPECIALS = ["!", "@", "#", "$", "%", "&", "*", "?"]
 
 
@@ -27,12 +21,12 @@ def _expand_token(token: str) -> set[str]:
 
 
 def generate_candidate_blocklist(
-    profile: SubjectProfile,
+    profile: CompiledProfile,
     min_length: int,
     max_length: int,
     max_candidates: int,
 ) -> list[str]:
-    tokens = sorted(token for token in profile.all_tokens() if 0 < len(token) <= max_length * 2)
+    tokens = [token for token in profile.raw_tokens if len(token) <= max_length * 2]
     expanded: set[str] = set()
     for token in tokens:
         expanded.update(_expand_token(token[: max_length * 2]))
@@ -76,4 +70,4 @@ def generate_candidate_blocklist(
         if len(candidates) >= max_candidates:
             break
 
-    return sorted(candidates, key=lambda word: (len(word), word.lower(), word))
+    return sorted(candidates, key=password_sort_key)
@@ -1,6 +1,21 @@
+import time
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
-from .engine import EngineCoordinator
+from .engine import DistributedSettings, EngineCoordinator
+from .engine.defaults import DEFAULT_THREADS_PER_WORKER
+from .engine.runtime import FREE_THREADED, FREE_THREADING_REASON, effective_cpu_count
+
+# One size below and one above the auto mode's parallel threshold, so auto
+# is timed on both the thread and the process paths it takes.
+PERF_SAMPLE_SIZES = (4000, 20000)
+PERF_ENGINES = ("auto", "async", "threading", "parallel", "hybrid")
+# Settings within this share of the fastest count as a tie; the one with
+# fewer workers wins so the recommendation does not oversubscribe the host.
+PERF_TIE_MARGIN = 0.05
+# A fixed engine replaces auto only when it is this much faster at every size.
+PERF_CLEAR_WIN = 0.2
 
 
 def _double(value: int) -> int:
@@ -21,17 +36,142 @@ def run_self_check(output_root: Path, workers: int) -> tuple[bool, list[str]]:
         ok = False
         messages.append(f"Output path write check: FAIL ({error})")
 
-    for mode in ("async", "threading", "parallel"):
+    cpus, cpu_detail = effective_cpu_count()
+    messages.append(f"Effective CPUs: {cpus} ({cpu_detail})")
+    messages.append(f"Interpreter: {FREE_THREADING_REASON}")
+    if FREE_THREADED:
+        messages.append("CPU parallelism: threads only (parallel/hybrid requests run on the threading engine)")
+    else:
+        messages.append("CPU parallelism: process pools for parallel/hybrid (GIL limits thread scaling)")
+    for size in (100, 5000, 50000):
+        mode, reason = EngineCoordinator(mode="auto", workers=workers).describe_mode(size)
+        messages.append(f"Auto mode for {size} items: {mode} ({reason})")
+
+    for mode in ("async", "threading", "parallel", "hybrid", "distributed"):
+        engine = EngineCoordinator(
+            mode=mode,
+            workers=max(1, min(workers, 2)),
+            distributed=DistributedSettings(local_workers=2, worker_wait_timeout=10.0),
+            threads_per_worker=2,
+        )
+        expected, _ = engine.describe_mode(3)
         try:
-            engine = EngineCoordinator(mode=mode, workers=max(1, min(workers, 2)))
             result = engine.map(_double, [1, 2, 3])
             if result != [2, 4, 6]:
                 ok = False
                 messages.append(f"Engine {mode}: FAIL (unexpected output)")
+            elif engine.last_mode != expected:
+                ok = False
+                messages.append(f"Engine {mode}: FAIL (fell back to {engine.last_mode})")
+            elif expected != mode:
+                messages.append(f"Engine {mode}: OK (ran as {expected}: {engine.mode_reason})")
             else:
                 messages.append(f"Engine {mode}: OK")
         except Exception as error:
             ok = False
             messages.append(f"Engine {mode}: FAIL ({error})")
+        finally:
+            engine.close()
 
     return ok, messages
+
+
+@dataclass
+class PerfResult:
+    engine: str
+    workers: int
+    # Worst speedup over serial across the sample sizes.
+    speedup: float
+
+
+def _worker_counts(cpus: int) -> list[int]:
+    return sorted({1, cpus, cpus * 2})
+
+
+def _best(results: list[PerfResult]) -> PerfResult | None:
+    if not results:
+        return None
+    fastest = max(result.speedup for result in results)
+    return min(
+        (result for result in results if result.speedup >= fastest * (1 - PERF_TIE_MARGIN)),
+        key=lambda result: (result.workers, PERF_ENGINES.index(result.engine)),
+    )
+
+
+def run_perf_check(
+    threads_per_worker: int = DEFAULT_THREADS_PER_WORKER,
+    sample_sizes: tuple[int, ...] = PERF_SAMPLE_SIZES,
+) -> tuple[bool, list[str], dict]:
+    # Times real evaluate_password calls on seeded corpora for auto and every
+    # fixed engine at a few worker counts. Auto picks its engine by input size,
+    # so the recommendation is a worker count for auto unless a fixed engine
+    # clearly beats it at every size; nothing is recommended if no setting
+    # beats serial evaluation.
+    from .audit import evaluate_password, evaluate_password_worker
+    from .bench import synthetic_corpus, synthetic_profile
+    from .compiled_profile import compile_profile
+    from .config import DEFAULT_POLICY_MIN_LENGTH
+
+    cpus, _ = effective_cpu_count()
+    profile = compile_profile(synthetic_profile(max(sample_sizes)))
+    corpora = {size: synthetic_corpus(size, profile.tokens) for size in sample_sizes}
+    worker = partial(
+        evaluate_password_worker, profile_key=profile.fingerprint, policy_min_length=DEFAULT_POLICY_MIN_LENGTH
+    )
+
+    messages: list[str] = []
+    serial_rates: dict[int, float] = {}
+    for size, corpus in corpora.items():
+        started = time.perf_counter()
+        for item in corpus:
+            evaluate_password(item, profile, DEFAULT_POLICY_MIN_LENGTH)
+        serial_rates[size] = size / (time.perf_counter() - started)
+        messages.append(f"Perf serial (no engine): {serial_rates[size]:,.0f} passwords/s on {size} passwords")
+
+    results: list[PerfResult] = []
+    for mode in PERF_ENGINES:
+        for workers in _worker_counts(cpus):
+            speedups: list[float] = []
+            for size, corpus in corpora.items():
+                engine = EngineCoordinator(
+                    mode=mode, workers=workers, threads_per_worker=threads_per_worker, shared=(profile,)
+                )
+                try:
+                    started = time.perf_counter()
+                    completed = sum(1 for _ in engine.imap(worker, corpus))
+                    rate = completed / (time.perf_counter() - started)
+                except Exception as error:
+                    messages.append(f"Perf {mode} x{workers} on {size}: FAIL ({error})")
+                    break
+                finally:
+                    engine.close()
+                speedups.append(rate / serial_rates[size])
+                note = f" (ran as {engine.last_mode})" if engine.last_mode != mode else ""
+                messages.append(
+                    f"Perf {mode} x{workers} on {size}: {rate:,.0f} passwords/s, "
+                    f"{speedups[-1]:.2f}x serial{note}"
+                )
+            else:
+                results.append(PerfResult(mode, workers, min(speedups)))
+
+    if not results:
+        messages.append("Perf: FAIL (no engine setting completed)")
+        return False, messages, {}
+    best = _best([result for result in results if result.engine == "auto"])
+    fixed = _best([result for result in results if result.engine != "auto"])
+    if fixed is not None and (best is None or fixed.speedup > best.speedup * (1 + PERF_CLEAR_WIN)):
+        best = fixed
+    if best.speedup <= 1.0:
+        messages.append(
+            f"Recommended: none (best was {best.engine} x{best.workers} at {best.speedup:.2f}x serial); "
+            "keep the defaults"
+        )
+        return True, messages, {}
+    recommendation: dict = {"workers": best.workers}
+    if best.engine != "auto":
+        recommendation["engine"] = best.engine
+    if best.engine == "hybrid":
+        recommendation["threads_per_worker"] = threads_per_worker
+    flags = " ".join(f"--{key.replace('_', '-')} {value}" for key, value in recommendation.items())
+    messages.append(f"Recommended: {flags} (at least {best.speedup:.1f}x serial at every size)")
+    return True, messages, recommendation
@@ -0,0 +1,236 @@
+import json
+import sqlite3
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+from .models import RunSummary
+from .reporting import PROFILE_SNAPSHOT_NAME
+from .stats import AssessmentStats
+
+HISTORY_DB_NAME = "history.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    subject_slug TEXT NOT NULL,
+    subject_name TEXT NOT NULL,
+    organization TEXT,
+    generated_candidates INTEGER NOT NULL,
+    weak_count INTEGER NOT NULL,
+    medium_count INTEGER NOT NULL,
+    strong_count INTEGER NOT NULL,
+    engine_mode TEXT,
+    workers INTEGER,
+    policy_min_length INTEGER,
+    audited_password_count INTEGER NOT NULL DEFAULT 0,
+    audited_weak_count INTEGER NOT NULL DEFAULT 0,
+    failed_item_count INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 1,
+    stop_reason TEXT,
+    weak_ratio REAL,
+    audited_weak_ratio REAL,
+    audited_mean_score REAL,
+    audited_mean_entropy REAL,
+    audited_min_score INTEGER,
+    audited_max_score INTEGER
+);
+-- A run is identified by its subject and timestamp, so importing the same
+-- summaries twice adds nothing.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_runs_subject_time ON runs (subject_slug, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_runs_org_time ON runs (organization, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_runs_time ON runs (recorded_at);
+"""
+
+SUMMARY_COLUMNS = [
+    "generated_candidates",
+    "weak_count",
+    "medium_count",
+    "strong_count",
+    "engine_mode",
+    "workers",
+    "policy_min_length",
+    "audited_password_count",
+    "audited_weak_count",
+    "failed_item_count",
+    "completed",
+    "stop_reason",
+]
+
+
+def _ratio(numerator: int, denominator: int) -> float | None:
+    if denominator <= 0:
+        return None
+    return numerator / denominator
+
+
+def _stats_columns(stats: AssessmentStats | None) -> dict:
+    stats = stats or AssessmentStats()
+    return {
+        "audited_mean_score": stats.mean_score,
+        "audited_mean_entropy": stats.mean_entropy,
+        "audited_min_score": stats.min_score,
+        "audited_max_score": stats.max_score,
+    }
+
+
+def _summary_timestamp(summary: RunSummary, summary_path: Path) -> float:
+    # Runs store the time they were recorded, which --watch keeps when it
+    # rewrites the summary. Summaries from before history existed fall back
+    # to the file's modification time.
+    if summary.recorded_at is not None:
+        return summary.recorded_at
+    return summary_path.stat().st_mtime
+
+
+def _snapshot_organization(snapshot_path: Path) -> str | None:
+    # summary.json does not carry the organization; the profile snapshot
+    # written next to it by the same run does.
+    try:
+        data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+        return data["profile"].get("organization") or None
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+@dataclass
+class HistoryRecord:
+    summary: RunSummary
+    organization: str | None = None
+    stats: AssessmentStats | None = None
+    recorded_at: float | None = None
+
+    def row(self) -> dict:
+        summary = asdict(self.summary)
+        row = {
+            "recorded_at": next(
+                (value for value in (self.recorded_at, self.summary.recorded_at) if value is not None), time.time()
+            ),
+            "subject_slug": self.summary.subject_slug,
+            "subject_name": self.summary.subject_name,
+            "organization": self.organization,
+            **{name: summary[name] for name in SUMMARY_COLUMNS},
+            "weak_ratio": _ratio(self.summary.weak_count, self.summary.generated_candidates),
+            "audited_weak_ratio": _ratio(self.summary.audited_weak_count, self.summary.audited_password_count),
+            **_stats_columns(self.stats),
+        }
+        row["completed"] = int(bool(row["completed"]))
+        return row
+
+
+class RunHistoryStore:
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def record_runs(self, records: list[HistoryRecord]) -> int:
+        if not records:
+            return 0
+        rows = [record.row() for record in records]
+        columns = list(rows[0])
+        statement = (
+            f"INSERT OR IGNORE INTO runs ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + column for column in columns)})"
+        )
+        before = self._conn.total_changes
+        with self._conn:
+            self._conn.executemany(statement, rows)
+        return self._conn.total_changes - before
+
+    def record_run(self, record: HistoryRecord) -> int:
+        return self.record_runs([record])
+
+    @staticmethod
+    def _filters(
+        subject: str | None,
+        organization: str | None,
+        since: float | None,
+        until: float | None,
+    ) -> tuple[str, list]:
+        clauses: list[str] = []
+        params: list = []
+        if subject:
+            clauses.append("subject_slug = ?")
+            params.append(subject)
+        if organization:
+            clauses.append("organization = ?")
+            params.append(organization)
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("recorded_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(
+        self,
+        subject: str | None = None,
+        organization: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 50,
+    ) -> list[dict]:
+        where, params = self._filters(subject, organization, since, until)
+        cursor = self._conn.execute(
+            f"SELECT * FROM runs {where} ORDER BY recorded_at DESC LIMIT ?",
+            [*params, limit],
+        )
+        return [dict(row) for row in cursor]
+
+    def trend(
+        self,
+        subject: str | None = None,
+        organization: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> list[dict]:
+        where, params = self._filters(subject, organization, since, until)
+        cursor = self._conn.execute(
+            f"""
+            SELECT date(recorded_at, 'unixepoch') AS day,
+                   COUNT(*) AS runs,
+                   COUNT(DISTINCT subject_slug) AS subjects,
+                   AVG(weak_ratio) AS avg_weak_ratio,
+                   SUM(audited_password_count) AS audited,
+                   SUM(audited_weak_count) AS audited_weak
+            FROM runs {where}
+            GROUP BY day
+            ORDER BY day
+            """,
+            params,
+        )
+        return [dict(row) for row in cursor]
+
+    def import_summaries(self, output_root: Path, batch_size: int = 500) -> int:
+        imported = 0
+        batch: list[HistoryRecord] = []
+        known = {item.name for item in fields(RunSummary)}
+        for summary_path in sorted((output_root / "reports").glob("*/summary.json")):
+            try:
+                data = json.loads(summary_path.read_text(encoding="utf-8"))
+                summary = RunSummary(**{key: value for key, value in data.items() if key in known})
+            except (OSError, ValueError, TypeError):
+                continue
+            batch.append(
+                HistoryRecord(
+                    summary=summary,
+                    organization=_snapshot_organization(summary_path.with_name(PROFILE_SNAPSHOT_NAME)),
+                    recorded_at=_summary_timestamp(summary, summary_path),
+                )
+            )
+            if len(batch) >= batch_size:
+                imported += self.record_runs(batch)
+                batch = []
+        imported += self.record_runs(batch)
+        return imported
+
+    def close(self):
+        self._conn.close()
@@ -1,12 +1,63 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+LOGGER_NAME = "victimator_x"
+DEBUG_RATE_LIMIT = 20
+DEBUG_RATE_WINDOW = 1.0
+
+_handlers: list[logging.Handler] = []
+_listener: QueueListener | None = None
+_worker_queue = None
+_worker_listener: QueueListener | None = None
+
+
+class RateLimitFilter(logging.Filter):
+    # Lets through at most `limit` DEBUG records per message template every
+    # `window` seconds, so per-item debug lines cannot swamp a large run.
+    # The first record of the next window reports how many were dropped.
+
+    def __init__(self, limit: int = DEBUG_RATE_LIMIT, window: float = DEBUG_RATE_WINDOW):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._windows: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        now = time.monotonic()
+        key = str(record.msg)
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None or now - state[0] >= self.window:
+                self._windows[key] = [now, 1, 0]
+                if state is not None and state[2]:
+                    record.msg = f"{record.msg} ({state[2]} similar message(s) suppressed)"
+                return True
+            if state[1] < self.limit:
+                state[1] += 1
+                return True
+            state[2] += 1
+            return False
+
+
+def _queue_handler(log_queue) -> QueueHandler:
+    handler = QueueHandler(log_queue)
+    handler.addFilter(RateLimitFilter())
+    return handler
+
 
 def setup_logger(log_path: Path, verbose: bool = False) -> logging.Logger:
+    global _listener
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    logger = logging.getLogger("victimator_x")
+    logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(logging.DEBUG if verbose else logging.INFO)
 
     if logger.handlers:
@@ -21,11 +72,59 @@ def setup_logger(log_path: Path, verbose: bool = False) -> logging.Logger:
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
-    logger.addHandler(file_handler)
 
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
     stream_handler.setLevel(logging.WARNING)
-    logger.addHandler(stream_handler)
+    _handlers[:] = [file_handler, stream_handler]
+
+    # Callers only enqueue records; formatting, file writes and rotation run on
+    # the listener thread.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(_queue_handler(log_queue))
+    _listener = QueueListener(log_queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
 
     return logger
+
+
+def worker_log_queue():
+    # Created on first use by a process-pool engine. Worker processes log onto
+    # it and a second listener feeds their records to the same handlers.
+    global _worker_queue, _worker_listener
+    if _listener is None:
+        return None
+    if _worker_queue is None:
+        import multiprocessing
+
+        _worker_queue = multiprocessing.Queue()
+        _worker_listener = QueueListener(_worker_queue, *_handlers, respect_handler_level=True)
+        _worker_listener.start()
+    return _worker_queue
+
+
+def worker_logging_initargs() -> tuple:
+    return worker_log_queue(), logging.getLogger(LOGGER_NAME).getEffectiveLevel()
+
+
+def init_worker_logging(log_queue, level: int):
+    # Runs in each worker process. A forked worker inherits the parent's
+    # handler, whose in-process queue nobody drains there, so it is replaced.
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    if log_queue is None:
+        return
+    logger.setLevel(level)
+    logger.propagate = False
+    logger.addHandler(_queue_handler(log_queue))
+
+
+def stop_logging():
+    # Flushes everything still queued; safe to call more than once.
+    global _listener, _worker_listener
+    for listener in (_worker_listener, _listener):
+        if listener is not None:
+            listener.stop()
+    _listener = _worker_listener = None
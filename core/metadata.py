@@ -8,7 +8,7 @@ CONTACT_EMAIL = "voltsparx@gmail.com"
 LICENSE_NAME = "MIT"
 
 TAGLINE = "Defensive Password Audit Platform"
-ENGINE_CAPABILITY_LINE = "Beginner friendly | Async + Threading + Parallel engines"
+ENGINE_CAPABILITY_LINE = "Beginner friendly | Async + Threading + Parallel + Distributed engines"
 
 ETHICAL_NOTICE = (
     f"{APP_NAME} is for defensive security auditing only. "
@@ -0,0 +1,218 @@
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from logging import Logger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .engine.defaults import WORKER_THREAD_PREFIX
+
+if TYPE_CHECKING:
+    from .engine import EngineCoordinator
+    from .engine.streaming import EngineProgress, ProgressCallback
+    from .profiling import RunProfiler
+
+METRICS_PREFIX = "victimator"
+DEFAULT_METRICS_INTERVAL = 5.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricFamily:
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = f"{METRICS_PREFIX}_{name}"
+        self.kind = kind
+        self.help_text = help_text
+        self.samples: list[tuple[dict, float]] = []
+
+    def add(self, value: float, **labels: str):
+        self.samples.append((labels, value))
+
+    def render(self) -> list[str]:
+        suffix = "_total" if self.kind == "counter" else ""
+        lines = [f"# TYPE {self.name} {self.kind}", f"# HELP {self.name} {self.help_text}"]
+        for labels, value in self.samples:
+            label_text = ",".join(f'{key}="{_escape(str(item))}"' for key, item in labels.items())
+            selector = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{self.name}{suffix}{selector} {value}")
+        return lines
+
+
+def render_openmetrics(families: list[MetricFamily]) -> str:
+    lines = [line for family in families if family.samples for line in family.render()]
+    return "\n".join([*lines, "# EOF"]) + "\n"
+
+
+def _proc_cpu_seconds(stat_path: str) -> float | None:
+    # utime and stime are fields 14 and 15 of /proc/.../stat; the command name
+    # before them may contain spaces, so split after its closing parenthesis.
+    try:
+        with open(stat_path, encoding="ascii", errors="ignore") as handle:
+            fields = handle.read().rsplit(")", 1)[1].split()
+    except (OSError, IndexError):
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def worker_busy_seconds() -> dict[str, float]:
+    # Busy time is sampled as CPU time from /proc, outside the hot path, for
+    # engine worker threads and for worker processes (which include the
+    # hybrid engine's in-process threads). Not available off Linux.
+    if not sys.platform.startswith("linux"):
+        return {}
+    busy: dict[str, float] = {}
+    for thread in threading.enumerate():
+        if thread.name.startswith(WORKER_THREAD_PREFIX) and thread.native_id is not None:
+            seconds = _proc_cpu_seconds(f"/proc/self/task/{thread.native_id}/stat")
+            if seconds is not None:
+                busy[f"thread:{thread.name}"] = seconds
+    if "multiprocessing" in sys.modules:
+        import multiprocessing
+
+        for child in multiprocessing.active_children():
+            seconds = _proc_cpu_seconds(f"/proc/{child.pid}/stat")
+            if seconds is not None:
+                busy[f"process:{child.pid}"] = seconds
+    return busy
+
+
+class RunMetrics:
+    # Shared state for one run. The run thread only swaps references here at
+    # progress-callback frequency; everything is read and formatted on the
+    # emitter thread.
+
+    def __init__(self, subject: str, engine: "EngineCoordinator", profiler: "RunProfiler"):
+        self.subject = subject
+        self.engine = engine
+        self.profiler = profiler
+        self.started = time.time()
+        self.stage: str | None = None
+        self.progress: dict[str, "EngineProgress"] = {}
+        self.classified: dict[str, dict] = {}
+        self.writers: dict[str, object] = {}
+        self.resumed: dict[str, int] = {}
+        self.completed: bool | None = None
+
+    def observe(self, stage: str, callback: "ProgressCallback | None" = None) -> "ProgressCallback":
+        self.stage = stage
+
+        def record(progress: "EngineProgress"):
+            self.progress[stage] = progress
+            self.resumed[stage] = self.engine.resumed_items
+            if callback is not None:
+                callback(progress)
+
+        return record
+
+    def families(self) -> list[MetricFamily]:
+        subject = self.subject
+        items = MetricFamily("items_processed", "counter", "Items completed by the engine per stage.")
+        rate = MetricFamily("items_per_second", "gauge", "Engine throughput per stage.")
+        for stage, progress in list(self.progress.items()):
+            items.add(progress.completed, subject=subject, stage=stage, engine=progress.mode)
+            rate.add(round(progress.rate, 3), subject=subject, stage=stage, engine=progress.mode)
+
+        in_flight = MetricFamily("engine_in_flight", "gauge", "Items submitted to the engine and not yet returned.")
+        in_flight.add(self.engine.in_flight, subject=subject, stage=self.stage or "")
+        # A gauge: the engine resets its count on every imap call, so the value
+        # can go down within one stage.
+        failed = MetricFamily("failed_items", "gauge", "Items that failed evaluation in the current stage.")
+        failed.add(self.engine.failed_items, subject=subject, stage=self.stage or "")
+
+        queue_depth = MetricFamily("writer_queue_depth", "gauge", "Batches waiting for a background writer.")
+        for name, writer in list(self.writers.items()):
+            queue_depth.add(writer.queue_depth, subject=subject, writer=name)
+
+        busy = MetricFamily("worker_busy_seconds", "counter", "CPU seconds used by each engine worker.")
+        for worker, seconds in sorted(worker_busy_seconds().items()):
+            busy.add(round(seconds, 3), subject=subject, worker=worker)
+
+        reused = MetricFamily(
+            "checkpoint_reused_items", "counter", "Results restored from a checkpoint instead of recomputed."
+        )
+        hit_ratio = MetricFamily("checkpoint_hit_ratio", "gauge", "Share of stage results served from a checkpoint.")
+        for stage, count in list(self.resumed.items()):
+            reused.add(count, subject=subject, stage=stage)
+            completed = self.progress[stage].completed if stage in self.progress else 0
+            hit_ratio.add(round(count / completed, 4) if completed else 0, subject=subject, stage=stage)
+
+        classified = MetricFamily("classified", "counter", "Passwords per classification and source.")
+        for source, counts in list(self.classified.items()):
+            for classification in ("weak", "medium", "strong"):
+                hits = counts.get(classification, 0)
+                classified.add(hits, subject=subject, source=source, classification=classification)
+
+        stage_seconds = MetricFamily("stage_duration_seconds", "gauge", "Wall time of each finished pipeline stage.")
+        for record in list(self.profiler.stages):
+            stage_seconds.add(round(record.wall_seconds, 4), subject=subject, stage=record.name)
+
+        run = MetricFamily("run_start_time_seconds", "gauge", "Unix time the run started.")
+        run.add(round(self.started), subject=subject)
+        completed = MetricFamily("run_completed", "gauge", "1 once the run finished, 0 if it stopped early.")
+        if self.completed is not None:
+            completed.add(int(self.completed), subject=subject)
+        return [
+            items,
+            rate,
+            in_flight,
+            failed,
+            queue_depth,
+            busy,
+            reused,
+            hit_ratio,
+            classified,
+            stage_seconds,
+            run,
+            completed,
+        ]
+
+
+class MetricsEmitter:
+    # Writes an OpenMetrics text file every `interval` seconds from its own
+    # thread, and once more on close. Each write goes to a temp file that is
+    # renamed into place, so a scraper never reads a partial file.
+
+    def __init__(
+        self,
+        path: Path,
+        collect: Callable[[], list[MetricFamily]],
+        interval: float = DEFAULT_METRICS_INTERVAL,
+        logger: Logger | None = None,
+    ):
+        self.path = path
+        self.collect = collect
+        self.interval = interval
+        self.logger = logger
+        self.writes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="vx-metrics", daemon=True)
+
+    def start(self) -> "MetricsEmitter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.write()
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def write(self):
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        try:
+            temp_path.write_text(render_openmetrics(self.collect()), encoding="utf-8")
+            os.replace(temp_path, self.path)
+            self.writes += 1
+        except OSError as error:
+            if self.logger:
+                self.logger.warning("Could not write metrics file %s: %s", self.path, error)
+
+    def close(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.write()
@@ -79,3 +79,14 @@ class RunSummary:
     policy_min_length: int
     audited_password_count: int = 0
     audited_weak_count: int = 0
+    failed_item_count: int = 0
+    completed: bool = True
+    stop_reason: str | None = None
+    # When the run was recorded in the history store; its key there together
+    # with subject_slug.
+    recorded_at: float | None = None
+    audit_distribution: dict = field(default_factory=dict)
+    password_families: dict = field(default_factory=dict)
+    policy_what_if: dict = field(default_factory=dict)
+    sample_estimate: dict = field(default_factory=dict)
+    profile: dict = field(default_factory=dict)
@@ -1,4 +1,27 @@
-from .models import PasswordAssessment, RunSummary, SubjectProfile
+from typing import TYPE_CHECKING
+
+from .models import RunSummary, SubjectProfile
+
+if TYPE_CHECKING:
+    from .stats import AssessmentStats
+
+MAX_TIPS = 8
+# Distinct counts come from a HyperLogLog with ~1.6% error, so reuse below
+# this share of the audit is not reported.
+MIN_REUSE_SHARE = 0.05
+VIOLATION_ADVICE = {
+    "length": "Raise the enforced minimum length and favour passphrases.",
+    "missing-lowercase": "Reject all-caps or digit-only passwords.",
+    "missing-uppercase": "Require mixed case, or better, longer passphrases.",
+    "missing-digit": "Require digits or move to longer passphrases.",
+    "missing-symbol": "Require a symbol or raise the length requirement instead.",
+}
+REASON_ADVICE = {
+    "Found in common weak-password list": "Block known breached and common passwords at change time.",
+    "Contains personal/profile information": "Block names, birthdays and organization terms in passwords.",
+    "Contains predictable character sequence": "Reject keyboard and alphabet sequences such as 'abcd' or '1234'.",
+    "Contains repeated character runs": "Reject passwords with repeated character runs.",
+}
 
 
 def _ratio(numerator: int, denominator: int) -> float:
@@ -7,47 +30,108 @@ def _ratio(numerator: int, denominator: int) -> float:
     return numerator / denominator
 
 
+def _audit_tips(stats: "AssessmentStats", sampled: bool = False) -> list[tuple[float, str]]:
+    # Each tip is ranked by the share of audited passwords it concerns.
+    ranked: list[tuple[float, str]] = []
+    total = stats.count
+    weak = stats.classifications["weak"]
+    if weak:
+        share = _ratio(weak, total)
+        if sampled:
+            finding = f"An estimated {share:.0%} of the audited password list is weak ({weak} of {total} sampled)."
+        else:
+            finding = f"Audited password list contains {weak} weak passwords ({share:.0%})."
+        ranked.append((0.5 + share, f"{finding} Force reset and blocklist these patterns."))
+    if stats.violations:
+        violation, hits = stats.violations.most_common(1)[0]
+        share = _ratio(hits, total)
+        advice = VIOLATION_ADVICE.get(violation.split("<", 1)[0], "Tighten the password policy.")
+        ranked.append((share, f"Most common policy gap: {violation} in {share:.0%} of audited passwords. {advice}"))
+    for reason, hits in stats.reasons.most_common(2):
+        share = _ratio(hits, total)
+        advice = REASON_ADVICE.get(reason, "Review these passwords.")
+        ranked.append((share, f"Top weakness: {reason.lower()} ({share:.0%} of audited passwords). {advice}"))
+    # Reuse in a random sample says little about reuse across the whole list.
+    reused = 0 if sampled else stats.reused_estimate
+    if _ratio(reused, total) >= MIN_REUSE_SHARE:
+        share = _ratio(reused, total)
+        ranked.append(
+            (
+                0.4 + share,
+                f"About {reused} audited passwords ({share:.0%}) repeat another entry. "
+                "Shared passwords spread a single compromise; require unique credentials.",
+            )
+        )
+    median = stats.score_quantiles([0.5])[0]
+    if median is not None and median < 45:
+        ranked.append((0.3, f"Median audited score is {median}/100; most passwords would not survive guessing."))
+    return ranked
+
+
 def build_nano_ai_guidance(
-    profile: SubjectProfile,
-    summary: RunSummary,
-    audited_assessments: list[PasswordAssessment],
+    profile: SubjectProfile | None,
+    summary: RunSummary | None,
+    stats: "AssessmentStats | None" = None,
 ) -> list[str]:
-    tips: list[str] = []
-
-    weak_ratio = _ratio(summary.weak_count, summary.generated_candidates)
-    if weak_ratio >= 0.45:
-        tips.append("High weak-pattern exposure detected. Prioritize policy hardening and awareness training.")
-    elif weak_ratio >= 0.25:
-        tips.append("Moderate weak-pattern exposure detected. Tighten password standards and monitor reuse.")
-    else:
-        tips.append("Weak-pattern exposure is relatively low. Keep regular hygiene checks in place.")
-
-    if profile.mfa_enabled is False:
-        tips.append("MFA is disabled. Enable MFA for all critical accounts immediately.")
-    elif profile.mfa_enabled is None:
-        tips.append("MFA status unknown. Verify MFA coverage and document gaps.")
-
-    if profile.password_manager_used is False:
-        tips.append("Password manager is not in use. Adopt one to reduce reuse and weak-password risk.")
-    elif profile.password_manager_used is None:
-        tips.append("Password manager usage unknown. Confirm whether users store credentials safely.")
-
-    if profile.last_rotation_days is not None and profile.last_rotation_days > 180:
-        tips.append("Password rotation appears stale (>180 days). Rotate high-risk credentials.")
-
-    audited_weak = [item for item in audited_assessments if item.classification == "weak"]
-    if audited_weak:
-        tips.append(
-            f"Audited password list contains {len(audited_weak)} weak passwords. "
-            "Force reset and blocklist these patterns."
+    # Works from aggregates only, so batch, --stdin and --watch runs produce
+    # guidance without keeping assessments in memory. Tips are ranked by how
+    # much of the audit they concern; fixed-weight profile tips slot in between.
+    ranked: list[tuple[float, str]] = []
+
+    if summary is not None and summary.generated_candidates:
+        weak_ratio = _ratio(summary.weak_count, summary.generated_candidates)
+        if weak_ratio >= 0.45:
+            ranked.append(
+                (0.9, "High weak-pattern exposure detected. Prioritize policy hardening and awareness training.")
+            )
+        elif weak_ratio >= 0.25:
+            ranked.append(
+                (0.6, "Moderate weak-pattern exposure detected. Tighten password standards and monitor reuse.")
+            )
+        else:
+            ranked.append((0.2, "Weak-pattern exposure is relatively low. Keep regular hygiene checks in place."))
+
+    if profile is not None:
+        if profile.mfa_enabled is False:
+            ranked.append((0.95, "MFA is disabled. Enable MFA for all critical accounts immediately."))
+        elif profile.mfa_enabled is None:
+            ranked.append((0.35, "MFA status unknown. Verify MFA coverage and document gaps."))
+
+        if profile.password_manager_used is False:
+            ranked.append(
+                (0.7, "Password manager is not in use. Adopt one to reduce reuse and weak-password risk.")
+            )
+        elif profile.password_manager_used is None:
+            ranked.append((0.25, "Password manager usage unknown. Confirm whether users store credentials safely."))
+
+        if profile.last_rotation_days is not None and profile.last_rotation_days > 180:
+            ranked.append((0.45, "Password rotation appears stale (>180 days). Rotate high-risk credentials."))
+
+    if stats is not None and stats.count:
+        sampled = summary is not None and bool(summary.sample_estimate) and not summary.sample_estimate["census"]
+        ranked.extend(_audit_tips(stats, sampled))
+    if summary is not None and summary.password_families.get("largest"):
+        families = summary.password_families
+        largest = families["largest"][0]
+        share = _ratio(families["passwords_in_families"], families["passwords"])
+        ranked.append(
+            (
+                0.3 + share,
+                f"{share:.0%} of audited passwords are variants of a shared base word; the largest family "
+                f"'{largest['base']}' has {largest['size']}. Block the base words, not just exact passwords.",
+            )
         )
 
-    if not profile.organization:
-        tips.append("Organization context missing. Add it for clearer reporting and ownership.")
-    if not profile.risk_notes:
-        tips.append("No risk notes supplied. Capture recent incidents or known user behavior patterns.")
+    if profile is not None:
+        if not profile.organization:
+            ranked.append((0.05, "Organization context missing. Add it for clearer reporting and ownership."))
+        if not profile.risk_notes:
+            ranked.append(
+                (0.04, "No risk notes supplied. Capture recent incidents or known user behavior patterns.")
+            )
 
-    return tips[:8]
+    ranked.sort(key=lambda entry: entry[0], reverse=True)
+    return [tip for _, tip in ranked[:MAX_TIPS]]
 
 
 def answer_nano_ai_question(question: str) -> str:
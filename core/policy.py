@@ -1,5 +1,16 @@
 import math
 
+CLASS_LOWERCASE = 1
+CLASS_UPPERCASE = 2
+CLASS_DIGIT = 4
+CLASS_SYMBOL = 8
+CHARACTER_CLASSES = {
+    "lowercase": CLASS_LOWERCASE,
+    "uppercase": CLASS_UPPERCASE,
+    "digit": CLASS_DIGIT,
+    "symbol": CLASS_SYMBOL,
+}
+
 
 def estimate_entropy_bits(password: str) -> float:
     pool_size = 0
@@ -44,16 +55,29 @@ def has_repeated_chars(password: str, threshold: int = 3) -> bool:
     return False
 
 
-def policy_violations(password: str, min_length: int) -> list[str]:
-    violations: list[str] = []
-    if len(password) < min_length:
-        violations.append(f"length<{min_length}")
-    if not any(ch.islower() for ch in password):
-        violations.append("missing-lowercase")
-    if not any(ch.isupper() for ch in password):
-        violations.append("missing-uppercase")
-    if not any(ch.isdigit() for ch in password):
-        violations.append("missing-digit")
-    if not any(not ch.isalnum() for ch in password):
-        violations.append("missing-symbol")
+ALL_CHARACTER_CLASSES = CLASS_LOWERCASE | CLASS_UPPERCASE | CLASS_DIGIT | CLASS_SYMBOL
+
+
+def class_violations(length: int, classes: int, min_length: int, required: int = ALL_CHARACTER_CLASSES) -> list[str]:
+    # Policy check on a password's length and character_classes() bitmask.
+    violations = [f"length<{min_length}"] if length < min_length else []
+    missing = required & ~classes
+    violations.extend(f"missing-{name}" for name, bit in CHARACTER_CLASSES.items() if missing & bit)
     return violations
+
+
+def policy_violations(password: str, min_length: int) -> list[str]:
+    return class_violations(len(password), character_classes(password), min_length)
+
+
+def character_classes(password: str) -> int:
+    classes = 0
+    if any(ch.islower() for ch in password):
+        classes |= CLASS_LOWERCASE
+    if any(ch.isupper() for ch in password):
+        classes |= CLASS_UPPERCASE
+    if any(ch.isdigit() for ch in password):
+        classes |= CLASS_DIGIT
+    if any(not ch.isalnum() for ch in password):
+        classes |= CLASS_SYMBOL
+    return classes
@@ -0,0 +1,148 @@
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .audit import policy_score
+from .policy import ALL_CHARACTER_CLASSES, CHARACTER_CLASSES, class_violations
+
+CLASS_ORDER = ("weak", "medium", "strong")
+
+
+@dataclass(frozen=True)
+class PolicyVariant:
+    # A minimum length plus the character classes that are required; the
+    # current policy requires all four.
+    min_length: int
+    required: int = ALL_CHARACTER_CLASSES
+
+    @property
+    def label(self) -> str:
+        dropped = [name for name, bit in CHARACTER_CLASSES.items() if not self.required & bit]
+        return "-".join([str(self.min_length), *dropped])
+
+
+def parse_policy_variants(value: str) -> tuple[PolicyVariant, ...]:
+    # "12,14-symbol" -> min length 12 with every class required, and min length
+    # 14 without the symbol requirement. Used as an argparse type.
+    variants: list[PolicyVariant] = []
+    for spec in value.split(","):
+        length, *dropped = spec.strip().lower().split("-")
+        if not length.isdigit() or int(length) < 1:
+            raise ValueError(f"invalid policy variant {spec.strip()!r}: expected LENGTH[-CLASS...]")
+        required = ALL_CHARACTER_CLASSES
+        for name in dropped:
+            if name not in CHARACTER_CLASSES:
+                raise ValueError(f"unknown character class {name!r}; use {', '.join(CHARACTER_CLASSES)}")
+            required &= ~CHARACTER_CLASSES[name]
+        variant = PolicyVariant(int(length), required)
+        if variant not in variants:
+            variants.append(variant)
+    return tuple(variants)
+
+
+class PolicyWhatIf:
+    # Scores every policy variant from one set of features per password (see
+    # audit.password_features) and keeps only counters, so partial results from
+    # workers merge like AssessmentStats.
+
+    def __init__(self, baseline: PolicyVariant, variants: tuple[PolicyVariant, ...]):
+        self.baseline = baseline
+        self.variants = variants
+        self.count = 0
+        self.failed = 0
+        self.failures = [0] * len(variants)
+        self.violations = [Counter() for _ in variants]
+        self.classes = [Counter() for _ in variants]
+        self.shifts = [Counter() for _ in variants]
+        self.baseline_classes: Counter = Counter()
+        # Many passwords share the same features, so each distinct tuple is
+        # scored against the variants once per chunk. Not pickled: partial
+        # results only ship their counters back from workers.
+        self._scored: dict[tuple, tuple] = {}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_scored"] = {}
+        return state
+
+    @staticmethod
+    def _score(variant: PolicyVariant, features: tuple[int, int, int, bool]) -> tuple[str, tuple[str, ...]]:
+        length, classes, _, _ = features
+        violations = class_violations(length, classes, variant.min_length, variant.required)
+        return policy_score(features, violations)[1], tuple(violations)
+
+    def add(self, features: tuple[int, int, int, bool]):
+        self.count += 1
+        scored = self._scored.get(features)
+        if scored is None:
+            scored = self._scored[features] = (
+                self._score(self.baseline, features)[0],
+                tuple(self._score(variant, features) for variant in self.variants),
+            )
+        current, rows = scored
+        self.baseline_classes[current] += 1
+        for index, (classification, violations) in enumerate(rows):
+            self.classes[index][classification] += 1
+            if classification != current:
+                self.shifts[index][(current, classification)] += 1
+            if violations:
+                self.failures[index] += 1
+                self.violations[index].update(violations)
+
+    def merge(self, other: "PolicyWhatIf"):
+        self.count += other.count
+        self.failed += other.failed
+        self.baseline_classes.update(other.baseline_classes)
+        for index in range(len(self.variants)):
+            self.failures[index] += other.failures[index]
+            self.violations[index].update(other.violations[index])
+            self.classes[index].update(other.classes[index])
+            self.shifts[index].update(other.shifts[index])
+
+    def _rate(self, hits: int) -> float:
+        return round(hits / self.count, 4) if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        rows = []
+        for index, variant in enumerate(self.variants):
+            shifts = self.shifts[index]
+            weaker = sum(
+                hits for (before, after), hits in shifts.items() if CLASS_ORDER.index(after) < CLASS_ORDER.index(before)
+            )
+            rows.append(
+                {
+                    "policy": variant.label,
+                    "min_length": variant.min_length,
+                    "required": [name for name, bit in CHARACTER_CLASSES.items() if variant.required & bit],
+                    "failures": self.failures[index],
+                    "failure_rate": self._rate(self.failures[index]),
+                    "violation_rates": {
+                        reason: self._rate(hits) for reason, hits in self.violations[index].most_common()
+                    },
+                    "classifications": {name: self.classes[index][name] for name in CLASS_ORDER},
+                    "weaker": weaker,
+                    "stronger": sum(shifts.values()) - weaker,
+                    "shifts": {f"{before}->{after}": hits for (before, after), hits in sorted(shifts.items())},
+                }
+            )
+        return {
+            "passwords": self.count,
+            "failed": self.failed,
+            "baseline": self.baseline.label,
+            "baseline_classifications": {name: self.baseline_classes[name] for name in CLASS_ORDER},
+            "variants": rows,
+        }
+
+
+def what_if_chunk(
+    func: Callable, baseline: PolicyVariant, variants: tuple[PolicyVariant, ...], chunk: list
+) -> PolicyWhatIf:
+    # Runs on the worker, like stats.aggregate_chunk: extracts features for a
+    # chunk and ships back only the counters.
+    matrix = PolicyWhatIf(baseline, variants)
+    for item in chunk:
+        try:
+            matrix.add(func(item))
+        except Exception:
+            matrix.failed += 1
+    return matrix
@@ -0,0 +1,140 @@
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from .compiled_profile import CompiledProfile
+
+PROFILE_CHECK_SAMPLE = 5000
+
+
+def _child_cpu_seconds() -> float:
+    # Counts only worker processes that have exited and been reaped, which
+    # the parallel and hybrid engines do when their pool shuts down.
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+@dataclass
+class StageTiming:
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    child_cpu_seconds: float = 0.0
+    items: int | None = None
+    engine: str | None = None
+
+    def to_dict(self) -> dict:
+        data = {
+            "name": self.name,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "child_cpu_seconds": round(self.child_cpu_seconds, 4),
+        }
+        if self.items is not None:
+            data["items"] = self.items
+            data["items_per_second"] = round(self.items / self.wall_seconds, 1) if self.wall_seconds > 0 else None
+        if self.engine:
+            data["engine"] = self.engine
+        return data
+
+
+class CheckTimings:
+    # Nanoseconds spent in each evaluate_password check, filled in through
+    # its timings argument.
+
+    def __init__(self):
+        self.totals: Counter = Counter()
+        self.calls = 0
+
+    def lap(self, name: str, since: int) -> int:
+        now = time.perf_counter_ns()
+        self.totals[name] += now - since
+        return now
+
+    def to_dict(self) -> dict:
+        overall = sum(self.totals.values()) or 1
+        return {
+            "passwords": self.calls,
+            "checks": {
+                name: {
+                    "total_ms": round(total / 1e6, 3),
+                    "mean_us": round(total / 1e3 / self.calls, 3) if self.calls else None,
+                    "share": round(total / overall, 3),
+                }
+                for name, total in self.totals.most_common()
+            },
+        }
+
+
+class RunProfiler:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: list[StageTiming] = []
+        self.checks: CheckTimings | None = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageTiming]:
+        # The caller may fill in items and engine on the yielded record.
+        record = StageTiming(name)
+        wall, cpu, child = time.perf_counter(), time.process_time(), _child_cpu_seconds()
+        try:
+            yield record
+        finally:
+            record.wall_seconds = time.perf_counter() - wall
+            record.cpu_seconds = time.process_time() - cpu
+            record.child_cpu_seconds = _child_cpu_seconds() - child
+            self.stages.append(record)
+
+    def engines(self) -> dict:
+        totals: dict[str, dict] = {}
+        for record in self.stages:
+            if not record.engine:
+                continue
+            entry = totals.setdefault(record.engine, {"stages": 0, "wall_seconds": 0.0, "items": 0})
+            entry["stages"] += 1
+            entry["wall_seconds"] += record.wall_seconds
+            entry["items"] += record.items or 0
+        for entry in totals.values():
+            entry["wall_seconds"] = round(entry["wall_seconds"], 4)
+            entry["items_per_second"] = (
+                round(entry["items"] / entry["wall_seconds"], 1) if entry["wall_seconds"] > 0 else None
+            )
+        return totals
+
+    def to_dict(self) -> dict:
+        data = {
+            "total_wall_seconds": round(time.perf_counter() - self.started, 4),
+            "stages": [record.to_dict() for record in self.stages],
+            "engines": self.engines(),
+        }
+        if self.checks is not None:
+            data["evaluate_password"] = self.checks.to_dict()
+        return data
+
+
+def profile_checks(
+    passwords: Iterable[str],
+    profile: "CompiledProfile",
+    policy_min_length: int,
+    limit: int = PROFILE_CHECK_SAMPLE,
+) -> CheckTimings:
+    # Runs in-process on a sample, so per-check timings do not have to travel
+    # back from engine workers alongside every result.
+    from .audit import evaluate_password
+
+    timings = CheckTimings()
+    for password in islice(passwords, limit):
+        evaluate_password(password, profile, policy_min_length, timings=timings)
+    return timings
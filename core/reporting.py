@@ -1,10 +1,28 @@
+import bisect
+import gzip
 import json
+import os
+import queue
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from .config import AUDIT_FORMATS
 from .metadata import APP_NAME, VERSION
-from .models import PasswordAssessment, RunSummary
-from .utils import sort_passwords
+from .models import PasswordAssessment, RunSummary, SubjectProfile
+from .stats import REPORT_QUANTILES, AssessmentStats
+from .utils import ExternalSorter, password_sort_key
+
+if TYPE_CHECKING:
+    from .engine import ItemError
+
+WRITER_BATCH_LINES = 512
+WRITER_QUEUE_BATCHES = 64
+PROFILE_SNAPSHOT_NAME = "profile.json"
+WORDLIST_CATEGORIES = ("weak", "medium", "strong", "full")
 
 
 def output_paths(output_root: Path, subject_slug: str) -> dict[str, Path]:
@@ -23,14 +41,269 @@ def output_paths(output_root: Path, subject_slug: str) -> dict[str, Path]:
     }
 
 
-def write_wordlists(wordlists_dir: Path, categorized: dict[str, set[str]]) -> dict[str, Path]:
-    paths: dict[str, Path] = {}
-    for category in ("weak", "medium", "strong", "full"):
-        file_path = wordlists_dir / f"{category}.txt"
-        values = categorized.get(category, set())
-        file_path.write_text("\n".join(sort_passwords(values)), encoding="utf-8")
-        paths[category] = file_path
-    return paths
+class BackgroundWriter:
+    # Lines are batched on the caller's thread and handed to a dedicated writer
+    # thread, so compression and disk I/O overlap with evaluation. The bounded
+    # queue applies backpressure instead of buffering an entire run in memory.
+
+    def __init__(self, path: Path, compress: bool = False, append: bool = False):
+        self.path = path
+        self.lines_written = 0
+        self._batch: list[str] = []
+        self._queue: queue.Queue = queue.Queue(maxsize=WRITER_QUEUE_BATCHES)
+        self._error: Exception | None = None
+        mode = "a" if append else "w"
+        if compress:
+            # Appending to a gzip file adds a new member; readers see one stream.
+            self._handle = gzip.open(path, f"{mode}t", encoding="utf-8", compresslevel=6)
+        else:
+            self._handle = path.open(mode, encoding="utf-8")
+        self._thread = threading.Thread(target=self._drain, name=f"writer-{path.name}", daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            try:
+                if self._error is None:
+                    self._handle.writelines(batch)
+            except Exception as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def write(self, text: str):
+        self._batch.append(text)
+        if len(self._batch) >= WRITER_BATCH_LINES:
+            self.flush()
+
+    def write_line(self, line: str):
+        self.write(f"{line}\n")
+        self.lines_written += 1
+
+    def flush(self):
+        if self._error is not None:
+            raise self._error
+        if self._batch:
+            self._queue.put(self._batch)
+            self._batch = []
+
+    def sync(self):
+        # Blocks until everything written so far has reached the file.
+        self.flush()
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+        self._handle.flush()
+
+    def close(self) -> Path:
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        self._handle.close()
+        if self._error is not None:
+            raise self._error
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def _output_name(stem: str, suffix: str, compress: bool) -> str:
+    return f"{stem}{suffix}.gz" if compress else f"{stem}{suffix}"
+
+
+def assessment_record(assessment: PasswordAssessment) -> str:
+    return json.dumps(asdict(assessment), ensure_ascii=False, separators=(",", ":"))
+
+
+def item_error_record(error: "ItemError", line: int) -> str:
+    # line is the 0-based position of the item among the non-blank input lines.
+    return json.dumps(
+        {"password": error.item, "line": line, "error": error.error_type, "message": error.message},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def audit_report_path(reports_dir: Path, fmt: str = "json", compress: bool = False) -> Path:
+    return reports_dir / _output_name("password-audit", f".{fmt}", compress)
+
+
+class AuditStreamWriter:
+    def __init__(self, reports_dir: Path, fmt: str = "json", compress: bool = False, append: bool = False):
+        if fmt not in AUDIT_FORMATS:
+            raise ValueError(f"Unknown audit format: {fmt}")
+        if append and fmt == "json":
+            raise ValueError("Only the ndjson audit format can be appended to")
+        self.format = fmt
+        self.count = 0
+        self._writer = BackgroundWriter(audit_report_path(reports_dir, fmt, compress), compress=compress, append=append)
+        if fmt == "json":
+            self._writer.write("[")
+
+    @property
+    def path(self) -> Path:
+        return self._writer.path
+
+    @property
+    def queue_depth(self) -> int:
+        return self._writer.queue_depth
+
+    def write(self, assessment: PasswordAssessment):
+        record = assessment_record(assessment)
+        if self.format == "ndjson":
+            self._writer.write_line(record)
+        else:
+            self._writer.write(f"{',' if self.count else ''}\n  {record}")
+        self.count += 1
+
+    def sync(self):
+        self._writer.sync()
+
+    def close(self) -> Path:
+        if self.format == "json":
+            self._writer.write("\n]\n")
+        return self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def wordlist_path(wordlists_dir: Path, category: str, compress: bool = False) -> Path:
+    return wordlists_dir / _output_name(category, ".txt", compress)
+
+
+def iter_wordlist(wordlists_dir: Path, category: str) -> Iterator[str]:
+    # Reads whichever of the plain or gzip-compressed wordlist a run wrote.
+    for compress in (False, True):
+        path = wordlist_path(wordlists_dir, category, compress)
+        if not path.exists():
+            continue
+        opener = gzip.open if compress else open
+        with opener(path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield line.rstrip("\n")
+        return
+
+
+class CategorizedWordlistWriter:
+    # Partitions one stream of classified candidates into the weak/medium/strong
+    # and full wordlists in a single pass. Each file has its own background
+    # writer, so all four are written concurrently. Presorted input (the
+    # generator's (len, lower, word) order) goes straight to disk. Unordered
+    # input is routed through an ExternalSorter per category and merged on close.
+
+    def __init__(
+        self,
+        wordlists_dir: Path,
+        presorted: bool = True,
+        compress: bool = False,
+        example_limit: int = 10,
+    ):
+        self.presorted = presorted
+        self.counts = {category: 0 for category in WORDLIST_CATEGORIES}
+        self.weak_examples: list[str] = []
+        self.example_limit = example_limit
+        self._last_keys: dict[str, tuple] = {}
+        self._writers = {
+            category: BackgroundWriter(wordlist_path(wordlists_dir, category, compress), compress=compress)
+            for category in WORDLIST_CATEGORIES
+        }
+        self._sorters = {} if presorted else {category: ExternalSorter() for category in WORDLIST_CATEGORIES}
+
+    @property
+    def paths(self) -> dict[str, Path]:
+        return {category: writer.path for category, writer in self._writers.items()}
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(writer.queue_depth for writer in self._writers.values())
+
+    def _emit(self, category: str, password: str) -> bool:
+        if not self.presorted:
+            self.counts[category] += 1
+            self._sorters[category].add(password)
+            return True
+        key = password_sort_key(password)
+        last = self._last_keys.get(category)
+        if last is not None and key <= last:
+            if key == last:
+                return False
+            raise ValueError(
+                f"Wordlist input is not in (len, lower, word) order at {password!r}; use presorted=False"
+            )
+        self._last_keys[category] = key
+        self.counts[category] += 1
+        self._writers[category].write_line(password)
+        return True
+
+    def add(self, password: str, classification: str | None):
+        if not self._emit("full", password) or classification is None:
+            return
+        self._emit(classification, password)
+        if classification == "weak":
+            # Keeps the lexicographically smallest weak passwords for the report.
+            if len(self.weak_examples) < self.example_limit:
+                bisect.insort(self.weak_examples, password)
+            elif password < self.weak_examples[-1]:
+                bisect.insort(self.weak_examples, password)
+                self.weak_examples.pop()
+
+    def _finish(self, category: str) -> Path:
+        writer = self._writers[category]
+        sorter = self._sorters.get(category)
+        if sorter is not None:
+            try:
+                for password in sorter:
+                    writer.write_line(password)
+            finally:
+                sorter.close()
+            self.counts[category] = writer.lines_written
+        return writer.close()
+
+    def close(self) -> dict[str, Path]:
+        with ThreadPoolExecutor(max_workers=len(WORDLIST_CATEGORIES)) as executor:
+            return dict(zip(WORDLIST_CATEGORIES, executor.map(self._finish, WORDLIST_CATEGORIES)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def write_completion_marker(directory: Path, stop_reason: str | None) -> Path:
+    marker_path = directory / "INCOMPLETE"
+    if stop_reason:
+        marker_path.write_text(f"Run stopped early: {stop_reason}\n", encoding="utf-8")
+    else:
+        marker_path.unlink(missing_ok=True)
+    return marker_path
+
+
+def write_profile_snapshot(reports_dir: Path, profile: SubjectProfile, policy_min_length: int) -> Path:
+    # Written last and swapped in with a rename, so a reader (the --serve
+    # daemon) only ever sees a complete snapshot after the wordlists exist.
+    path = reports_dir / PROFILE_SNAPSHOT_NAME
+    temp_path = path.with_name(f"{path.name}.tmp")
+    payload = {"profile": asdict(profile), "policy_min_length": policy_min_length}
+    temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(temp_path, path)
+    return path
 
 
 def write_run_summary(reports_dir: Path, summary: RunSummary) -> Path:
@@ -39,11 +312,87 @@ def write_run_summary(reports_dir: Path, summary: RunSummary) -> Path:
     return summary_path
 
 
-def write_password_audit(reports_dir: Path, assessments: list[PasswordAssessment]) -> Path:
-    audit_path = reports_dir / "password-audit.json"
-    serialized = [asdict(assessment) for assessment in assessments]
-    audit_path.write_text(json.dumps(serialized, indent=2), encoding="utf-8")
-    return audit_path
+def _format_quantiles(values: list) -> str:
+    return ", ".join(
+        f"p{round(fraction * 100):g}={value if value is not None else '-'}"
+        for fraction, value in zip(REPORT_QUANTILES, values)
+    )
+
+
+def audit_distribution_lines(stats: AssessmentStats, top: int = 5) -> list[str]:
+    if not stats.count:
+        return []
+    entropy = [round(value, 1) if value is not None else None for value in stats.entropy_quantiles()]
+    peak = max(stats.score_buckets().values()) or 1
+    lines = [
+        "Audit distribution:",
+        f"Passwords: {stats.count} (failed: {stats.failed})",
+        "Classes: " + ", ".join(f"{name}={stats.classifications[name]}" for name in ("weak", "medium", "strong")),
+        f"Score: mean {stats.mean_score:.1f}, min {stats.min_score}, max {stats.max_score}",
+        f"Score quantiles: {_format_quantiles(stats.score_quantiles())}",
+        f"Entropy: mean {stats.mean_entropy:.1f} bits",
+        f"Entropy quantiles (approx.): {_format_quantiles(entropy)}",
+        "Score histogram:",
+        *[
+            f"  {bucket:>6} | {'#' * round(30 * hits / peak):<30} {hits}"
+            for bucket, hits in stats.score_buckets().items()
+        ],
+    ]
+    if stats.reasons:
+        lines.append("Top reasons:")
+        lines.extend(f"- {reason} ({hits})" for reason, hits in stats.reasons.most_common(top))
+    if stats.violations:
+        lines.append("Top policy violations:")
+        lines.extend(f"- {violation} ({hits})" for violation, hits in stats.violations.most_common(top))
+    return lines
+
+
+def password_family_lines(families: dict, top: int = 10) -> list[str]:
+    lines = [
+        "Password families:",
+        f"Families: {families['families']} "
+        f"({families['passwords_in_families']} of {families['passwords']} audited passwords)",
+    ]
+    for family in families["largest"][:top]:
+        variants = ", ".join(family["base_words"])
+        lines.append(f"- {family['base']}: {family['size']} passwords (base words: {variants})")
+        lines.append(f"  e.g. {', '.join(family['examples'])}")
+    return lines
+
+
+def sample_estimate_lines(estimate: dict) -> list[str]:
+    if estimate["census"]:
+        scope = f"all {estimate['sample_size']} passwords, exact"
+    else:
+        scope = (
+            f"{estimate['sample_size']} sampled of {estimate['population_lines']} lines, "
+            f"{estimate['confidence'] * 100:g}% confidence, target +/-{estimate['target_precision'] * 100:g}%"
+        )
+    lines = [f"Sample estimate ({scope}):"]
+    for name, proportion in estimate["proportions"].items():
+        lines.append(
+            f"- {name}: {proportion['estimate'] * 100:.2f}% "
+            f"[{proportion['low'] * 100:.2f}%, {proportion['high'] * 100:.2f}%]"
+        )
+    if not estimate["precision_met"]:
+        lines.append("Target precision not reached (sample exhausted or run stopped).")
+    return lines
+
+
+def policy_what_if_lines(what_if: dict) -> list[str]:
+    baseline = what_if["baseline_classifications"]
+    lines = [
+        f"Policy what-if ({what_if['passwords']} audited passwords, current policy {what_if['baseline']}: "
+        f"weak {baseline['weak']} / medium {baseline['medium']} / strong {baseline['strong']}):",
+        f"{'Policy':<24} {'Fail %':>7} {'Weak':>8} {'Medium':>8} {'Strong':>8} {'Weaker':>8} {'Stronger':>8}",
+    ]
+    for row in what_if["variants"]:
+        classes = row["classifications"]
+        lines.append(
+            f"{row['policy']:<24} {row['failure_rate'] * 100:>6.1f}% {classes['weak']:>8} {classes['medium']:>8} "
+            f"{classes['strong']:>8} {row['weaker']:>8} {row['stronger']:>8}"
+        )
+    return lines
 
 
 def write_quick_report(
@@ -52,6 +401,7 @@ def write_quick_report(
     suggestions: list[str],
     weak_examples: list[str],
     nano_ai_tips: list[str],
+    audit_stats: AssessmentStats | None = None,
 ) -> Path:
     report_path = reports_dir / "report.txt"
     lines = [
@@ -59,15 +409,27 @@ def write_quick_report(
         f"{'=' * (len(APP_NAME) + 24)}",
         f"Version: {VERSION}",
         f"Subject: {summary.subject_name}",
+        f"Status: {'complete' if summary.completed else f'INCOMPLETE ({summary.stop_reason})'}",
         f"Generated candidates: {summary.generated_candidates}",
         f"Weak: {summary.weak_count}",
         f"Medium: {summary.medium_count}",
         f"Strong: {summary.strong_count}",
         f"Engine: {summary.engine_mode} ({summary.workers} workers)",
+        f"Failed items: {summary.failed_item_count}",
         "",
         "Top weak examples:",
         *[f"- {item}" for item in weak_examples],
         "",
+    ]
+    if summary.sample_estimate:
+        lines.extend([*sample_estimate_lines(summary.sample_estimate), ""])
+    if audit_stats is not None and audit_stats.count:
+        lines.extend([*audit_distribution_lines(audit_stats), ""])
+    if summary.password_families.get("largest"):
+        lines.extend([*password_family_lines(summary.password_families), ""])
+    if summary.policy_what_if.get("variants"):
+        lines.extend([*policy_what_if_lines(summary.policy_what_if), ""])
+    lines += [
         "Suggested passphrases:",
         *[f"- {item}" for item in suggestions],
         "",
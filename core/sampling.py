@@ -0,0 +1,89 @@
+import itertools
+import math
+import random
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from statistics import NormalDist
+
+MAX_SAMPLE_SIZE = 1_000_000
+FIRST_ROUND_SIZE = 2000
+SAMPLE_CLASSES = ("weak", "medium", "strong")
+
+
+def z_score(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def required_sample_size(proportion: float, precision: float, z: float) -> int:
+    # Normal-approximation size for a +/-precision interval around proportion;
+    # proportion=0.5 is the worst case and bounds every class at once.
+    return max(1, math.ceil(z * z * proportion * (1 - proportion) / (precision * precision)))
+
+
+def wilson_interval(hits: int, total: int, z: float) -> tuple[float, float]:
+    # Wilson score interval: unlike the plain normal interval it stays inside
+    # [0, 1] and is not degenerate for proportions near 0 or 1.
+    if not total:
+        return 0.0, 1.0
+    p = hits / total
+    denominator = 1 + z * z / total
+    centre = (p + z * z / (2 * total)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def reservoir_sample(items: Iterable, size: int, rng: random.Random) -> tuple[list, int]:
+    # Algorithm L (Li 1994): a uniform sample of `size` items in one pass that
+    # draws random numbers only for the O(size * log(n / size)) items that
+    # enter the reservoir. Skipped items are consumed by islice in C. Returns
+    # the sample and the number of items seen.
+    counter = itertools.count(1)
+    iterator = zip(items, counter)
+    reservoir = [item for item, _ in itertools.islice(iterator, size)]
+    if len(reservoir) < size:
+        return reservoir, len(reservoir)
+    weight = math.exp(math.log(1.0 - rng.random()) / size)
+    while True:
+        skip = math.floor(math.log(1.0 - rng.random()) / math.log(1.0 - weight)) if weight < 1.0 else 0
+        picked = next(itertools.islice(iterator, skip, None), None)
+        if picked is None:
+            # zip stops on the exhausted input before advancing the counter.
+            return reservoir, next(counter) - 1
+        reservoir[rng.randrange(size)] = picked[0]
+        weight *= math.exp(math.log(1.0 - rng.random()) / size)
+
+
+def sample_password_file(file_path: Path, size: int, rng: random.Random) -> tuple[list[str], int]:
+    # Samples raw lines (blank ones are dropped afterwards, like
+    # iter_passwords_from_file does) and shuffles them, so every prefix of the
+    # result is itself a uniform sample and rounds can grow it progressively.
+    with file_path.open("rb") as handle:
+        lines, seen = reservoir_sample(handle, size, rng)
+    passwords = [password for line in lines if (password := line.decode("utf-8", errors="ignore").strip())]
+    rng.shuffle(passwords)
+    return passwords, seen
+
+
+def proportion_estimates(counts: Mapping[str, int], total: int, z: float, exact: bool = False) -> dict[str, dict]:
+    estimates = {}
+    for name in SAMPLE_CLASSES:
+        hits = counts.get(name, 0)
+        estimate = hits / total if total else 0.0
+        low, high = (estimate, estimate) if exact else wilson_interval(hits, total, z)
+        estimates[name] = {
+            "estimate": round(estimate, 5),
+            "low": round(low, 5),
+            "high": round(high, 5),
+            "half_width": round((high - low) / 2, 5),
+        }
+    return estimates
+
+
+def next_sample_size(estimates: dict[str, dict], total: int, precision: float, z: float) -> int:
+    # Sizes the next round from the current intervals, taking the bound closest
+    # to 0.5 (the widest case) so one more round usually meets the target.
+    needed = total
+    for estimate in estimates.values():
+        worst = min(max(0.5, estimate["low"]), estimate["high"])
+        needed = max(needed, required_sample_size(worst, precision, z))
+    return max(needed, total + FIRST_ROUND_SIZE)
@@ -0,0 +1,339 @@
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import Logger
+from pathlib import Path
+
+from .audit import evaluate_password
+from .compiled_profile import EMPTY_PROFILE, CompiledProfile, compile_profile
+from .config import DEFAULT_POLICY_MIN_LENGTH
+from .models import SubjectProfile
+from .reporting import PROFILE_SNAPSHOT_NAME, iter_wordlist
+from .stats import KLLSketch
+
+DEFAULT_RELOAD_INTERVAL = 2.0
+MAX_REQUEST_BYTES = 64 * 1024
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost")
+BLOCKLIST_REASON = "Matches the subject's generated blocklist"
+
+
+@dataclass(frozen=True)
+class LoadedSubject:
+    slug: str
+    name: str
+    profile: CompiledProfile
+    blocklist: frozenset[str]
+    policy_min_length: int
+    complete: bool
+    signature: tuple[int, int]
+
+
+def _read_blocklist(wordlists_dir: Path) -> frozenset[str]:
+    return frozenset(line.lower() for line in iter_wordlist(wordlists_dir, "full"))
+
+
+class SubjectRegistry:
+    # Subjects are rebuilt only when their profile snapshot changes and are
+    # published by swapping the whole dict, so request threads read without
+    # locking and never see a half-loaded subject.
+
+    def __init__(self, output_root: Path, logger: Logger | None = None):
+        self.output_root = output_root
+        self.logger = logger
+        self.reloads = 0
+        self._subjects: dict[str, LoadedSubject] = {}
+        self._refresh_lock = threading.Lock()
+
+    def _snapshot_paths(self) -> dict[str, Path]:
+        reports_dir = self.output_root / "reports"
+        if not reports_dir.is_dir():
+            return {}
+        return {path.parent.name: path for path in reports_dir.glob(f"*/{PROFILE_SNAPSHOT_NAME}")}
+
+    def _load(self, slug: str, snapshot_path: Path, signature: tuple[int, int]) -> LoadedSubject:
+        data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+        profile = SubjectProfile(**data["profile"])
+        wordlists_dir = self.output_root / "wordlists" / slug
+        return LoadedSubject(
+            slug=slug,
+            name=profile.name,
+            profile=compile_profile(profile),
+            blocklist=_read_blocklist(wordlists_dir),
+            policy_min_length=data.get("policy_min_length", DEFAULT_POLICY_MIN_LENGTH),
+            complete=not (wordlists_dir / "INCOMPLETE").exists(),
+            signature=signature,
+        )
+
+    def refresh(self) -> int:
+        with self._refresh_lock:
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        snapshots = self._snapshot_paths()
+        subjects = {slug: subject for slug, subject in self._subjects.items() if slug in snapshots}
+        changed = len(self._subjects) - len(subjects)
+        for slug, snapshot_path in sorted(snapshots.items()):
+            try:
+                info = snapshot_path.stat()
+                signature = (info.st_mtime_ns, info.st_size)
+                if slug in subjects and subjects[slug].signature == signature:
+                    continue
+                subjects[slug] = self._load(slug, snapshot_path, signature)
+            except (OSError, ValueError, TypeError, KeyError) as error:
+                if self.logger:
+                    self.logger.warning("Could not load subject '%s': %s", slug, error)
+                continue
+            changed += 1
+            if self.logger:
+                self.logger.info(
+                    "Loaded subject '%s' (%d blocklist entries)", slug, len(subjects[slug].blocklist)
+                )
+        if changed:
+            self._subjects = subjects
+            self.reloads += 1
+        return changed
+
+    def get(self, slug: str) -> LoadedSubject | None:
+        return self._subjects.get(slug)
+
+    def __len__(self) -> int:
+        return len(self._subjects)
+
+
+class PasswordCheckService:
+    def __init__(self, registry: SubjectRegistry, policy_min_length: int = DEFAULT_POLICY_MIN_LENGTH):
+        self.registry = registry
+        self.policy_min_length = policy_min_length
+        self.requests = 0
+        self.started = time.time()
+        self._latency = KLLSketch()
+        self._latency_lock = threading.Lock()
+
+    def check(self, request: dict) -> dict:
+        started = time.perf_counter()
+        password = request.get("password")
+        if not isinstance(password, str) or not password:
+            raise ValueError("'password' must be a non-empty string")
+        slug = request.get("subject")
+        subject = None
+        if slug is not None:
+            if not isinstance(slug, str):
+                raise ValueError("'subject' must be a string")
+            subject = self.registry.get(slug)
+            if subject is None:
+                raise LookupError(f"Unknown subject '{slug}'")
+
+        policy_min_length = request.get("policy_min_length")
+        if policy_min_length is None:
+            policy_min_length = subject.policy_min_length if subject else self.policy_min_length
+        # bool is an int subclass, so true/false are rejected explicitly.
+        elif isinstance(policy_min_length, bool) or not isinstance(policy_min_length, int) or policy_min_length < 1:
+            raise ValueError("'policy_min_length' must be a positive integer")
+        assessment = evaluate_password(password, subject.profile if subject else EMPTY_PROFILE, policy_min_length)
+        blocklisted = subject is not None and password.lower() in subject.blocklist
+        if blocklisted:
+            assessment.reasons.append(BLOCKLIST_REASON)
+            assessment.classification = "weak"
+
+        # The password itself is never echoed back.
+        result = asdict(assessment)
+        del result["password"]
+        result["subject"] = subject.slug if subject else None
+        result["blocklisted"] = blocklisted
+        result["allowed"] = not blocklisted and assessment.classification != "weak" and not assessment.policy_violations
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._latency_lock:
+            self.requests += 1
+            self._latency.update(elapsed_ms)
+        return result
+
+    def health(self) -> dict:
+        with self._latency_lock:
+            p50, p99 = self._latency.quantiles((0.5, 0.99))
+            requests = self.requests
+        return {
+            "status": "ok",
+            "subjects": len(self.registry),
+            "reloads": self.registry.reloads,
+            "requests": requests,
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "check_latency_ms": {
+                "p50": round(p50, 3) if p50 is not None else None,
+                "p99": round(p99, 3) if p99 is not None else None,
+            },
+        }
+
+    def dispatch(self, operation: str, payload: dict) -> tuple[int, dict]:
+        try:
+            if operation == "check":
+                return 200, self.check(payload)
+            if operation == "health":
+                return 200, self.health()
+            if operation == "reload":
+                return 200, {"changed": self.registry.refresh(), "subjects": len(self.registry)}
+            return 404, {"error": f"Unknown operation '{operation}'"}
+        except LookupError as error:
+            return 404, {"error": str(error)}
+        except ValueError as error:
+            return 400, {"error": str(error)}
+
+
+class _UnixHandler(socketserver.StreamRequestHandler):
+    # One JSON object per line in, one JSON object per line out. An optional
+    # "op" field selects check (default), health or reload.
+
+    def handle(self):
+        service: PasswordCheckService = self.server.service
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if not line:
+                return
+            try:
+                if len(line) > MAX_REQUEST_BYTES:
+                    raise ValueError("request too large")
+                payload = json.loads(line)
+                if not isinstance(payload, dict):
+                    raise ValueError("request must be a JSON object")
+                _, response = service.dispatch(payload.get("op", "check"), payload)
+            except ValueError as error:
+                response = {"error": str(error)}
+            self.wfile.write(json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Buffered writes send headers and body as one segment; with Nagle off
+    # that avoids a delayed-ACK stall on every keep-alive request.
+    wbufsize = -1
+    routes = {"/check": "check", "/reload": "reload", "/health": "health"}
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _respond(self, status: int, body: dict):
+        data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._respond(404, {"error": f"Unknown path '{self.path}'"})
+            return
+        self._respond(*self.server.service.dispatch("health", {}))
+
+    def do_POST(self):
+        # The body is read only for a well-formed length: a bad or negative
+        # value would raise, or make rfile.read(-1) wait for the client to
+        # close. The connection is dropped after either error, as the unread
+        # body would otherwise be parsed as the next request.
+        header = (self.headers.get("Content-Length") or "0").strip()
+        if not header.isascii() or not header.isdigit():
+            self.close_connection = True
+            self._respond(400, {"error": "invalid Content-Length"})
+            return
+        length = int(header)
+        if length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            self._respond(413, {"error": "request too large"})
+            return
+        body = self.rfile.read(length)
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as error:
+            self._respond(400, {"error": str(error)})
+            return
+        self._respond(*self.server.service.dispatch(self.routes.get(self.path, self.path), payload))
+
+    def log_message(self, format, *args):
+        # Request lines are not logged; bodies carry passwords.
+        return
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+def create_server(address: str, service: PasswordCheckService):
+    from .engine.distributed_engine import parse_address
+
+    target, family = parse_address(address)
+    if family == "AF_UNIX":
+        path = Path(target)
+        if path.exists() and stat.S_ISSOCK(path.stat().st_mode):
+            path.unlink()
+        server = _UnixServer(str(path), _UnixHandler)
+        os.chmod(path, 0o660)
+    else:
+        if target[0] not in LOOPBACK_HOSTS:
+            raise ValueError(f"Refusing to serve on non-loopback host '{target[0]}'")
+        server = _HTTPServer(target, _HTTPHandler)
+    server.service = service
+    return server
+
+
+def server_address(server) -> str:
+    if isinstance(server, _UnixServer):
+        return f"unix:{server.server_address}"
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def run_server(
+    address: str,
+    output_root: Path,
+    policy_min_length: int = DEFAULT_POLICY_MIN_LENGTH,
+    reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+    logger: Logger | None = None,
+    on_ready=None,
+) -> int:
+    registry = SubjectRegistry(output_root, logger=logger)
+    registry.refresh()
+    service = PasswordCheckService(registry, policy_min_length)
+    server = create_server(address, service)
+    stop = threading.Event()
+
+    def reload_loop():
+        while not stop.wait(reload_interval):
+            registry.refresh()
+
+    def request_shutdown(signum=None, frame=None):
+        stop.set()
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    reloader = threading.Thread(target=reload_loop, name="vx-serve-reload", daemon=True)
+    reloader.start()
+    previous = {sig: signal.signal(sig, request_shutdown) for sig in (signal.SIGINT, signal.SIGTERM)}
+    if logger:
+        logger.info("Serving password checks on %s (%d subject(s))", server_address(server), len(registry))
+    if on_ready:
+        on_ready(server_address(server), len(registry))
+    try:
+        server.serve_forever()
+    finally:
+        stop.set()
+        server.server_close()
+        if isinstance(server, _UnixServer):
+            Path(server.server_address).unlink(missing_ok=True)
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+    return 0
@@ -0,0 +1,305 @@
+import hashlib
+import math
+import random
+from collections import Counter
+from collections.abc import Callable, Iterable
+
+from .models import PasswordAssessment
+
+DEFAULT_SKETCH_K = 200
+DEFAULT_HLL_PRECISION = 12
+ENTROPY_BIN_WIDTH = 8
+REPORT_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+AGGREGATE_CHUNK_SIZE = 2048
+
+
+class KLLSketch:
+    # Mergeable quantile sketch (Karnin, Lang, Liberty 2016). Each level holds
+    # items of weight 2**level. A full level is sorted and every other item is
+    # promoted, so memory stays O(k) however many values are added.
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: int | None = None):
+        self.k = k
+        self.count = 0
+        self.levels: list[list[float]] = [[]]
+        self._rng = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _retained(self) -> int:
+        return sum(len(items) for items in self.levels)
+
+    def _max_retained(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def _compress(self):
+        while self._retained() >= self._max_retained():
+            for level, items in enumerate(self.levels):
+                if len(items) < self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                items.sort()
+                keep = [items.pop()] if len(items) % 2 else []
+                offset = self._rng.randint(0, 1)
+                self.levels[level + 1].extend(items[offset::2])
+                self.levels[level] = keep
+                break
+
+    def update(self, value: float):
+        self.levels[0].append(value)
+        self.count += 1
+        if len(self.levels[0]) >= self._capacity(0):
+            self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, fractions: Iterable[float]) -> list[float | None]:
+        weighted = sorted(
+            (value, 1 << level) for level, items in enumerate(self.levels) for value in items
+        )
+        total = sum(weight for _, weight in weighted)
+        results: list[float | None] = []
+        for fraction in fractions:
+            if not weighted:
+                results.append(None)
+                continue
+            target = fraction * total
+            running = 0
+            chosen = weighted[-1][0]
+            for value, weight in weighted:
+                running += weight
+                if running >= target:
+                    chosen = value
+                    break
+            results.append(chosen)
+        return results
+
+    def state(self) -> dict:
+        return {"k": self.k, "count": self.count, "levels": self.levels}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "KLLSketch":
+        sketch = cls(k=state["k"])
+        sketch.count = state["count"]
+        sketch.levels = [list(items) for items in state["levels"]] or [[]]
+        return sketch
+
+
+class HyperLogLog:
+    # Mergeable distinct-count sketch (Flajolet et al. 2007): 2**precision
+    # one-byte registers, about 1.6% standard error at the default precision,
+    # with linear counting for small cardinalities.
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: str):
+        digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        width = 64 - self.precision
+        index = hashed >> width
+        rank = width - (hashed & ((1 << width) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog"):
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> int:
+        size = len(self.registers)
+        zeros = self.registers.count(0)
+        if zeros == size:
+            return 0
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = alpha * size * size / sum(2.0**-rank for rank in self.registers)
+        if raw <= 2.5 * size and zeros:
+            return round(size * math.log(size / zeros))
+        return round(raw)
+
+    def state(self) -> dict:
+        import base64
+
+        return {"precision": self.precision, "registers": base64.b64encode(self.registers).decode("ascii")}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "HyperLogLog":
+        import base64
+
+        sketch = cls(precision=state["precision"])
+        sketch.registers = bytearray(base64.b64decode(state["registers"]))
+        return sketch
+
+
+class AssessmentStats:
+    # Constant-memory summary of a stream of assessments. Partials built on
+    # workers or per chunk combine with merge(), so nothing per password has
+    # to be retained to report the distribution.
+
+    def __init__(self, sketch_k: int = DEFAULT_SKETCH_K):
+        self.count = 0
+        self.failed = 0
+        self.classifications: Counter = Counter()
+        self.score_histogram = [0] * 101
+        self.entropy_histogram: Counter = Counter()
+        self.entropy_sketch = KLLSketch(k=sketch_k)
+        self.distinct = HyperLogLog()
+        self.reasons: Counter = Counter()
+        self.violations: Counter = Counter()
+        self.score_total = 0
+        self.entropy_total = 0.0
+
+    def add(self, assessment: PasswordAssessment):
+        self.count += 1
+        self.classifications[assessment.classification] += 1
+        self.score_histogram[assessment.score] += 1
+        self.score_total += assessment.score
+        self.entropy_total += assessment.entropy_bits
+        self.entropy_histogram[int(assessment.entropy_bits // ENTROPY_BIN_WIDTH) * ENTROPY_BIN_WIDTH] += 1
+        self.entropy_sketch.update(assessment.entropy_bits)
+        self.distinct.add(assessment.password)
+        self.reasons.update(assessment.reasons)
+        self.violations.update(assessment.policy_violations)
+
+    def update(self, assessments: Iterable[PasswordAssessment]):
+        for assessment in assessments:
+            self.add(assessment)
+
+    def merge(self, other: "AssessmentStats") -> "AssessmentStats":
+        self.count += other.count
+        self.failed += other.failed
+        self.classifications.update(other.classifications)
+        self.score_histogram = [left + right for left, right in zip(self.score_histogram, other.score_histogram)]
+        self.entropy_histogram.update(other.entropy_histogram)
+        self.entropy_sketch.merge(other.entropy_sketch)
+        self.distinct.merge(other.distinct)
+        self.reasons.update(other.reasons)
+        self.violations.update(other.violations)
+        self.score_total += other.score_total
+        self.entropy_total += other.entropy_total
+        return self
+
+    @property
+    def mean_score(self) -> float | None:
+        return self.score_total / self.count if self.count else None
+
+    @property
+    def mean_entropy(self) -> float | None:
+        return self.entropy_total / self.count if self.count else None
+
+    @property
+    def distinct_estimate(self) -> int:
+        return min(self.count, self.distinct.estimate())
+
+    @property
+    def reused_estimate(self) -> int:
+        # Assessments whose password already appeared earlier in the stream.
+        return self.count - self.distinct_estimate
+
+    @property
+    def min_score(self) -> int | None:
+        return next((score for score, hits in enumerate(self.score_histogram) if hits), None)
+
+    @property
+    def max_score(self) -> int | None:
+        return next((score for score in range(100, -1, -1) if self.score_histogram[score]), None)
+
+    def score_quantiles(self, fractions: Iterable[float] = REPORT_QUANTILES) -> list[int | None]:
+        # Scores are integers 0-100, so the histogram answers quantiles exactly.
+        results: list[int | None] = []
+        for fraction in fractions:
+            if not self.count:
+                results.append(None)
+                continue
+            target = fraction * self.count
+            running = 0
+            for score, hits in enumerate(self.score_histogram):
+                running += hits
+                if hits and running >= target:
+                    results.append(score)
+                    break
+        return results
+
+    def entropy_quantiles(self, fractions: Iterable[float] = REPORT_QUANTILES) -> list[float | None]:
+        return self.entropy_sketch.quantiles(fractions)
+
+    def score_buckets(self, width: int = 10) -> dict[str, int]:
+        buckets: dict[str, int] = {}
+        for start in range(0, 100, width):
+            end = start + width - 1 if start + width < 100 else 100
+            buckets[f"{start}-{end}"] = sum(self.score_histogram[start : end + 1])
+        return buckets
+
+    def state(self) -> dict:
+        # Complete, JSON-safe state (unlike to_dict, which is a lossy report).
+        return {
+            "count": self.count,
+            "failed": self.failed,
+            "classifications": dict(self.classifications),
+            "score_histogram": self.score_histogram,
+            "entropy_histogram": {str(start): hits for start, hits in self.entropy_histogram.items()},
+            "entropy_sketch": self.entropy_sketch.state(),
+            "distinct": self.distinct.state(),
+            "reasons": dict(self.reasons),
+            "violations": dict(self.violations),
+            "score_total": self.score_total,
+            "entropy_total": self.entropy_total,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "AssessmentStats":
+        stats = cls()
+        stats.count = state["count"]
+        stats.failed = state["failed"]
+        stats.classifications = Counter(state["classifications"])
+        stats.score_histogram = list(state["score_histogram"])
+        stats.entropy_histogram = Counter({int(start): hits for start, hits in state["entropy_histogram"].items()})
+        stats.entropy_sketch = KLLSketch.from_state(state["entropy_sketch"])
+        stats.distinct = HyperLogLog.from_state(state["distinct"])
+        stats.reasons = Counter(state["reasons"])
+        stats.violations = Counter(state["violations"])
+        stats.score_total = state["score_total"]
+        stats.entropy_total = state["entropy_total"]
+        return stats
+
+    def to_dict(self, top: int = 10) -> dict:
+        return {
+            "count": self.count,
+            "failed": self.failed,
+            "classifications": dict(self.classifications),
+            "mean_score": round(self.mean_score, 2) if self.count else None,
+            "mean_entropy_bits": round(self.mean_entropy, 2) if self.count else None,
+            "distinct_estimate": self.distinct_estimate,
+            "reused_estimate": self.reused_estimate,
+            "score_quantiles": dict(zip(map(str, REPORT_QUANTILES), self.score_quantiles())),
+            "entropy_quantiles": {
+                str(fraction): (round(value, 2) if value is not None else None)
+                for fraction, value in zip(REPORT_QUANTILES, self.entropy_quantiles())
+            },
+            "score_histogram": self.score_buckets(),
+            "entropy_histogram": {
+                f"{start}-{start + ENTROPY_BIN_WIDTH}": hits for start, hits in sorted(self.entropy_histogram.items())
+            },
+            "top_reasons": dict(self.reasons.most_common(top)),
+            "top_violations": dict(self.violations.most_common(top)),
+        }
+
+
+def aggregate_chunk(func: Callable, chunk: list) -> AssessmentStats:
+    # Runs on the worker: evaluates a chunk and ships back only its summary.
+    stats = AssessmentStats()
+    for item in chunk:
+        try:
+            stats.add(func(item))
+        except Exception:
+            stats.failed += 1
+    return stats
@@ -1,7 +1,9 @@
 from .styles import BLUE, CYAN, GREEN, RED, RESET, YELLOW
 from .terminal import (
+    end_progress,
     print_error,
     print_info,
+    print_progress,
     print_success,
     print_warning,
     prompt_text,
@@ -15,8 +17,10 @@ __all__ = [
     "RED",
     "RESET",
     "YELLOW",
+    "end_progress",
     "print_error",
     "print_info",
+    "print_progress",
     "print_success",
     "print_warning",
     "prompt_text",
@@ -1,5 +1,4 @@
 import os
-import platform
 import sys
 
 from ..metadata import (
@@ -15,7 +14,7 @@ from .styles import BLUE, CYAN, GREEN, RED, RESET, YELLOW
 def clear_terminal():
     if not sys.stdout.isatty():
         return
-    os.system("cls" if platform.system() == "Windows" else "clear")
+    os.system("cls" if os.name == "nt" else "clear")
 
 
 def _banner_line(text: str, width: int = 67) -> str:
@@ -57,6 +56,16 @@ def print_info(message: str):
     print(f"{BLUE}[i] {message}{RESET}")
 
 
+def print_progress(label: str, completed: int, rate: float):
+    sys.stderr.write(f"\r{CYAN}[~] {label}: {completed} done | {rate:,.0f}/s{RESET}   ")
+    sys.stderr.flush()
+
+
+def end_progress():
+    sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
 def prompt_text(label: str, optional: bool = False) -> str:
     suffix = " (optional)" if optional else ""
     return input(f"{CYAN}{label}{suffix}: {RESET}").strip()
@@ -1,6 +1,15 @@
+import heapq
+import os
+import queue
 import re
+import threading
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
+EXTERNAL_SORT_RUN_SIZE = 250000
+STREAM_PENDING_LINES = 8192
+STREAM_BATCH_LINES = 1024
+
 
 def slugify(value: str) -> str:
     text = value.strip().lower()
@@ -44,12 +53,117 @@ def normalize_text(value: str | None, max_len: int = 64) -> str | None:
     return cleaned[:max_len]
 
 
-def sort_passwords(values: set[str] | list[str]) -> list[str]:
-    return sorted(values, key=lambda word: (len(word), word.lower(), word))
+def password_sort_key(word: str) -> tuple[int, str, str]:
+    return (len(word), word.lower(), word)
+
+
+class ExternalSorter:
+    # Sorts more lines than fit in memory: full runs are sorted and spilled to
+    # temporary files, then merged lazily with heapq.merge. Duplicates are
+    # dropped during the merge.
+
+    def __init__(self, run_size: int = EXTERNAL_SORT_RUN_SIZE, temp_dir: Path | None = None):
+        self.run_size = max(1, run_size)
+        self.temp_dir = temp_dir
+        self._buffer: list[str] = []
+        self._runs: list[Path] = []
+
+    def add(self, value: str):
+        self._buffer.append(value)
+        if len(self._buffer) >= self.run_size:
+            self._spill()
+
+    def extend(self, values: Iterable[str]):
+        for value in values:
+            self.add(value)
+
+    def _spill(self):
+        import tempfile
+
+        self._buffer.sort(key=password_sort_key)
+        handle, name = tempfile.mkstemp(prefix="vx-sort-", suffix=".run", dir=self.temp_dir)
+        with os.fdopen(handle, "w", encoding="utf-8") as run:
+            run.writelines(f"{value}\n" for value in self._buffer)
+        self._runs.append(Path(name))
+        self._buffer = []
+
+    def _read_run(self, path: Path) -> Iterator[str]:
+        with path.open("r", encoding="utf-8") as run:
+            for line in run:
+                yield line[:-1]
+
+    def __iter__(self) -> Iterator[str]:
+        self._buffer.sort(key=password_sort_key)
+        sources = [self._read_run(path) for path in self._runs]
+        previous = None
+        for value in heapq.merge(*sources, self._buffer, key=password_sort_key):
+            if value != previous:
+                yield value
+            previous = value
+
+    def close(self):
+        for path in self._runs:
+            path.unlink(missing_ok=True)
+        self._runs = []
+        self._buffer = []
+
+
+def iter_password_batches_from_stream(
+    stream: Iterable[str],
+    max_batch: int = STREAM_BATCH_LINES,
+    on_idle: Callable[[], None] | None = None,
+    max_pending: int = STREAM_PENDING_LINES,
+) -> Iterator[list[str]]:
+    # A reader thread fills a bounded queue, so memory stays flat for endless
+    # input and a slow consumer pushes back on the producer. Each batch is
+    # whatever is already buffered (up to max_batch); the generator blocks only
+    # when nothing is, after running on_idle.
+    pending: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+    finished = object()
+
+    def read():
+        try:
+            for line in stream:
+                password = line.strip()
+                if password:
+                    pending.put(password)
+        finally:
+            pending.put(finished)
+
+    threading.Thread(target=read, name="vx-stream-reader", daemon=True).start()
+    while True:
+        batch: list[str] = []
+        while len(batch) < max_batch:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                if batch:
+                    break
+                if on_idle is not None:
+                    on_idle()
+                item = pending.get()
+            if item is finished:
+                if batch:
+                    yield batch
+                return
+            batch.append(item)
+        yield batch
+
+
+def iter_passwords_from_stream(
+    stream: Iterable[str],
+    on_idle: Callable[[], None] | None = None,
+    max_pending: int = STREAM_PENDING_LINES,
+) -> Iterator[str]:
+    for batch in iter_password_batches_from_stream(stream, on_idle=on_idle, max_pending=max_pending):
+        yield from batch
 
 
-def load_passwords_from_file(file_path: Path) -> list[str]:
+def iter_passwords_from_file(file_path: Path):
     if not file_path.exists():
         raise FileNotFoundError(f"Password file not found: {file_path}")
-    lines = file_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    return [line.strip() for line in lines if line.strip()]
+    with file_path.open("r", encoding="utf-8", errors="ignore") as handle:
+        for line in handle:
+            password = line.strip()
+            if password:
+                yield password
@@ -1,5 +1,6 @@
 import re
 
+from .compiled_profile import CompiledProfile, compile_profile
 from .models import SubjectProfile
 from .utils import normalize_text
 
@@ -19,7 +20,9 @@ def sanitize_profile(profile: SubjectProfile) -> SubjectProfile:
     return profile
 
 
-def validate_profile(profile: SubjectProfile) -> tuple[list[str], list[str]]:
+def validate_profile(
+    profile: SubjectProfile, compiled: CompiledProfile | None = None
+) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
 
@@ -43,7 +46,7 @@ def validate_profile(profile: SubjectProfile) -> tuple[list[str], list[str]]:
         elif profile.last_rotation_days > 365:
             warnings.append("password rotation is older than 365 days")
 
-    if len(profile.all_tokens()) < 3:
+    if len((compiled or compile_profile(profile)).raw_tokens) < 3:
         warnings.append("very little profile context provided; weak-pattern detection may be limited")
 
     return errors, warnings
@@ -0,0 +1,258 @@
+import ctypes
+import ctypes.util
+import gzip
+import json
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+
+from .logging_setup import LOGGER_NAME
+from .models import PasswordAssessment, RunSummary
+from .stats import AssessmentStats
+
+logger = logging.getLogger(f"{LOGGER_NAME}.watch")
+
+WATCH_STATE_NAME = "watch-state.json"
+DEFAULT_WATCH_INTERVAL = 1.0
+WATCH_READ_BYTES = 1024 * 1024
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class TailedFile:
+    # Tracks how far a file has been consumed by byte offset plus inode, so a
+    # restart resumes exactly where the last committed batch ended. A new
+    # inode (rotation) or a file shorter than the offset (truncation) starts
+    # over from the beginning.
+
+    def __init__(self, path: Path, offset: int = 0, inode: int | None = None, skipping: bool = False):
+        self.path = path
+        self.offset = offset
+        self.inode = inode
+        # Set while inside a line longer than the read size; the rest of that
+        # line is discarded up to its newline.
+        self.skipping = skipping
+        self._pending: tuple[int, int, bool] | None = None
+
+    def read_lines(self, max_bytes: int = WATCH_READ_BYTES) -> list[str]:
+        # Returns the next complete lines without moving the offset; commit()
+        # advances it once they have been audited and written.
+        self._pending = None
+        try:
+            handle = self.path.open("rb")
+        except FileNotFoundError:
+            return []
+        with handle:
+            info = os.fstat(handle.fileno())
+            offset = self.offset
+            skipping = self.skipping
+            if info.st_ino != self.inode or info.st_size < offset:
+                offset, skipping = 0, False
+            if info.st_size == offset:
+                return []
+            handle.seek(offset)
+            data = handle.read(max_bytes)
+        start = 0
+        if skipping:
+            start = data.find(b"\n") + 1
+            if not start:
+                self._pending = (offset + len(data), info.st_ino, True)
+                return []
+        # A half-written last line waits for its newline.
+        end = data.rfind(b"\n") + 1
+        if end <= start:
+            if len(data) == max_bytes:
+                # No newline within max_bytes: no password is that long, so the
+                # line is skipped rather than stalling the file forever.
+                logger.warning("Skipping a line over %d bytes in %s at offset %d", max_bytes, self.path, offset + start)
+                self._pending = (offset + len(data), info.st_ino, True)
+            elif start:
+                self._pending = (offset + start, info.st_ino, False)
+            return []
+        self._pending = (offset + end, info.st_ino, False)
+        lines = []
+        for raw in data[start:end].splitlines():
+            password = raw.decode("utf-8", errors="ignore").strip()
+            if password:
+                lines.append(password)
+        return lines
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    def commit(self):
+        if self._pending is not None:
+            self.offset, self.inode, self.skipping = self._pending
+            self._pending = None
+
+    def state(self) -> dict:
+        return {"offset": self.offset, "inode": self.inode, "skipping": self.skipping}
+
+
+class PollingWatcher:
+    kind = "polling"
+
+    def __init__(self, interval: float = DEFAULT_WATCH_INTERVAL):
+        self.interval = interval
+
+    def wait(self, timeout: float):
+        time.sleep(min(self.interval, timeout))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    # Watches the parent directories rather than the files themselves, so
+    # files that are created, replaced or rotated later are still noticed.
+    kind = "inotify"
+
+    def __init__(self, paths: list[Path]):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._names: dict[int, set[str]] = {}
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        directories: dict[Path, set[str]] = {}
+        for path in paths:
+            directories.setdefault(path.parent, set()).add(path.name)
+        for directory, names in directories.items():
+            descriptor = libc.inotify_add_watch(self._fd, os.fsencode(directory), mask)
+            if descriptor < 0:
+                code = ctypes.get_errno()
+                self.close()
+                raise OSError(code, f"inotify_add_watch failed for {directory}")
+            self._names[descriptor] = names
+
+    def _drain(self) -> bool:
+        relevant = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return relevant
+            position = 0
+            while position < len(data):
+                descriptor, _, _, length = _EVENT_HEADER.unpack_from(data, position)
+                position += _EVENT_HEADER.size
+                name = data[position : position + length].rstrip(b"\0").decode(errors="ignore")
+                position += length
+                relevant = relevant or name in self._names.get(descriptor, ())
+
+    def wait(self, timeout: float):
+        # Returns on the first relevant event or after timeout, whichever is
+        # first; events for unrelated files in the same directory are skipped.
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if ready and self._drain():
+                return
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(paths: list[Path], interval: float = DEFAULT_WATCH_INTERVAL):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(interval)
+
+
+def file_key(path: Path) -> str:
+    return str(path.resolve())
+
+
+def load_watch_state(reports_dir: Path) -> dict | None:
+    path = reports_dir / WATCH_STATE_NAME
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def save_watch_state(reports_dir: Path, files: list[TailedFile], stats: AssessmentStats) -> Path:
+    # Saved only after the batch's records are on disk, so offsets never run
+    # ahead of the report. A crash in between re-audits that one batch.
+    path = reports_dir / WATCH_STATE_NAME
+    temp_path = path.with_name(f"{path.name}.tmp")
+    payload = {
+        "files": {file_key(tailed.path): tailed.state() for tailed in files},
+        "stats": stats.state(),
+        "updated_at": time.time(),
+    }
+    temp_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(temp_path, path)
+    return path
+
+
+def load_audit_stats(path: Path, compress: bool = False) -> AssessmentStats:
+    # Rebuilds the counters from an existing audit report, so a first --watch
+    # after a normal run continues that run's totals. AuditStreamWriter writes
+    # one record per line in both formats; a json report only adds the
+    # enclosing brackets and a trailing comma on each record.
+    stats = AssessmentStats()
+    if not path.exists():
+        return stats
+    opener = gzip.open if compress else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            record = line.strip().rstrip(",")
+            if record and record not in ("[", "]"):
+                stats.add(PasswordAssessment(**json.loads(record)))
+    return stats
+
+
+def update_watch_summary(
+    reports_dir: Path,
+    subject_name: str,
+    subject_slug: str,
+    stats: AssessmentStats,
+    engine_mode: str,
+    workers: int,
+    policy_min_length: int,
+) -> Path:
+    summary_path = reports_dir / "summary.json"
+    known = {item.name for item in fields(RunSummary)}
+    try:
+        data = json.loads(summary_path.read_text(encoding="utf-8"))
+        summary = RunSummary(**{key: value for key, value in data.items() if key in known})
+    except (OSError, ValueError, TypeError):
+        summary = RunSummary(
+            subject_name=subject_name,
+            subject_slug=subject_slug,
+            generated_candidates=0,
+            weak_count=0,
+            medium_count=0,
+            strong_count=0,
+            engine_mode=engine_mode,
+            workers=workers,
+            policy_min_length=policy_min_length,
+        )
+    # The session keeps one history key however often it rewrites the file.
+    if summary.recorded_at is None:
+        summary.recorded_at = summary_path.stat().st_mtime if summary_path.exists() else time.time()
+    summary.audited_password_count = stats.count
+    summary.audited_weak_count = stats.classifications["weak"]
+    summary.audit_distribution = stats.to_dict() if stats.count else {}
+    temp_path = summary_path.with_name(f"{summary_path.name}.tmp")
+    temp_path.write_text(json.dumps(asdict(summary), indent=2), encoding="utf-8")
+    os.replace(temp_path, summary_path)
+    return summary_path